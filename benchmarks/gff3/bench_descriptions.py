@@ -0,0 +1,140 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the functional annotation cost per feature, with and without the description classifier.
+
+The "before" run uses the previous implementation of `FunctionalAnnotations.product_is_informative()`,
+which compiled its regular expressions on every call.
+
+Typical usage example::
+    $ python benchmarks/gff3/bench_descriptions.py --num_genes 100000
+
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Callable, List, Optional
+
+from Bio.SeqFeature import SeqFeature, SimpleLocation
+
+from ensembl.io.genomio.gff3.extract_annotation import FunctionalAnnotations
+
+# Typical mix of product names: most are repeated many times in a genome
+_PRODUCTS = [
+    "hypothetical protein",
+    "conserved hypothetical protein",
+    "hypothetical protein, conserved",
+    "uncharacterized protein",
+    "putative protein",
+    "protein of unknown function",
+    "ABC transporter",
+    "Kinase",
+    "serine/threonine protein kinase, putative",
+    "60S ribosomal protein L10",
+]
+
+
+def _legacy_product_is_informative(product: str, feat_id: Optional[str] = None) -> bool:
+    """Previous implementation of `FunctionalAnnotations.product_is_informative()`."""
+    non_informative_words = [
+        "hypothetical",
+        "putative",
+        "uncharacterized",
+        "unspecified",
+        "unknown",
+        r"(of )?unknown function",
+        "conserved",
+        "predicted",
+        "fragment",
+        "product",
+        "function",
+        "protein",
+        "gene",
+        "RNA",
+        r"variant( \d+)?",
+    ]
+    non_informative_re = re.compile(r"|".join(non_informative_words), re.IGNORECASE)
+    if feat_id is not None:
+        feat_id_re = re.compile(feat_id, re.IGNORECASE)
+        product = re.sub(feat_id_re, "", product)
+    punct_re = re.compile(r"[,;: _()-]+")
+    product = re.sub(punct_re, " ", product)
+    product = re.sub(non_informative_re, " ", product)
+    empty_re = re.compile(r"^[ ]*$")
+    return not bool(empty_re.match(product))
+
+
+def make_features(num_genes: int, seed: int = 1) -> List[SeqFeature]:
+    """Returns the gene, transcript and translation features of a synthetic genome, with products.
+
+    Args:
+        num_genes: Number of genes to create.
+        seed: Seed of the random generator.
+    """
+    rand = random.Random(seed)
+    features = []
+    for number in range(1, num_genes + 1):
+        location = SimpleLocation(number * 1000, number * 1000 + 900, strand=1)
+        product = rand.choice(_PRODUCTS)
+        for feat_type, feat_id in (
+            ("gene", f"GENE{number:06d}"),
+            ("mRNA", f"GENE{number:06d}_t1"),
+            ("CDS", f"PRO{number:06d}.1"),
+        ):
+            qualifiers = {"product": [product]}
+            if feat_type == "gene":
+                qualifiers = {"Name": [f"GENE{number:06d}"]}
+            features.append(SeqFeature(location, type=feat_type, id=feat_id, qualifiers=qualifiers))
+    return features
+
+
+def run(features: List[SeqFeature], classify: Callable[..., bool]) -> float:
+    """Returns the time in seconds to create the annotation of all the features.
+
+    Args:
+        features: Features to annotate.
+        classify: Implementation of `FunctionalAnnotations.product_is_informative()` to use.
+    """
+    original = FunctionalAnnotations.product_is_informative
+    FunctionalAnnotations.product_is_informative = staticmethod(classify)  # type: ignore[method-assign]
+    try:
+        annotations = FunctionalAnnotations()
+        start = time.perf_counter()
+        for feature in features:
+            annotations._generic_feature(feature)  # pylint: disable=protected-access
+        return time.perf_counter() - start
+    finally:
+        FunctionalAnnotations.product_is_informative = original  # type: ignore[method-assign]
+
+
+def main() -> None:
+    """Main script entry-point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_genes", type=int, default=100000, help="Number of synthetic genes")
+    args = parser.parse_args()
+
+    features = make_features(args.num_genes)
+    before = run(features, _legacy_product_is_informative)
+    after = run(features, FunctionalAnnotations.product_is_informative)
+    num_features = len(features)
+    print(f"Features annotated: {num_features}")
+    print(f"Before: {before:.2f} s ({1e6 * before / num_features:.2f} us per feature)")
+    print(f"After:  {after:.2f} s ({1e6 * after / num_features:.2f} us per feature)")
+    print(f"Speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
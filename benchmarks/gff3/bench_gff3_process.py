@@ -0,0 +1,243 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput and peak memory of each stage of `gff3_process`, on a synthetic GFF3 file.
+
+The stages are:
+ * merge: `GFFGeneMerger.merge()` of the split genes, to a file,
+ * simplify: `GFFSimplifier.simpler_gff3()` of the merged file, in memory,
+ * to_gff: `Records.to_gff()` of the simplified records,
+ * to_json: `FunctionalAnnotations.to_json()` of the functional annotation,
+ * stream: the `gff3_process --stream` path, i.e. merging and simplifying the input one seq_region at a
+   time with `stream_simpler_gff3()`.
+
+Each stage is timed first, then run again with `tracemalloc` to get its peak memory (Python allocations
+only), so the tracing does not slow down the timed run. The results are written as JSON, and can be
+compared to the results of another commit with `--baseline`.
+
+Typical usage example::
+    $ python -m benchmarks.gff3.bench_gff3_process --num_genes 100000 --output after.json \\
+        --baseline before.json
+
+"""
+
+import argparse
+from datetime import datetime, timezone
+import json
+import logging
+from pathlib import Path
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from ensembl.io.genomio.gff3.gene_merger import GFFGeneMerger
+from ensembl.io.genomio.gff3.simplifier import GFFSimplifier
+from ensembl.io.genomio.gff3.streaming import stream_simpler_gff3
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+
+from .synthetic_gff3 import GeneMix, write_genome_json, write_synthetic_gff3
+
+# Stages slower than the baseline by more than this ratio are reported as regressions
+_REGRESSION_RATIO = 1.1
+
+
+def _get_commit() -> Optional[str]:
+    """Returns the current git commit of the repository, if available."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            cwd=Path(__file__).parent,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def measure_stage(name: str, run_stage: Callable[[], Any], num_features: int, memory: bool) -> Dict[str, Any]:
+    """Returns the time, throughput and peak memory of one stage.
+
+    Args:
+        name: Name of the stage.
+        run_stage: Function that runs the stage, and can be run more than once.
+        num_features: Number of input features, to compute the throughput.
+        memory: Run the stage a second time to measure its peak memory.
+
+    """
+    start = time.perf_counter()
+    run_stage()
+    seconds = time.perf_counter() - start
+    result: Dict[str, Any] = {
+        "name": name,
+        "seconds": round(seconds, 3),
+        "features_per_second": round(num_features / seconds) if seconds > 0 else None,
+        "peak_memory_mb": None,
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            run_stage()
+            result["peak_memory_mb"] = round(tracemalloc.get_traced_memory()[1] / 1024**2, 1)
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmark(
+    work_dir: Path, in_gff: Path, genome: Path, num_features: int, *, workers: int = 1, memory: bool = True
+) -> List[Dict[str, Any]]:
+    """Runs each stage of `gff3_process` on a GFF3 file, and returns their measures.
+
+    Args:
+        work_dir: Folder where the output files are written.
+        in_gff: Input GFF3 file.
+        genome: Genome JSON file.
+        num_features: Number of features of the input GFF3 file.
+        workers: Number of processes used by the streaming stage.
+        memory: Measure the peak memory of each stage.
+
+    """
+    merged_gff = work_dir / "merged.gff3"
+    simplified: Dict[str, GFFSimplifier] = {}
+
+    def _new_simplifier() -> GFFSimplifier:
+        # The failed types are shared by all instances
+        GFFSimplifier.fail_types = {}
+        return GFFSimplifier(genome, make_missing_stable_ids=True)
+
+    def _simplify() -> None:
+        simplified["last"] = _new_simplifier()
+        simplified["last"].simpler_gff3(merged_gff)
+
+    def _stream() -> None:
+        simplifier = _new_simplifier()
+        with open_gz_file(in_gff) as in_gff_fh:
+            lines = GFFGeneMerger().merge_lines(in_gff_fh)
+            stream_simpler_gff3(simplifier, lines, work_dir / "stream.gff3", workers=workers)
+        simplifier.annotations.to_json(work_dir / "stream.json")
+
+    stages: List[Dict[str, Any]] = [
+        measure_stage("merge", lambda: GFFGeneMerger().merge(in_gff, merged_gff), num_features, memory),
+        measure_stage("simplify", _simplify, num_features, memory),
+        measure_stage(
+            "to_gff", lambda: simplified["last"].records.to_gff(work_dir / "out.gff3"), num_features, memory
+        ),
+        measure_stage(
+            "to_json",
+            lambda: simplified["last"].annotations.to_json(work_dir / "out.json"),
+            num_features,
+            memory,
+        ),
+        measure_stage("stream", _stream, num_features, memory),
+    ]
+    return stages
+
+
+def compare_results(results: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Returns a report line for each stage, comparing its time and peak memory to a baseline.
+
+    Args:
+        results: Results of this run.
+        baseline: Results of a previous run (e.g. from another commit), with the same parameters.
+
+    """
+    if results["parameters"] != baseline["parameters"]:
+        logging.warning("The baseline was run with different parameters, the comparison may not be valid")
+    baseline_stages = {stage["name"]: stage for stage in baseline["stages"]}
+    report = []
+    for stage in results["stages"]:
+        old = baseline_stages.get(stage["name"])
+        if old is None:
+            report.append(f"{stage['name']}: not in baseline")
+            continue
+        ratio = stage["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+        line = f"{stage['name']}: {old['seconds']:.2f} s -> {stage['seconds']:.2f} s ({ratio:.2f}x)"
+        if stage["peak_memory_mb"] is not None and old["peak_memory_mb"] is not None:
+            line += f", {old['peak_memory_mb']} MB -> {stage['peak_memory_mb']} MB"
+        if ratio > _REGRESSION_RATIO:
+            line += "  REGRESSION"
+        report.append(line)
+    return report
+
+
+def main() -> None:
+    """Main script entry-point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_genes", type=int, default=100000, help="Number of synthetic genes")
+    parser.add_argument("--num_seq_regions", type=int, default=10, help="Number of seq_regions")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the random generator")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes for the stream stage")
+    parser.add_argument("--no_memory", action="store_true", help="Do not measure the peak memory")
+    parser.add_argument("--output", type=Path, help="Output JSON file (default: gff3_process_<commit>.json)")
+    parser.add_argument("--baseline", type=Path, help="Results JSON file of a previous run to compare with")
+    parser.add_argument("--work_dir", type=Path, help="Folder for the temporary files (default: a temp dir)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+
+    commit = _get_commit()
+    gene_mix = GeneMix()
+    with tempfile.TemporaryDirectory(dir=args.work_dir) as tmp_dir:
+        work_dir = Path(tmp_dir)
+        in_gff = work_dir / "synthetic.gff3"
+        genome = work_dir / "genome.json"
+        num_features = write_synthetic_gff3(
+            in_gff, args.num_genes, num_seq_regions=args.num_seq_regions, gene_mix=gene_mix, seed=args.seed
+        )
+        write_genome_json(genome)
+        logging.info(f"Benchmark on {num_features} features")
+        # The synthetic genes trigger many expected warnings in the simplifier
+        logging.disable(logging.WARNING)
+        try:
+            stages = run_benchmark(
+                work_dir, in_gff, genome, num_features, workers=args.workers, memory=not args.no_memory
+            )
+        finally:
+            logging.disable(logging.NOTSET)
+
+    results = {
+        "benchmark": "gff3_process",
+        "commit": commit,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "parameters": {
+            "num_genes": args.num_genes,
+            "num_seq_regions": args.num_seq_regions,
+            "seed": args.seed,
+            "workers": args.workers,
+            "gene_mix": vars(gene_mix),
+        },
+        "input_features": num_features,
+        "stages": stages,
+    }
+    output = args.output or Path(f"gff3_process_{commit or 'unknown'}.json")
+    output.write_text(json.dumps(results, indent=4) + "\n")
+    print(f"Results written to {output}")
+    for stage in stages:
+        print(
+            f"{stage['name']}: {stage['seconds']:.2f} s, {stage['features_per_second']} features/s, "
+            f"peak memory {stage['peak_memory_mb']} MB"
+        )
+    if args.baseline:
+        print(f"Comparison with {args.baseline}:")
+        for line in compare_results(results, json.loads(args.baseline.read_text())):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Generator of synthetic GFF3 files in the INSDC/RefSeq style, to benchmark the GFF3 processing.
+
+The genes are spread over several seq_regions, one after the other, and each gene is one of:
+ * a protein coding gene, with one or two mRNAs, each with exons and CDSs,
+ * a lone CDS, without gene or mRNA parent,
+ * a gene split in several parts (with `part=` attributes) that need to be merged,
+ * a pseudogene with an mRNA and CDSs,
+ * a mobile genetic element (transposon).
+
+Typical usage example::
+    $ python -m benchmarks.gff3.synthetic_gff3 --num_genes 100000 --out_gff synthetic.gff3
+
+"""
+
+__all__ = [
+    "GeneMix",
+    "generate_gff3_lines",
+    "write_synthetic_gff3",
+    "write_genome_json",
+]
+
+import argparse
+from dataclasses import asdict, dataclass
+import json
+from os import PathLike
+from pathlib import Path
+import random
+from typing import Iterator, List
+
+_PRODUCTS = [
+    "hypothetical protein",
+    "conserved hypothetical protein",
+    "uncharacterized protein",
+    "ABC transporter",
+    "Kinase",
+    "serine/threonine protein kinase, putative",
+    "60S ribosomal protein L10",
+]
+_SOURCE = "RefSeq"
+_GENE_SPACING = 500
+
+
+@dataclass
+class GeneMix:
+    """Proportions of each kind of gene in the synthetic file (the rest are protein coding genes).
+
+    Attributes:
+        lone_cds: Proportion of CDSs without gene and mRNA parents.
+        split_genes: Proportion of genes split in several parts.
+        pseudogenes: Proportion of pseudogenes with CDSs.
+        mobile_elements: Proportion of mobile genetic elements.
+
+    """
+
+    lone_cds: float = 0.02
+    split_genes: float = 0.02
+    pseudogenes: float = 0.05
+    mobile_elements: float = 0.01
+
+
+def _line(
+    seq_region: str, feat_type: str, start: int, end: int, *, strand: str, phase: str, attrs: str
+) -> str:
+    """Returns a GFF3 line."""
+    return "\t".join([seq_region, _SOURCE, feat_type, str(start), str(end), ".", strand, phase, attrs]) + "\n"
+
+
+def _gene_lines(
+    rand: random.Random, seq_region: str, start: int, number: int, *, gene_type: str, split: bool
+) -> List[str]:
+    """Returns the lines of a gene with mRNAs, exons and CDSs, and the end of the gene."""
+    strand = rand.choice("+-")
+    locus = f"BENCH_{number:07d}"
+    gene_id = f"gene-{locus}"
+    num_exons = rand.randint(1, 4)
+    exon_length = rand.randint(100, 600)
+    intron_length = rand.randint(50, 300)
+    exons = []
+    exon_start = start
+    for _ in range(num_exons):
+        exons.append((exon_start, exon_start + exon_length - 1))
+        exon_start += exon_length + intron_length
+    end = exons[-1][1]
+    biotype = "pseudogene" if gene_type == "pseudogene" else "protein_coding"
+    gene_attrs = f"ID={gene_id};Name={locus};gbkey=Gene;gene_biotype={biotype};locus_tag={locus}"
+
+    lines = []
+    if split and num_exons > 1:
+        # One gene line per exon, to be merged back into one gene
+        for part, (part_start, part_end) in enumerate(exons, 1):
+            part_attrs = f"{gene_attrs};part={part}/{num_exons};is_ordered=true"
+            lines.append(
+                _line(seq_region, gene_type, part_start, part_end, strand=strand, phase=".", attrs=part_attrs)
+            )
+    else:
+        lines.append(_line(seq_region, gene_type, start, end, strand=strand, phase=".", attrs=gene_attrs))
+
+    product = rand.choice(_PRODUCTS)
+    num_transcripts = 2 if rand.random() < 0.2 else 1
+    for transcript in range(1, num_transcripts + 1):
+        rna_id = f"rna-{locus}-{transcript}"
+        rna_attrs = f"ID={rna_id};Parent={gene_id};gbkey=mRNA;product={product}"
+        lines.append(_line(seq_region, "mRNA", start, end, strand=strand, phase=".", attrs=rna_attrs))
+        for exon_number, (exon_start, exon_end) in enumerate(exons, 1):
+            exon_attrs = f"ID=exon-{locus}-{transcript}-{exon_number};Parent={rna_id};gbkey=mRNA"
+            lines.append(
+                _line(seq_region, "exon", exon_start, exon_end, strand=strand, phase=".", attrs=exon_attrs)
+            )
+        protein_id = f"PROT{number:07d}.{transcript}"
+        cds_attrs = (
+            f"ID=cds-{protein_id};Parent={rna_id};Name={protein_id};gbkey=CDS;product={product};"
+            f"protein_id={protein_id}"
+        )
+        if gene_type == "pseudogene":
+            cds_attrs += ";pseudo=true"
+        phase = 0
+        for exon_start, exon_end in exons:
+            lines.append(
+                _line(
+                    seq_region, "CDS", exon_start, exon_end, strand=strand, phase=str(phase), attrs=cds_attrs
+                )
+            )
+            phase = (phase + exon_end - exon_start + 1) % 3
+    return lines
+
+
+def generate_gff3_lines(
+    num_genes: int, num_seq_regions: int = 10, gene_mix: GeneMix = GeneMix(), seed: int = 1
+) -> Iterator[str]:
+    """Yields the lines of a synthetic GFF3 file.
+
+    Args:
+        num_genes: Number of genes (including lone CDSs and mobile elements) to create.
+        num_seq_regions: Number of seq_regions the genes are spread over.
+        gene_mix: Proportions of each kind of gene.
+        seed: Seed of the random generator, so the same file is generated every time.
+
+    """
+    rand = random.Random(seed)
+    yield "##gff-version 3\n"
+    genes_per_region = max(1, -(-num_genes // num_seq_regions))
+    for number in range(1, num_genes + 1):
+        region_number = (number - 1) // genes_per_region + 1
+        seq_region = f"NC_{region_number:06d}.1"
+        if (number - 1) % genes_per_region == 0:
+            start = 1
+        draw = rand.random()
+        if draw < gene_mix.lone_cds:
+            length = rand.randint(300, 1500)
+            protein_id = f"PROT{number:07d}.1"
+            attrs = f"ID=cds-{protein_id};Name={protein_id};gbkey=CDS;product=Kinase;protein_id={protein_id}"
+            lines = [_line(seq_region, "CDS", start, start + length - 1, strand="+", phase="0", attrs=attrs)]
+            end = start + length - 1
+        elif draw < gene_mix.lone_cds + gene_mix.mobile_elements:
+            length = rand.randint(1000, 8000)
+            attrs = (
+                f"ID=id-BENCH_TE_{number:07d};gbkey=mobile_element;"
+                f"mobile_element_type=transposon:Tn{number}"
+            )
+            lines = [
+                _line(
+                    seq_region,
+                    "mobile_genetic_element",
+                    start,
+                    start + length - 1,
+                    strand="+",
+                    phase=".",
+                    attrs=attrs,
+                )
+            ]
+            end = start + length - 1
+        else:
+            draw -= gene_mix.lone_cds + gene_mix.mobile_elements
+            gene_type = "pseudogene" if draw < gene_mix.pseudogenes else "gene"
+            split = gene_mix.pseudogenes <= draw < gene_mix.pseudogenes + gene_mix.split_genes
+            lines = _gene_lines(rand, seq_region, start, number, gene_type=gene_type, split=split)
+            end = max(int(line.split("\t")[4]) for line in lines)
+        yield from lines
+        start = end + _GENE_SPACING
+
+
+def write_synthetic_gff3(out_path: PathLike, num_genes: int, **kwargs) -> int:
+    """Writes a synthetic GFF3 file, and returns its number of features (i.e. lines that are not comments).
+
+    Args:
+        out_path: Path to the GFF3 file to write.
+        num_genes: Number of genes to create.
+        **kwargs: Other arguments for `generate_gff3_lines()`.
+
+    """
+    num_features = 0
+    with Path(out_path).open("w") as out_fh:
+        for line in generate_gff3_lines(num_genes, **kwargs):
+            if not line.startswith("#"):
+                num_features += 1
+            out_fh.write(line)
+    return num_features
+
+
+def write_genome_json(out_path: PathLike, organism_abbrev: str = "bench") -> None:
+    """Writes a minimal genome JSON file, as needed by the GFF3 simplifier.
+
+    Args:
+        out_path: Path to the genome JSON file to write.
+        organism_abbrev: Organism abbreviation, used as the prefix of the generated stable IDs.
+
+    """
+    Path(out_path).write_text(json.dumps({"BRC4": {"organism_abbrev": organism_abbrev}}))
+
+
+def main() -> None:
+    """Main script entry-point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_genes", type=int, default=100000, help="Number of synthetic genes")
+    parser.add_argument("--num_seq_regions", type=int, default=10, help="Number of seq_regions")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the random generator")
+    for field, default in asdict(GeneMix()).items():
+        parser.add_argument(f"--{field}", type=float, default=default, help=f"Proportion of {field}")
+    parser.add_argument("--out_gff", type=Path, required=True, help="Output GFF3 file")
+    args = parser.parse_args()
+
+    gene_mix = GeneMix(**{field: getattr(args, field) for field in asdict(GeneMix())})
+    num_features = write_synthetic_gff3(
+        args.out_gff, args.num_genes, num_seq_regions=args.num_seq_regions, gene_mix=gene_mix, seed=args.seed
+    )
+    print(f"{num_features} features written to {args.out_gff}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scaling of the ID and length comparisons of `manifest_check_integrity`, up to 10^6 IDs.
+
+Each comparison is timed on two sets of `n` IDs that share half of their IDs, with a different length for
+half of the shared IDs, for each size `n`. The time per ID should stay about the same as `n` grows, since
+the comparisons are set-based: a growth of the time per ID by more than a given factor between the
+smallest and the largest size is reported as non-linear scaling.
+
+Typical usage example::
+    $ python -m benchmarks.manifest.bench_integrity_checks --sizes 10000 100000 1000000 --output checks.json
+
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+from ensembl.io.genomio.manifest.check_integrity import IntegrityTool
+
+# Growth of the time per ID, between the smallest and largest sizes, above which the scaling is reported
+_MAX_GROWTH = 3.0
+
+
+def _time(run: Callable[[], Any]) -> float:
+    """Returns the number of seconds taken by a function."""
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def measure_checks(integrity: IntegrityTool, size: int) -> Dict[str, float]:
+    """Returns the number of seconds taken by each comparison of two sets of `size` IDs.
+
+    Args:
+        integrity: Integrity tool whose comparisons are timed (its errors are reset after each one).
+        size: Number of IDs in each set.
+
+    """
+    half = size // 2
+    ids1 = {f"id{i}": 100 for i in range(size)}
+    # Half the IDs are shared, and half of those have a different length
+    ids2 = {f"id{i}": 100 if i % 2 else 200 for i in range(half, size + half)}
+    checks = {
+        "check_ids": lambda: integrity.check_ids(ids1, ids2, "bench"),
+        "check_lengths": lambda: integrity.check_lengths(ids1, ids2, "bench"),
+        "compare_seqs": lambda: integrity._compare_seqs(ids1, ids2),  # pylint: disable=protected-access
+    }
+    seconds = {}
+    for name, run_check in checks.items():
+        seconds[name] = _time(run_check)
+        integrity.errors = []
+    return seconds
+
+
+def run_benchmark(sizes: List[int]) -> Dict[str, Any]:
+    """Returns the time per ID of each comparison for each size, and the growth of that time.
+
+    Args:
+        sizes: Numbers of IDs to compare, in increasing order.
+
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest = Path(tmp_dir) / "manifest.json"
+        manifest.write_text("{}")
+        integrity = IntegrityTool(manifest)
+    results: Dict[str, Any] = {"sizes": sizes, "checks": {}}
+    for size in sizes:
+        for name, seconds in measure_checks(integrity, size).items():
+            check = results["checks"].setdefault(name, {"seconds": [], "microseconds_per_id": []})
+            check["seconds"].append(round(seconds, 3))
+            check["microseconds_per_id"].append(round(seconds / size * 1e6, 3))
+    for check in results["checks"].values():
+        per_id = check["microseconds_per_id"]
+        check["growth"] = round(per_id[-1] / per_id[0], 2) if per_id[0] else None
+    return results
+
+
+def main() -> None:
+    """Main script entry-point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000], help="Numbers of IDs to compare"
+    )
+    parser.add_argument("--output", type=Path, help="Output JSON file")
+    args = parser.parse_args()
+
+    # Each comparison logs its differences, which are expected here
+    logging.disable(logging.WARNING)
+    try:
+        results = run_benchmark(sorted(args.sizes))
+    finally:
+        logging.disable(logging.NOTSET)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"Results written to {args.output}")
+    for name, check in results["checks"].items():
+        times = ", ".join(
+            f"{size}: {seconds:.2f} s" for size, seconds in zip(results["sizes"], check["seconds"])
+        )
+        line = f"{name}: {times} (time per ID x{check['growth']})"
+        if check["growth"] is not None and check["growth"] > _MAX_GROWTH:
+            line += "  NON-LINEAR"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
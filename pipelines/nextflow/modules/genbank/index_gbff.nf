@@ -13,18 +13,18 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 
-process UNPACK_GFF3 {
-    label 'default_retry'
+process INDEX_GBFF {
+    tag "${meta.accession}"
+    label 'adaptive'
 
     input:
-        tuple val(meta), path(compressed_gff), path(protein_faa), path(gbff)
-        val extension
+        tuple val(meta), path(gbff_file)
 
     output:
-        tuple val(meta), path("*.${extension}")
-    
+        tuple val(meta), path("gbff_index.json"), emit: gbff_index
+
     shell:
         '''
-        extract_file --src_file !{compressed_gff} --dst_dir "."
+        genbank_index --gbff_file !{gbff_file} --dst_file gbff_index.json
         '''
 }
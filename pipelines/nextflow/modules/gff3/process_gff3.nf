@@ -28,9 +28,10 @@ process PROCESS_GFF3 {
     shell:
         out_func = "functional_annotation.json"
         out_gff = "gene_models.gff3"
+        stream = params.gff3_stream ? "--stream --workers ${task.cpus}" : ''
         '''
         gff3_process --genome_data !{genome} --in_gff_path !{gff3} --out_gff_path !{out_gff} \
-            --out_func_path !{out_func} -v \
+            --out_func_path !{out_func} !{stream} -v \
             --log_file gff3_process.log
         
         schemas_json_validate --json_file !{out_func} --json_schema functional_annotation
@@ -28,6 +28,6 @@ process CHECK_INTEGRITY {
     shell:
         brc_mode = params.brc_mode ? '--brc_mode' : ''
         '''
-        manifest_check_integrity --manifest_file ./manifest.json !{brc_mode}
+        manifest_check_integrity --manifest_file ./manifest.json !{brc_mode} --workers !{task.cpus}
         '''
 }
@@ -19,7 +19,7 @@
 // Import modules/subworkflows
 include { CHECK_JSON_SCHEMA as CHECK_JSON_SCHEMA_GENOME } from '../../modules/schema/check_json_schema.nf'
 include { DOWNLOAD_ASM_DATA } from '../../modules/download/download_asm_data.nf'
-include { UNPACK_GFF3 } from '../../modules/gff3/unpack_gff3.nf'
+include { INDEX_GBFF } from '../../modules/genbank/index_gbff.nf'
 include { PROCESS_GFF3 } from '../../modules/gff3/process_gff3.nf'
 include { GFF3_VALIDATION } from '../../modules/gff3/gff3_validation.nf'
 include { PROCESS_SEQ_REGION } from '../../modules/seq_region/process_seq_region.nf'
@@ -46,14 +46,21 @@ workflow GENOME_PREPARE {
 
         // Download genome data files. Files may or may not include gene models (GFF3) and/or peptides.
         DOWNLOAD_ASM_DATA(checked_genome)
-        download_min = DOWNLOAD_ASM_DATA.out.min_set
-        download_opt = DOWNLOAD_ASM_DATA.out.opt_set
+        downloaded_min = DOWNLOAD_ASM_DATA.out.min_set
+        downloaded_opt = DOWNLOAD_ASM_DATA.out.opt_set
 
-        // Decompress GFF3 file, output with accession in tuple
-        unpacked_gff = UNPACK_GFF3(download_opt, 'gff')
+        // The GFF3 file is processed as it was downloaded (gzip compressed), output with accession in tuple
+        gff = downloaded_opt.map { meta, gff, protein_faa, gbff -> tuple(meta, gff) }
+
+        // Parse the GBFF file only once: the next steps use its index instead
+        gbff_index = INDEX_GBFF(downloaded_min.map { meta, report, fna, gbff -> tuple(meta, gbff) }).gbff_index
+        download_min = downloaded_min.join(gbff_index, failOnDuplicate: true, failOnMismatch: true)
+            .map { meta, report, fna, gbff, index -> tuple(meta, report, fna, index) }
+        download_opt = downloaded_opt.join(gbff_index, failOnDuplicate: true)
+            .map { meta, gff, protein_faa, gbff, index -> tuple(meta, gff, protein_faa, index) }
 
         // Process the GB and GFF3 files into a cleaned GFF3 and a functional_annotation files
-        genome_gff_files = checked_genome.join(unpacked_gff, failOnDuplicate: true)
+        genome_gff_files = checked_genome.join(gff, failOnDuplicate: true)
         PROCESS_GFF3(genome_gff_files)
         functional_annotation = PROCESS_GFF3.out.functional_annotation
         new_gene_models = PROCESS_GFF3.out.gene_models
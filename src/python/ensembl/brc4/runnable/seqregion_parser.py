@@ -15,12 +15,9 @@
 # limitations under the License.
 
 from pathlib import Path
-import re
-import gzip
-import csv
-from typing import Any, Dict, Tuple
+from typing import Any, Dict
 
-from ensembl.io.genomio.utils.archive_utils import open_gz_file
+from ensembl.io.genomio.assembly.report import AssemblyReport
 
 
 class SeqregionParser:
@@ -59,55 +56,19 @@ class SeqregionParser:
         """
         if accession.startswith("GCF"):
             use_refseq = True
-        # Get the report in a CSV format, easier to manipulate
-        report_csv, metadata = self.report_to_csv(report_path)
-
-        # Feed the csv string to the CSV reader
-        reader = csv.DictReader(report_csv.splitlines(), delimiter="\t", quoting=csv.QUOTE_NONE)
-
-        # Metadata
-        assembly_level = "contig"
-        if "Assembly level" in metadata:
-            assembly_level = metadata["Assembly level"].lower()
+        report = AssemblyReport(report_path)
 
         # Create the seq_regions
         seq_regions = {}
-        for row in reader:
+        for row in report:
+            # The metadata of the report head is read before its first row
+            assembly_level = report.metadata.get("Assembly level", "contig").lower()
             seq_region = self.make_seq_region(row, assembly_level, use_refseq)
             name = seq_region["name"]
             seq_regions[name] = seq_region
 
         return seq_regions
 
-    def report_to_csv(self, report_path: Path) -> Tuple[str, dict]:
-        """Load an assembly report as a csv string.
-
-        Args:
-            report_path: Path to the INSDC seq_region report.
-        Returns:
-            The csv as a string, and the head metadata as a dict.
-        """
-
-        with open_gz_file(report_path) as report:
-            data = ""
-            metadata = {}
-            last_head = ""
-            for line in report:
-                # Ignore header
-                if line.startswith("#"):
-                    # Get metadata values if possible
-                    match = re.search("# (.+?): (.+?)$", line)
-                    if match:
-                        metadata[match.group(1)] = match.group(2)
-                    last_head = line
-                    continue
-                else:
-                    if last_head:
-                        data += last_head[2:].strip() + "\n"
-                        last_head = ""
-                    data += line
-            return data, metadata
-
     def make_seq_region(self, row: Dict[str, str], assembly_level: str, use_refseq: bool) -> Dict[str, Any]:
         """From a row of the report, create one seq_region dict.
 
@@ -14,4 +14,6 @@
 # limitations under the License.
 """Assembly preparation module."""
 
+from .datasets import *
 from .download import *
+from .report import *
@@ -0,0 +1,205 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local cache of NCBI datasets genome summaries, fetched in batches with the `datasets` command line tool."""
+
+__all__ = ["DEFAULT_CACHE_TTL_DAYS", "DatasetsError", "DatasetsSummaries"]
+
+import json
+import logging
+import os
+from os import PathLike
+from pathlib import Path
+import subprocess
+import time
+from typing import Any, Dict, List, Optional
+
+from ensembl.utils.argparse import ArgumentParser
+from ensembl.utils.logging import init_logging_with_args
+
+
+# Number of days a cached summary is used before fetching it again
+DEFAULT_CACHE_TTL_DAYS = 7.0
+# Maximum number of accessions requested in one `datasets` call
+BATCH_SIZE = 500
+
+
+class DatasetsError(Exception):
+    """When the summaries could not be retrieved with `datasets`."""
+
+
+class DatasetsSummaries:
+    """Genome summaries from NCBI datasets, cached on disk by accession.
+
+    Each summary is stored as `<accession>.json`, in the same format as the output of
+    `datasets summary genome accession <accession>`, so the cached files can be used in place of it.
+    Accessions without a summary are cached as well (with no reports), so they are not requested again
+    before the cache expires.
+
+    Attributes:
+        datasets_bin: Path to the `datasets` executable.
+        cache_dir: Folder where the summaries are cached (no cache if `None`).
+        ttl_days: Number of days a cached summary is used before fetching it again.
+
+    """
+
+    def __init__(
+        self,
+        datasets_bin: str = "datasets",
+        cache_dir: Optional[PathLike] = None,
+        ttl_days: float = DEFAULT_CACHE_TTL_DAYS,
+    ) -> None:
+        self.datasets_bin = datasets_bin
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl_days = ttl_days
+
+    def get_cache_path(self, accession: str) -> Optional[Path]:
+        """Returns the path to the cached summary of an accession, or `None` if there is no cache.
+
+        Args:
+            accession: Genome assembly accession.
+        """
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{accession}.json"
+
+    def is_cached(self, accession: str) -> bool:
+        """Returns True if the summary of an accession is cached and has not expired.
+
+        Args:
+            accession: Genome assembly accession.
+        """
+        cache_path = self.get_cache_path(accession)
+        if cache_path is None or not cache_path.is_file():
+            return False
+        age_days = (time.time() - cache_path.stat().st_mtime) / (24 * 3600)
+        return age_days < self.ttl_days
+
+    def get_summary(self, accession: str) -> Dict[str, Any]:
+        """Returns the datasets summary of one accession.
+
+        Args:
+            accession: Genome assembly accession.
+
+        Raises:
+            DatasetsError: If `datasets` failed.
+        """
+        return self.get_summaries([accession])[accession]
+
+    def get_summaries(self, accessions: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Returns the datasets summary of each accession.
+
+        The accessions that are not cached are all requested in as few `datasets` calls as possible.
+
+        Args:
+            accessions: Genome assembly accessions.
+
+        Raises:
+            DatasetsError: If `datasets` failed.
+        """
+        summaries: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+        for accession in dict.fromkeys(accessions):
+            if self.is_cached(accession):
+                with self.get_cache_path(accession).open("r") as cache_fh:  # type: ignore[union-attr]
+                    summaries[accession] = json.load(cache_fh)
+            else:
+                to_fetch.append(accession)
+        for start in range(0, len(to_fetch), BATCH_SIZE):
+            batch = to_fetch[start : start + BATCH_SIZE]
+            for accession, summary in self._fetch_summaries(batch).items():
+                summaries[accession] = summary
+                self._write_cache(accession, summary)
+        return {accession: summaries[accession] for accession in accessions}
+
+    def _fetch_summaries(self, accessions: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Returns the summary of each accession, from one `datasets` call.
+
+        Args:
+            accessions: Genome assembly accessions.
+
+        Raises:
+            DatasetsError: If `datasets` failed.
+        """
+        logging.info(f"Fetching {len(accessions)} genome summaries with {self.datasets_bin}")
+        command = [self.datasets_bin, "summary", "genome", "accession", *accessions]
+        try:
+            result_out = subprocess.run(command, stdout=subprocess.PIPE, check=True)
+        except (OSError, subprocess.CalledProcessError) as err:
+            raise DatasetsError(f"Could not get the genome summaries from {self.datasets_bin}") from err
+        result = json.loads(result_out.stdout)
+        # Split the reports by accession, the unversioned accessions matching any version
+        reports: Dict[str, List[Dict[str, Any]]] = {accession: [] for accession in accessions}
+        for report in result.get("reports", []):
+            report_accession = report.get("accession", "")
+            for accession in (report_accession, report_accession.split(".")[0]):
+                if accession in reports:
+                    reports[accession].append(report)
+                    break
+        return {
+            accession: {"reports": acc_reports, "total_count": len(acc_reports)}
+            for accession, acc_reports in reports.items()
+        }
+
+    def _write_cache(self, accession: str, summary: Dict[str, Any]) -> None:
+        """Stores the summary of an accession in the cache, if there is one.
+
+        Args:
+            accession: Genome assembly accession.
+            summary: Datasets summary of the accession.
+        """
+        cache_path = self.get_cache_path(accession)
+        if cache_path is None:
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partial summary
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w") as cache_fh:
+            json.dump(summary, cache_fh, indent=2)
+        tmp_path.replace(cache_path)
+
+
+def main() -> None:
+    """Main script entry-point."""
+    parser = ArgumentParser(
+        description="Fetch the NCBI datasets genome summaries of several accessions into a local cache."
+    )
+    accessions = parser.add_mutually_exclusive_group(required=True)
+    accessions.add_argument("--accessions", nargs="+", help="Genome assembly accessions")
+    accessions.add_argument("--accessions_file", type=Path, help="File with one accession per line")
+    parser.add_argument_dst_path("--cache_dir", required=True, help="Folder where the summaries are cached")
+    parser.add_argument("--datasets_bin", default="datasets", help="Path to the datasets executable")
+    parser.add_argument(
+        "--ttl_days",
+        type=float,
+        default=DEFAULT_CACHE_TTL_DAYS,
+        help="Number of days a cached summary is used before fetching it again",
+    )
+    parser.add_log_arguments()
+    args = parser.parse_args()
+    init_logging_with_args(args)
+
+    if args.accessions_file:
+        with args.accessions_file.open("r") as accessions_fh:
+            accession_list = [line.strip() for line in accessions_fh if line.strip()]
+    else:
+        accession_list = args.accessions
+    summaries = DatasetsSummaries(args.datasets_bin, args.cache_dir, args.ttl_days)
+    for accession, summary in summaries.get_summaries(accession_list).items():
+        if not summary["reports"]:
+            logging.warning(f"No genome summary found for {accession}")
+
+
+if __name__ == "__main__":
+    main()
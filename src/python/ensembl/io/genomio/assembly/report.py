@@ -0,0 +1,108 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Streaming reader of INSDC/RefSeq assembly reports (`*_assembly_report.txt`)."""
+
+__all__ = ["AssemblyReport", "ReportRow", "REST_KEY"]
+
+from os import PathLike
+from pathlib import Path
+import re
+from typing import Any, Dict, Iterator, List
+
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+
+
+# One row of the report, keyed by the column names of the report header, e.g. "Sequence-Name"
+ReportRow = Dict[str, Any]
+
+# Key of the list of fields of a row that are beyond the columns of the report header
+REST_KEY = "_rest"
+
+_METADATA_RE = re.compile("# (.+?): (.+?)$")
+
+
+class AssemblyReport:
+    """Assembly report from INSDC/RefSeq, read one row at a time.
+
+    The report starts with comment lines (starting with `#`): the ones in the form `# key: value` are
+    collected as metadata, and the last one before the data gives the names of the columns. Each
+    following line is a tab-separated row, yielded as a dict keyed by the column names. As with
+    `csv.DictReader`, the columns missing from a short row are set to None, and the fields of a long row
+    beyond the columns are listed under `REST_KEY`.
+
+    Only one row is held in memory at a time, so even reports of very fragmented assemblies are read in
+    linear time and constant memory::
+
+        report = AssemblyReport(report_path)
+        for row in report:
+            print(row["Sequence-Name"], report.metadata["Assembly level"])
+
+    Attributes:
+        report_path: Path to the report file (can be gzipped).
+        metadata: Metadata from the report head, filled before the first row is yielded.
+        columns: Names of the columns of the rows, filled before the first row is yielded.
+
+    """
+
+    def __init__(self, report_path: PathLike) -> None:
+        self.report_path = Path(report_path)
+        self.metadata: Dict[str, str] = {}
+        self.columns: List[str] = []
+
+    def __iter__(self) -> Iterator[ReportRow]:
+        """Yields the rows of the report, and collects its metadata on the way."""
+        self.metadata = {}
+        self.columns = []
+        last_head = ""
+        with open_gz_file(self.report_path) as report:
+            for line in report:
+                if line.startswith("#"):
+                    self._add_metadata(line)
+                    last_head = line
+                    continue
+                if last_head:
+                    self.columns = last_head[2:].strip().split("\t")
+                    last_head = ""
+                line = line.rstrip("\r\n")
+                if line:
+                    yield self._get_row(line)
+
+    def read_metadata(self) -> Dict[str, str]:
+        """Returns the metadata from the report head, without reading the rows."""
+        self.metadata = {}
+        with open_gz_file(self.report_path) as report:
+            for line in report:
+                if not line.startswith("#"):
+                    break
+                self._add_metadata(line)
+        return self.metadata
+
+    def _get_row(self, line: str) -> ReportRow:
+        """Returns the row of a data line, with a value (None if missing) for each column."""
+        fields = line.split("\t")
+        num_columns = len(self.columns)
+        if len(fields) == num_columns:
+            return dict(zip(self.columns, fields))
+        row: ReportRow = dict.fromkeys(self.columns)
+        row.update(zip(self.columns, fields))
+        if len(fields) > num_columns:
+            row[REST_KEY] = fields[num_columns:]
+        return row
+
+    def _add_metadata(self, line: str) -> None:
+        """Adds the metadata of a comment line of the report head, if it is in the form `# key: value`."""
+        match = _METADATA_RE.search(line)
+        if match:
+            self.metadata[match.group(1)] = match.group(2)
@@ -15,3 +15,4 @@
 """Fasta files processing module."""
 
 from .process import *
+from .scan import *
@@ -12,23 +12,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Takes a FASTA file (DNA or peptide), cleans it up and optionally excludes some IDs."""
+"""Takes a FASTA file (DNA or peptide), cleans it up and optionally excludes some IDs.
 
-__all__ = ["FastaParserError", "get_peptides_to_exclude", "prep_fasta_data"]
+The records are streamed from the input to the output file: the header and sequence lines of the records
+kept are copied unchanged, in bulk, so the memory used does not depend on the size of the file.
+"""
+
+__all__ = ["FastaParserError", "filter_fasta", "get_peptides_to_exclude", "prep_fasta_data"]
 
 import logging
 from pathlib import Path
 from os import PathLike
-from typing import List, Optional, Set
-
-from Bio import SeqIO
+from typing import IO, List, Optional, Set, Tuple
 
-from ensembl.io.genomio.utils.archive_utils import open_gz_file
+from ensembl.io.genomio.genbank.index import load_gbff_index
+from ensembl.io.genomio.utils.archive_utils import open_gz_file, open_gz_output
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
 
 exclude_seq_regions: List[str] = []
+_COPY_CHUNK_SIZE = 1024 * 1024
 
 
 class FastaParserError(Exception):
@@ -40,32 +44,113 @@ def get_peptides_to_exclude(genbank_path: PathLike, seqr_to_exclude: Set[str]) -
     Extract peptide IDs from a genbank file that are in a given list of seq regions
     """
     peptides_to_exclude: Set[str] = set()
-    with open_gz_file(genbank_path) as in_genbank:
-        for record in SeqIO.parse(in_genbank, "genbank"):
-            if record.id in seqr_to_exclude:
-                logging.info(f"Skip sequence {record.id}")
-                for feat in record.features:
-                    if feat.type == "CDS":
-                        if "protein_id" in feat.qualifiers:
-                            feat_id = feat.qualifiers["protein_id"]
-                            peptides_to_exclude.add(feat_id[0])
-                        else:
-                            raise FastaParserError(f"Peptide without peptide ID ${feat}")
+    for record in load_gbff_index(genbank_path):
+        if record["id"] in seqr_to_exclude:
+            logging.info(f"Skip sequence {record['id']}")
+            if record.get("cds_without_protein_id"):
+                raise FastaParserError(f"Peptide without peptide ID in sequence {record['id']}")
+            peptides_to_exclude.update(record.get("protein_ids", []))
     return peptides_to_exclude
 
 
+def _find_header(chunk: bytes, pos: int, line_start: bool) -> int:
+    """Returns the position of the next FASTA header line of a chunk from `pos`, or -1 if there is none.
+
+    Args:
+        chunk: Chunk of a FASTA file.
+        pos: Position where to start the search.
+        line_start: True if `pos` is at the start of a line.
+
+    """
+    # Looking for ">" alone is much faster than for "\n>", as sequence lines are short
+    header_pos = chunk.find(b">", pos)
+    while header_pos != -1:
+        if header_pos > pos:
+            if chunk[header_pos - 1 : header_pos] == b"\n":
+                return header_pos
+        elif line_start:
+            return header_pos
+        header_pos = chunk.find(b">", header_pos + 1)
+    return -1
+
+
+def filter_fasta(
+    in_fasta: IO[bytes], out_fasta: IO[bytes], to_exclude: Set[str], chunk_size: int = _COPY_CHUNK_SIZE
+) -> Tuple[int, int]:
+    """Copies the FASTA records whose ID is not excluded, with their lines unchanged.
+
+    The file is read in large chunks, and only the header lines are looked at: the sequence lines in
+    between are copied or skipped in bulk. The ID of a record is the first word of its header, as in
+    Biopython. Any line before the first header is dropped.
+
+    Args:
+        in_fasta: Input FASTA file open in binary mode.
+        out_fasta: Output file open in binary mode.
+        to_exclude: IDs of the records to skip.
+        chunk_size: Number of bytes to read at once.
+
+    Returns:
+        The number of records copied, and the number of records skipped.
+
+    """
+    num_records = {True: 0, False: 0}
+    keep = False
+
+    def _start_record(header: bytes) -> bool:
+        words = header[1:].split(None, 1)
+        record_id = words[0].decode() if words else ""
+        keep_record = record_id not in to_exclude
+        num_records[keep_record] += 1
+        if keep_record:
+            out_fasta.write(header)
+        else:
+            logging.info(f"Skip record {record_id}")
+        return keep_record
+
+    # Start of a header line that was cut by the end of the previous chunk
+    pending = b""
+    line_start = True
+    for chunk in iter(lambda: in_fasta.read(chunk_size), b""):
+        if pending:
+            chunk = pending + chunk
+            pending = b""
+        pos = 0
+        header_pos = _find_header(chunk, pos, line_start)
+        while header_pos != -1:
+            if keep:
+                out_fasta.write(chunk[pos:header_pos])
+            header_end = chunk.find(b"\n", header_pos) + 1
+            if not header_end:
+                pending = chunk[header_pos:]
+                break
+            keep = _start_record(chunk[header_pos:header_end])
+            pos = header_end
+            header_pos = _find_header(chunk, pos, True)
+        else:
+            if keep:
+                out_fasta.write(chunk[pos:])
+        # A pending header is put back at the start of the next chunk
+        line_start = bool(pending) or chunk.endswith(b"\n")
+    if pending:
+        # Last header, without end of line
+        _start_record(pending)
+    return num_records[True], num_records[False]
+
+
 def prep_fasta_data(
     fasta_infile: PathLike,
     genbank_infile: Optional[PathLike],
     fasta_outfile: PathLike,
     peptide_mode: bool = False,
+    compress_threads: int = 1,
 ) -> None:
     """
     Args:
         fasta_file: Input FASTA file - DNA / Protein
-        genbank_infile: Input GenBank GBFF file (Optional)
-        fasta_outfile: Output FASTA sequence file.
+        genbank_infile: Input GenBank GBFF file, or its index created with `genbank_index` (Optional)
+        fasta_outfile: Output FASTA sequence file, compressed with gzip if its name ends with `.gz`.
         peptide_mode: Process proteins instead of DNA
+        compress_threads: Number of threads used to compress the output (with `pigz` if it is installed).
     """
     file_path = Path(fasta_infile)
 
@@ -79,26 +164,29 @@ def prep_fasta_data(
         to_exclude = seqr_to_exclude
 
     # Copy and filter
-    records = []
-
-    # Final path
-    with open_gz_file(file_path) as in_fasta:
-        for record in SeqIO.parse(in_fasta, "fasta"):
-            if record.id in to_exclude:
-                logging.info(f"Skip record ${record.id}")
-            else:
-                records.append(record)
-    with Path(fasta_outfile).open("w") as out_fasta:
-        SeqIO.write(records, out_fasta, "fasta")
+    with open_gz_file(file_path, "rb") as in_fasta:
+        with open_gz_output(fasta_outfile, "wb", threads=compress_threads) as out_fasta:
+            num_kept, num_skipped = filter_fasta(in_fasta, out_fasta, to_exclude)
+    logging.info(f"{num_kept} records written to {fasta_outfile}, {num_skipped} skipped")
 
 
 def main() -> None:
     """Module's entry-point."""
     parser = ArgumentParser(description="Clean-up a given FASTA file to remove unwanted elements.")
     parser.add_argument_src_path("--fasta_infile", required=True, help="Input FASTA file - DNA / Protein")
-    parser.add_argument_src_path("--genbank_infile", help="Input GenBank GBFF file")
-    parser.add_argument_dst_path("--fasta_outfile", required=True, help="Output FASTA file")
+    parser.add_argument_src_path(
+        "--genbank_infile", help="Input GenBank GBFF file, or its index created with genbank_index"
+    )
+    parser.add_argument_dst_path(
+        "--fasta_outfile", required=True, help="Output FASTA file (compressed with gzip if it ends with .gz)"
+    )
     parser.add_argument("--peptide_mode", action="store_true", help="Process proteins instead of DNA")
+    parser.add_argument(
+        "--compress_threads",
+        type=int,
+        default=1,
+        help="Number of threads used to compress the output if it ends with .gz (with pigz if installed)",
+    )
     parser.add_log_arguments(add_log_file=True)
     args = parser.parse_args()
     init_logging_with_args(args)
@@ -108,4 +196,5 @@ def main() -> None:
         genbank_infile=args.genbank_infile,
         fasta_outfile=args.fasta_outfile,
         peptide_mode=args.peptide_mode,
+        compress_threads=args.compress_threads,
     )
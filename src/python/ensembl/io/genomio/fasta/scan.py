@@ -0,0 +1,112 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fast scanner of FASTA files to get the length of their sequences without loading them."""
+
+__all__ = ["FastaSummary", "scan_fasta"]
+
+from os import PathLike
+from typing import Dict, Optional, Set
+
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+
+
+class FastaSummary:
+    """Summary of the sequences found in a FASTA file.
+
+    Attributes:
+        lengths: Length of each sequence, with their ID as the key.
+        stop_codons: Number of stop codons (`*`) of each sequence that has at least one.
+        num_records: Total number of records found.
+        num_empty_ids: Number of records without an ID.
+        num_duplicates: Number of records with an ID already seen in a previous record.
+        duplicate_ids: IDs seen in more than one record.
+        num_with_stops: Number of records (with an ID) that contain stop codons.
+
+    """
+
+    def __init__(self) -> None:
+        self.lengths: Dict[str, int] = {}
+        self.stop_codons: Dict[str, int] = {}
+        self.num_records = 0
+        self.num_empty_ids = 0
+        self.num_duplicates = 0
+        self.duplicate_ids: Set[str] = set()
+        self.num_with_stops = 0
+
+    def add_record(self, seq_id: str, length: int, stops: int) -> None:
+        """Records the metadata of a sequence.
+
+        Args:
+            seq_id: Sequence ID (first word of the header).
+            length: Length of the sequence.
+            stops: Number of stop codons in the sequence.
+
+        """
+        self.num_records += 1
+        if seq_id == "":
+            self.num_empty_ids += 1
+            return
+        if seq_id in self.lengths:
+            self.num_duplicates += 1
+            self.duplicate_ids.add(seq_id)
+        self.lengths[seq_id] = length
+        if stops > 0:
+            self.stop_codons[seq_id] = stops
+            self.num_with_stops += 1
+
+
+def scan_fasta(fasta_path: PathLike, ignore_final_stops: bool = False) -> FastaSummary:
+    """Returns a summary of the sequences of a FASTA file (gzip compressed or not).
+
+    The file is read line by line as bytes, and no sequence is kept in memory. IDs and lengths follow the
+    same rules as Biopython's FASTA parser: the ID is the first word of the header line, and spaces and
+    carriage returns are not counted in the sequence length.
+
+    Args:
+        fasta_path: Path to the FASTA file.
+        ignore_final_stops: Do not count a stop codon found at the very end of a sequence.
+
+    """
+    summary = FastaSummary()
+    seq_id: Optional[str] = None
+    length = 0
+    stops = 0
+    last_char = b""
+
+    def _add_record() -> None:
+        if seq_id is not None:
+            final_stops = stops
+            if ignore_final_stops and last_char == b"*":
+                final_stops -= 1
+            summary.add_record(seq_id, length, final_stops)
+
+    with open_gz_file(fasta_path, "rb") as fasta_fh:
+        for line in fasta_fh:
+            if line.startswith(b">"):
+                _add_record()
+                title = line[1:].rstrip()
+                seq_id = title.split(None, 1)[0].decode() if title else ""
+                length = 0
+                stops = 0
+                last_char = b""
+            elif seq_id is not None:
+                seq_line = line.rstrip().replace(b" ", b"").replace(b"\r", b"")
+                if seq_line:
+                    length += len(seq_line)
+                    stops += seq_line.count(b"*")
+                    last_char = seq_line[-1:]
+        _add_record()
+
+    return summary
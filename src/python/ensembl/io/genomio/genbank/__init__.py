@@ -16,3 +16,5 @@
 
 from .download import *
 from .extract_data import *
+from .scan import *
+from .index import *
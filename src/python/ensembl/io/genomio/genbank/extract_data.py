@@ -36,7 +36,6 @@ from os import PathLike
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from BCBio import GFF
 from Bio import GenBank, SeqIO
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
@@ -44,6 +43,7 @@ from Bio.SeqFeature import SeqFeature
 
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
+from ensembl.io.genomio.gff3.writer import write_gff3
 
 
 class GBParseError(Exception):
@@ -180,8 +180,7 @@ class FormattedFilesGenerator:
 
         logging.debug(f"Write {len(records)} gene records to {self.files['gene_models']}")
         if records:
-            with self.files["gene_models"].open("w") as gff_fh:
-                GFF.write(records, gff_fh)
+            write_gff3(records, self.files["gene_models"])
 
         logging.debug(f"Write {len(peptides)} peptide sequences to {self.files['fasta_pep']}")
         if peptides:
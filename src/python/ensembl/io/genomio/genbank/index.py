@@ -0,0 +1,192 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compact index of a GBFF file, with the record data needed by the genome preparation steps.
+
+The index is a JSON array with one object per record, in the order of the GBFF file. Each object has:
+ * `id`: Versioned accession of the record.
+ * `length`: Length of the sequence.
+ * `circular`: True if the sequence is circular (absent otherwise).
+ * `codon_table`: First translation table found in the features (if any).
+ * `organelle`: First `organelle` qualifier found in the features, as written in the file (if any).
+ * `genbank_id`: GenBank accession the RefSeq record is derived from, from its comment (if any).
+ * `protein_ids`: Protein IDs of the CDS features (if any).
+ * `cds_without_protein_id`: Number of CDS features without a protein ID (if any).
+
+Building the index once lets every step use the same summary instead of parsing the whole GBFF file again.
+Use `load_gbff_index()` to read either an index or a GBFF file.
+
+Typical usage example::
+    $ genbank_index --gbff_file genomic.gbff.gz --dst_file gbff_index.json
+
+"""
+
+__all__ = [
+    "get_codon_table",
+    "get_genbank_id",
+    "index_gbff",
+    "index_gbff_record",
+    "is_gbff_index",
+    "load_gbff_index",
+    "write_gbff_index",
+]
+
+from os import PathLike
+import re
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from Bio.SeqRecord import SeqRecord
+
+from ensembl.io.genomio.genbank.scan import GBFFRecord, scan_gbff
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+from ensembl.io.genomio.utils.json_utils import iter_json_array, print_json_array
+from ensembl.utils.argparse import ArgumentParser
+from ensembl.utils.logging import init_logging_with_args
+
+
+def get_genbank_id(record: Union[SeqRecord, GBFFRecord]) -> Optional[str]:
+    """Returns the GenBank accession from a given sequence record (if present).
+
+    Only useful for RefSeq sequence records, where the GenBank accession is stored in a comment.
+
+    Args:
+        record: Sequence record.
+
+    """
+    genbank_id = None
+    if "comment" in record.annotations:
+        comment = record.annotations["comment"]
+        comment = re.sub(r"[ \n\r]+", " ", comment)
+        match = re.search(r"The reference sequence was derived from ([^\.]+)\.", comment)
+        if match:
+            genbank_id = match.group(1)
+    return genbank_id
+
+
+def get_codon_table(record: Union[SeqRecord, GBFFRecord]) -> Optional[int]:
+    """Returns the codon table number from a given a GenBank sequence record (if present).
+
+    Args:
+        record: GenBank sequence record.
+
+    """
+    table_number = None
+    for feat in record.features:
+        if "transl_table" in feat.qualifiers:
+            table_number = int(feat.qualifiers["transl_table"][0])
+            break
+    return table_number
+
+
+def index_gbff_record(record: Union[SeqRecord, GBFFRecord]) -> Dict[str, Any]:
+    """Returns the index entry of a GBFF record.
+
+    Args:
+        record: GenBank sequence record.
+
+    """
+    length = record.length if isinstance(record, GBFFRecord) else len(record.seq)
+    entry: Dict[str, Any] = {"id": record.id, "length": length}
+    if record.annotations.get("topology") == "circular":
+        entry["circular"] = True
+    codon_table = get_codon_table(record)
+    if codon_table is not None:
+        entry["codon_table"] = codon_table
+    for feat in record.features:
+        if "organelle" in feat.qualifiers:
+            if feat.qualifiers["organelle"][0]:
+                entry["organelle"] = str(feat.qualifiers["organelle"][0])
+            break
+    genbank_id = get_genbank_id(record)
+    if genbank_id is not None:
+        entry["genbank_id"] = genbank_id
+    protein_ids: List[str] = []
+    no_protein_id = 0
+    for feat in record.features:
+        if feat.type == "CDS":
+            if "protein_id" in feat.qualifiers:
+                protein_ids.append(feat.qualifiers["protein_id"][0])
+            else:
+                no_protein_id += 1
+    if protein_ids:
+        entry["protein_ids"] = protein_ids
+    if no_protein_id:
+        entry["cds_without_protein_id"] = no_protein_id
+    return entry
+
+
+def index_gbff(gbff_path: PathLike, with_features: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yields the index entry of each record of a GBFF file, without loading the sequences.
+
+    Args:
+        gbff_path: Path to the GBFF file (can be gzipped).
+        with_features: Parse the features. If False, the entries only have the data from the record
+            headers, i.e. no codon table, organelle nor protein IDs.
+
+    """
+    for record in scan_gbff(gbff_path, with_features=with_features):
+        yield index_gbff_record(record)
+
+
+def write_gbff_index(gbff_path: PathLike, dst_path: PathLike) -> None:
+    """Writes the index of a GBFF file, one record at a time.
+
+    Args:
+        gbff_path: Path to the GBFF file (can be gzipped).
+        dst_path: Path to the JSON index file to create.
+
+    """
+    print_json_array(dst_path, index_gbff(gbff_path))
+
+
+def is_gbff_index(file_path: PathLike) -> bool:
+    """Returns True if the file is a GBFF index (a JSON array) rather than a GBFF file.
+
+    Args:
+        file_path: Path to a GBFF file (can be gzipped) or a GBFF index.
+
+    """
+    with open_gz_file(file_path) as file_fh:
+        for line in file_fh:
+            if line.strip():
+                return line.lstrip().startswith("[")
+    return False
+
+
+def load_gbff_index(file_path: PathLike, with_features: bool = True) -> Iterator[Dict[str, Any]]:
+    """Yields the index entries of a GBFF index file, or of a GBFF file that is indexed on the fly.
+
+    Args:
+        file_path: Path to a GBFF index created by `write_gbff_index()`, or to a GBFF file.
+        with_features: Parse the features when indexing a GBFF file (ignored for an index file).
+
+    """
+    if is_gbff_index(file_path):
+        yield from iter_json_array(file_path)
+    else:
+        yield from index_gbff(file_path, with_features=with_features)
+
+
+def main() -> None:
+    """Module's entry-point."""
+    parser = ArgumentParser(description="Write a compact index of the records of a GBFF file.")
+    parser.add_argument_src_path("--gbff_file", required=True, help="INSDC/RefSeq GBFF file to index")
+    parser.add_argument_dst_path(
+        "--dst_file", default="gbff_index.json", help="Output JSON file for the GBFF index"
+    )
+    parser.add_log_arguments()
+    args = parser.parse_args()
+    init_logging_with_args(args)
+
+    write_gbff_index(args.gbff_file, args.dst_file)
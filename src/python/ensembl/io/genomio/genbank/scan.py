@@ -0,0 +1,335 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fast scanner of GBFF files that reads the record headers and feature tables, but not the sequences.
+
+The records are returned as lightweight summaries that have the same `id`, `name`, `annotations` and
+`features` (with their `type` and `qualifiers`) as the records from `SeqIO.parse(..., "genbank")`, so they
+can be used in their place when the sequences are not needed.
+"""
+
+__all__ = ["GBFFFeature", "GBFFRecord", "GBFFScanError", "scan_gbff"]
+
+from os import PathLike
+from pathlib import Path
+import re
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+
+
+# Width of the keywords column of the header, and indentation of the feature table columns
+_HEADER_WIDTH = 12
+_FEATURE_KEY_INDENT = 5
+_QUALIFIER_INDENT = 21
+_HEADER_SPACER = b" " * _HEADER_WIDTH
+_QUALIFIER_SPACER = b" " * _QUALIFIER_INDENT
+_STRUCTURED_COMMENT_START = re.compile(r"[^#]+-START##$")
+_STRUCTURED_COMMENT_END = "-END##"
+# Sections after the feature table, up to the end of the record (`//`)
+_FOOTER_KEYWORDS = (b"ORIGIN", b"CONTIG", b"BASE COUNT", b"WGS", b"WGS_SCAFLD", b"TSA", b"TLS")
+_SKIP_CHUNK_SIZE = 1024 * 1024
+
+
+class GBFFScanError(Exception):
+    """Error when a GBFF file is not in the expected format."""
+
+
+class GBFFFeature:
+    """One feature of the feature table of a GBFF record.
+
+    Attributes:
+        type: Feature key (e.g. "CDS").
+        location: Location of the feature, as written in the file.
+        qualifiers: Values of each qualifier, as parsed by Biopython (i.e. without the enclosing quotes).
+
+    """
+
+    __slots__ = ("type", "location", "qualifiers")
+
+    def __init__(self, feat_type: str, location: str, qualifiers: Dict[str, List[str]]) -> None:
+        self.type = feat_type
+        self.location = location
+        self.qualifiers = qualifiers
+
+
+class GBFFRecord:
+    """Summary of a GBFF record, without its sequence.
+
+    Attributes:
+        id: Versioned accession of the record (from the `VERSION` line, or `ACCESSION` or `LOCUS`).
+        name: Locus name.
+        length: Length of the sequence, from the `LOCUS` line.
+        annotations: Record annotations: "topology", "molecule_type", "accessions", and "comment" (free
+            text only, without the structured comments).
+        features: Features of the record, empty if the features were not requested.
+
+    """
+
+    __slots__ = ("id", "name", "length", "annotations", "features")
+
+    def __init__(self, name: str, length: int) -> None:
+        self.id = name
+        self.name = name
+        self.length = length
+        self.annotations: Dict[str, Any] = {}
+        self.features: List[GBFFFeature] = []
+
+
+def _parse_locus(line: str) -> GBFFRecord:
+    """Returns a new record from its `LOCUS` line."""
+    tokens = line.split()
+    if len(tokens) < 2:
+        raise GBFFScanError(f"Invalid LOCUS line: {line}")
+    length = 0
+    mol_index = 0
+    for index, token in enumerate(tokens[2:], 2):
+        if token in ("bp", "aa"):
+            length = int(tokens[index - 1])
+            mol_index = index + 1
+            break
+    record = GBFFRecord(tokens[1], length)
+    if mol_index and mol_index < len(tokens) and tokens[mol_index] not in ("linear", "circular"):
+        record.annotations["molecule_type"] = tokens[mol_index]
+    for topology in ("linear", "circular"):
+        if topology in tokens[2:]:
+            record.annotations["topology"] = topology
+    return record
+
+
+def _add_qualifier(qualifiers: Dict[str, List[str]], key: str, value: Optional[str]) -> None:
+    """Adds a qualifier value the same way as Biopython: without quotes, and unescaped."""
+    if value is None:
+        # Keys without value (e.g. /pseudo) get an empty string, only once
+        qualifiers.setdefault(key, [""])
+        return
+    if len(value) > 1 and value[0] == '"' and value[-1] == '"':
+        value = value[1:-1]
+    value = value.replace('""', '"')
+    if key == "translation":
+        value = "".join(value.split())
+    qualifiers.setdefault(key, []).append(value)
+
+
+def _parse_feature(feat_type: str, lines: List[str]) -> GBFFFeature:
+    """Returns a feature from its key and lines (location then qualifiers, without indentation)."""
+    line_iter = iter(lines)
+    location = next(line_iter)
+    qualifiers: Dict[str, List[str]] = {}
+    key = ""
+    value: Optional[str] = None
+    has_value = False
+    for line in line_iter:
+        if line.startswith("/"):
+            if has_value:
+                _add_qualifier(qualifiers, key, value)
+            equal_pos = line.find("=")
+            if equal_pos == -1:
+                key, value = line[1:], None
+            else:
+                key, value = line[1:equal_pos], line[equal_pos + 1 :].lstrip()
+            has_value = True
+        elif not has_value:
+            # Multiline location
+            location += line
+        elif value is None:
+            raise GBFFScanError(f"Problem with '{feat_type}' feature: unexpected line {line}")
+        else:
+            # Continuation of a quoted or unquoted value
+            value += " " + line
+    if has_value:
+        _add_qualifier(qualifiers, key, value)
+    return GBFFFeature(feat_type, location, qualifiers)
+
+
+def _skip_to_record_end(gbff_fh: IO[bytes]) -> bytes:
+    """Skips the lines of a file up to the end of the current record, and returns the `//` line.
+
+    The lines are not read one by one: the buffered data is searched for the end of the record, and
+    skipped in bulk. The file position must be at the start of a line.
+
+    Args:
+        gbff_fh: GBFF file open in binary mode, with a `peek()` method.
+
+    Returns:
+        The `//` line that ends the record, or an empty string at the end of the file.
+
+    """
+    while True:
+        chunk: bytes = gbff_fh.peek(_SKIP_CHUNK_SIZE)  # type: ignore[attr-defined]
+        if len(chunk) < 3:
+            # Too little data buffered to find the end of the record: read a whole line instead
+            line = gbff_fh.readline()
+            if not line or line.startswith(b"//"):
+                return line
+            continue
+        if chunk.startswith(b"//"):
+            return gbff_fh.readline()
+        end_pos = chunk.find(b"\n//")
+        if end_pos != -1:
+            gbff_fh.read(end_pos + 1)
+            return gbff_fh.readline()
+        # Skip all the complete lines of the chunk
+        last_newline = chunk.rfind(b"\n")
+        if last_newline == -1:
+            gbff_fh.readline()
+        else:
+            gbff_fh.read(last_newline + 1)
+
+
+class _RecordScanner:
+    """Reader of the lines of a GBFF record that follow its `LOCUS` line, up to the `//` line that ends it.
+
+    Attributes:
+        gbff_fh: GBFF file open in binary mode, positioned after the `LOCUS` line of the record.
+        gbff_path: Path to the GBFF file, for the error messages.
+        record: Record to fill.
+        comment_lines: Free text lines of the record comments.
+
+    """
+
+    def __init__(self, gbff_fh: IO[bytes], gbff_path: PathLike, record: GBFFRecord) -> None:
+        self.gbff_fh = gbff_fh
+        self.gbff_path = gbff_path
+        self.record = record
+        self.comment_lines: List[str] = []
+
+    def scan(self, with_features: bool = True) -> GBFFRecord:
+        """Returns the record filled with the rest of its lines.
+
+        Args:
+            with_features: Parse the feature table. If False, the record is returned without features.
+
+        Raises:
+            GBFFScanError: If the record is not terminated by `//`.
+        """
+        # Without features, nothing after the header is needed
+        footer_keywords = _FOOTER_KEYWORDS if with_features else _FOOTER_KEYWORDS + (b"FEATURES",)
+        line = self._scan_header(self.gbff_fh.readline())
+        while with_features and line.startswith(b"FEATURES"):
+            line = self._scan_header(self._scan_features())
+        if line.startswith(footer_keywords):
+            line = _skip_to_record_end(self.gbff_fh)
+        if not line.startswith(b"//"):
+            raise GBFFScanError(f"Record {self.record.name} is not terminated by // in {self.gbff_path}")
+        comment = "\n".join(self.comment_lines).rstrip("\n")
+        if comment:
+            self.record.annotations["comment"] = comment
+        return self.record
+
+    def _scan_header(self, line: bytes) -> bytes:
+        """Parses the header lines, from the given one, and returns the first line after them.
+
+        The header stops at the feature table, at a section after it, or at the end of the record.
+
+        Args:
+            line: First line to parse.
+
+        Raises:
+            GBFFScanError: If a new record starts before the end of this one.
+        """
+        header_end = (b"//", b"FEATURES") + _FOOTER_KEYWORDS
+        while line and not line.startswith(header_end):
+            if line.startswith(b" ") or not line.strip():
+                # Sub-keyword or continuation of a header line that is not used
+                line = self.gbff_fh.readline()
+                continue
+            text = line.rstrip().decode()
+            keyword = text[:_HEADER_WIDTH].strip()
+            data = text[_HEADER_WIDTH:].strip()
+            line = self.gbff_fh.readline()
+            if keyword == "LOCUS":
+                raise GBFFScanError(f"Record {self.record.name} is not terminated by // in {self.gbff_path}")
+            if keyword == "ACCESSION":
+                accessions = data.split()
+                self.record.annotations.setdefault("accessions", []).extend(accessions)
+                if accessions and self.record.id == self.record.name:
+                    self.record.id = accessions[0]
+            elif keyword == "VERSION":
+                if data:
+                    self.record.id = data.split()[0]
+            elif keyword == "COMMENT":
+                line = self._scan_comment(data, line)
+        return line
+
+    def _scan_comment(self, data: str, line: bytes) -> bytes:
+        """Adds the free text of a comment to `comment_lines`, and returns the first line after it.
+
+        Structured comments (between `##...-START##` and `##...-END##` lines) are left out.
+
+        Args:
+            data: Text of the `COMMENT` line.
+            line: Line following the `COMMENT` line.
+        """
+        in_structured_comment = bool(_STRUCTURED_COMMENT_START.search(data))
+        if not in_structured_comment:
+            self.comment_lines.append(data)
+        while line.startswith(_HEADER_SPACER):
+            data = line[_HEADER_WIDTH:].rstrip().decode()
+            if in_structured_comment:
+                in_structured_comment = _STRUCTURED_COMMENT_END not in data
+            elif _STRUCTURED_COMMENT_START.search(data):
+                in_structured_comment = True
+            else:
+                self.comment_lines.append(data)
+            line = self.gbff_fh.readline()
+        return line
+
+    def _scan_features(self) -> bytes:
+        """Adds the features of the feature table to the record, and returns the first line after it."""
+        feat_type = ""
+        feat_lines: List[str] = []
+        line = self.gbff_fh.readline()
+        while line:
+            if line.startswith(_QUALIFIER_SPACER):
+                feat_lines.append(line[_QUALIFIER_INDENT:].strip().decode())
+            elif line.startswith(b" ") and line.strip():
+                # New feature key
+                if feat_lines:
+                    self.record.features.append(_parse_feature(feat_type, feat_lines))
+                text = line.decode()
+                feat_type = text[_FEATURE_KEY_INDENT:_QUALIFIER_INDENT].strip()
+                feat_lines = [text[_QUALIFIER_INDENT:].strip()]
+            elif line.strip():
+                break
+            line = self.gbff_fh.readline()
+        if feat_lines:
+            self.record.features.append(_parse_feature(feat_type, feat_lines))
+        return line
+
+
+def scan_gbff(gbff_path: PathLike, with_features: bool = True) -> Iterator[GBFFRecord]:
+    """Yields a summary of each record of a GBFF file (gzip compressed or not).
+
+    The file is read as bytes: the header lines and feature table are decoded and parsed, but the
+    sequence (`ORIGIN`) and contigs (`CONTIG`) are skipped in bulk, without splitting them in lines.
+
+    Args:
+        gbff_path: Path to the GBFF file.
+        with_features: Parse the feature table. If False, the records are returned without features.
+
+    Raises:
+        GBFFScanError: If a record does not start with a `LOCUS` line, or is not terminated by `//`.
+
+    """
+    with open_gz_file(Path(gbff_path), "rb") as gbff_fh:
+        for line in gbff_fh:
+            if line.startswith(b" ") or not line.strip():
+                continue
+            if line.startswith(b"//"):
+                raise GBFFScanError(f"Record end without LOCUS line in {gbff_path}")
+            text = line.rstrip().decode()
+            if text[:_HEADER_WIDTH].strip() != "LOCUS":
+                raise GBFFScanError(f"Expected a LOCUS line in {gbff_path}, got: {text}")
+            yield _RecordScanner(gbff_fh, gbff_path, _parse_locus(text)).scan(with_features)
@@ -22,15 +22,14 @@ __all__ = [
     "amend_genomic_metadata",
 ]
 
-import csv
 from os import PathLike
 from pathlib import Path
 import re
 from typing import List, Tuple, Optional
 
-from Bio import SeqIO
-
-from ensembl.io.genomio.utils import get_json, open_gz_file, print_json
+from ensembl.io.genomio.assembly.report import AssemblyReport
+from ensembl.io.genomio.genbank.index import load_gbff_index
+from ensembl.io.genomio.utils import get_json, print_json
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
@@ -53,7 +52,7 @@ def get_additions(report_path: Path, gbff_path: Optional[Path]) -> List[str]:
 
     Args:
         report_path: Path to the report file.
-        gbff_path: Path to the GBFF file.
+        gbff_path: Path to the GBFF file, or its index created with `genbank_index`.
     """
     gbff_regions = set(get_gbff_regions(gbff_path))
     report_regions = get_report_regions_names(report_path)
@@ -74,61 +73,26 @@ def get_gbff_regions(gbff_path: Optional[Path]) -> List[str]:
     """Returns the `seq_region` data from the GBFF file.
 
     Args:
-        gbff_path: Gbff file path to use.
+        gbff_path: Gbff file path to use, or its index created with `genbank_index`.
     """
     if not gbff_path:
         return []
 
     seq_regions = []
-    with open_gz_file(gbff_path) as gbff_file:
-        for record in SeqIO.parse(gbff_file, "genbank"):
-            record_id = re.sub(_VERSION_END, "", record.id)
-            seq_regions.append(record_id)
+    for record in load_gbff_index(gbff_path, with_features=False):
+        record_id = re.sub(_VERSION_END, "", record["id"])
+        seq_regions.append(record_id)
     return seq_regions
 
 
-def _report_to_csv(report_path: Path) -> Tuple[str, dict]:
-    """Returns an assembly report as a CSV string, and the head metadata as a dict.
-
-    Args:
-        report_path: Path to a `seq_region` file from INSDC/RefSeq.
-
-    """
-    data = ""
-    metadata = {}
-    with report_path.open("r") as report:
-        last_head = ""
-        for line in report:
-            # Ignore header
-            if line.startswith("#"):
-                # Get metadata values if possible
-                match = re.search("# (.+?): (.+?)$", line)
-                if match:
-                    metadata[match.group(1)] = match.group(2)
-                last_head = line
-                continue
-            if last_head:
-                data += last_head[2:].strip() + "\n"
-                last_head = ""
-            data += line
-    return data, metadata
-
-
 def get_report_regions_names(report_path: Path) -> List[Tuple[str, str]]:
     """Returns a list of `seq_region` names from the report file.
 
     Args:
         report_path: Path to the seq_regions report from INSDC/RefSeq.
     """
-    # Get the report in a CSV format, easier to manipulate
-    report_csv, _ = _report_to_csv(report_path)
-
-    # Feed the csv string to the CSV reader
-    reader = csv.DictReader(report_csv.splitlines(), delimiter="\t", quoting=csv.QUOTE_NONE)
-
-    # Create the seq_regions
     seq_regions = []
-    for row in reader:
+    for row in AssemblyReport(report_path):
         refseq_name = row["RefSeq-Accn"]
         genbank_name = row["GenBank-Accn"]
 
@@ -183,7 +147,9 @@ def main() -> None:
         "--genome_outfile", required=True, help="Path to the new amended genome metadata file"
     )
     parser.add_argument_src_path("--report_file", help="INSDC/RefSeq sequences report file")
-    parser.add_argument_src_path("--genbank_infile", help="INSDC/RefSeq GBFF file")
+    parser.add_argument_src_path(
+        "--genbank_infile", help="INSDC/RefSeq GBFF file, or its index created with genbank_index"
+    )
     parser.add_log_arguments()
     args = parser.parse_args()
     init_logging_with_args(args)
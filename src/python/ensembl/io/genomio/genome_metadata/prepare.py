@@ -35,9 +35,7 @@ from typing import Dict, Optional
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
 
-import requests
-
-from ensembl.io.genomio.utils import get_json, print_json
+from ensembl.io.genomio.utils import get_http_client, get_json, print_json
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
@@ -169,6 +167,8 @@ def add_species_metadata(genome_data: Dict, base_api_url: str = DEFAULT_API_URL)
 def get_taxonomy_from_accession(accession: str, base_api_url: str = DEFAULT_API_URL) -> Dict:
     """Returns the taxonomy metadata associated to the given accession.
 
+    The ENA entry is fetched with the shared HTTP client, so it can be served from its cache.
+
     Args:
         accession: INSDC accession ID.
         base_api_url: Base API URL to fetch the taxonomy data from.
@@ -183,8 +183,7 @@ def get_taxonomy_from_accession(accession: str, base_api_url: str = DEFAULT_API_
     """
     # Use the GenBank accession without version
     gb_accession = accession.replace("GCF", "GCA").split(".")[0]
-    response = requests.get(f"{base_api_url}/{gb_accession}", timeout=60)
-    entry = ElementTree.fromstring(response.text)
+    entry = ElementTree.fromstring(get_http_client().get_text(f"{base_api_url}/{gb_accession}"))
 
     taxon_node = entry.find(".//TAXON")
     if taxon_node is None:
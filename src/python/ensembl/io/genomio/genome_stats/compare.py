@@ -21,6 +21,7 @@ from os import PathLike
 import re
 from typing import Any, Dict
 
+from ensembl.io.genomio.assembly.datasets import DEFAULT_CACHE_TTL_DAYS, DatasetsError, DatasetsSummaries
 from ensembl.io.genomio.utils import get_json
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
@@ -220,13 +221,35 @@ def main() -> None:
     parser = ArgumentParser(
         description="Compares the genome statistics between an NCBI dataset and a core database."
     )
-    parser.add_argument_src_path("--ncbi_stats", required=True, help="NCBI dataset stats JSON file")
+    parser.add_argument_src_path("--ncbi_stats", help="NCBI dataset stats JSON file")
+    parser.add_argument(
+        "--accession", help="Genome accession to get the NCBI dataset stats of, instead of '--ncbi_stats'"
+    )
     parser.add_argument_src_path("--core_stats", required=True, help="core database stats JSON file")
+    parser.add_argument("--datasets_bin", default="datasets", help="Path to the datasets executable")
+    parser.add_argument_dst_path(
+        "--datasets_cache_dir", help="Folder to cache the NCBI datasets summaries, by accession"
+    )
+    parser.add_argument(
+        "--datasets_cache_ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_DAYS,
+        help="Number of days a cached NCBI datasets summary is used before fetching it again",
+    )
     parser.add_log_arguments(add_log_file=True)
     args = parser.parse_args()
+    if (args.ncbi_stats is None) == (args.accession is None):
+        parser.error("one (and only one) of '--ncbi_stats' or '--accession' is required")
 
     # Configure and initialise logging
     init_logging_with_args(args)
 
-    report = compare_stats_files(args.ncbi_stats, args.core_stats)
+    if args.ncbi_stats:
+        report = compare_stats_files(args.ncbi_stats, args.core_stats)
+    else:
+        summaries = DatasetsSummaries(args.datasets_bin, args.datasets_cache_dir, args.datasets_cache_ttl)
+        ncbi_reports = summaries.get_summary(args.accession)["reports"]
+        if not ncbi_reports:
+            raise DatasetsError(f"No NCBI datasets summary found for {args.accession}")
+        report = compare_stats(ncbi_reports[0], get_json(args.core_stats))
     print(json.dumps(report, indent=2, sort_keys=True))
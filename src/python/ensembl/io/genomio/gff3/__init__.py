@@ -14,7 +14,11 @@
 # limitations under the License.
 """GFF3 files processing module."""
 
+from .biotypes import *
 from .extract_annotation import *
+from .features import *
 from .gene_merger import *
 from .process import *
 from .simplifier import *
+from .streaming import *
+from .writer import *
@@ -0,0 +1,100 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Registry of the GFF3 feature types supported or ignored when processing GFF3 files."""
+
+__all__ = [
+    "RootType",
+    "BiotypeRegistry",
+    "get_biotype_registry",
+]
+
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet
+
+from importlib_resources import files
+
+import ensembl.io.genomio.data.gff3
+from ensembl.io.genomio.utils.json_utils import get_json
+
+
+class RootType(Enum):
+    """How a root feature of a GFF3 file is processed, depending on its type."""
+
+    IGNORED = "ignored"
+    NON_GENE = "non_gene"
+    TRANSCRIPT = "transcript"
+    GENE = "gene"
+    OTHER = "other"
+
+
+class BiotypeRegistry:
+    """Supported and ignored feature types, as sets for constant time lookups.
+
+    Attributes:
+        gene_types: Supported gene types.
+        ignored_gene_types: Root feature types that are ignored.
+        non_gene_types: Supported root feature types that are not genes.
+        transcript_types: Supported transcript types.
+        ignored_transcript_types: Transcript and transcript sub-feature types that are ignored.
+
+    """
+
+    def __init__(self, biotypes: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Args:
+            biotypes: Lists of supported and ignored types of each category, as in `biotypes.json`.
+        """
+        self.gene_types: FrozenSet[str] = frozenset(biotypes["gene"].get("supported", []))
+        self.ignored_gene_types: FrozenSet[str] = frozenset(biotypes["gene"].get("ignored", []))
+        self.non_gene_types: FrozenSet[str] = frozenset(biotypes["non_gene"].get("supported", []))
+        self.transcript_types: FrozenSet[str] = frozenset(biotypes["transcript"].get("supported", []))
+        self.ignored_transcript_types: FrozenSet[str] = frozenset(biotypes["transcript"].get("ignored", []))
+
+        # Ignored types take precedence over non-gene types, then over transcript types, then gene types
+        self._root_types: Dict[str, RootType] = {}
+        for root_type, feat_types in (
+            (RootType.GENE, self.gene_types),
+            (RootType.TRANSCRIPT, self.transcript_types),
+            (RootType.NON_GENE, self.non_gene_types),
+            (RootType.IGNORED, self.ignored_gene_types),
+        ):
+            self._root_types.update(dict.fromkeys(feat_types, root_type))
+
+    def get_root_type(self, feat_type: str) -> RootType:
+        """Returns how a root feature of the given type is processed.
+
+        Args:
+            feat_type: Type of the root feature.
+        """
+        return self._root_types.get(feat_type, RootType.OTHER)
+
+    def is_known_transcript_type(self, feat_type: str) -> bool:
+        """Returns True if the transcript type is either supported or explicitly ignored.
+
+        Args:
+            feat_type: Type of the transcript.
+        """
+        return feat_type in self.transcript_types or feat_type in self.ignored_transcript_types
+
+
+@lru_cache(maxsize=None)
+def get_biotype_registry() -> BiotypeRegistry:
+    """Returns the registry of the types listed in the `biotypes.json` file of this package.
+
+    The file is only loaded once, and the same registry is returned afterwards.
+    """
+    biotypes_json = files(ensembl.io.genomio.data.gff3) / "biotypes.json"
+    return BiotypeRegistry(get_json(biotypes_json))
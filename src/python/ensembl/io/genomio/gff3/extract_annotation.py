@@ -19,17 +19,21 @@ __all__ = [
     "DuplicateIdError",
     "MissingParentError",
     "AnnotationError",
+    "AnnotationStore",
+    "DescriptionClassifier",
     "FunctionalAnnotations",
 ]
 
+from collections.abc import Mapping
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from Bio.SeqFeature import SeqFeature
 
-from ensembl.io.genomio.utils.json_utils import print_json
+from ensembl.io.genomio.utils.json_utils import print_json_array
 
 
 Annotation = Dict[str, Any]
@@ -52,6 +56,209 @@ class AnnotationError(Exception):
     """If anything wrong happens when recording annotations."""
 
 
+class DescriptionClassifier:
+    """Classifies product names (descriptions) as informative or not.
+
+    The regular expressions are only compiled once, and the results of the most recent descriptions are
+    cached, since the same descriptions (e.g. "hypothetical protein") are found in many features.
+
+    """
+
+    non_informative_words = [
+        "hypothetical",
+        "putative",
+        "uncharacterized",
+        "unspecified",
+        "unknown",
+        r"(of )?unknown function",
+        "conserved",
+        "predicted",
+        "fragment",
+        "product",
+        "function",
+        "protein",
+        "gene",
+        "RNA",
+        r"variant( \d+)?",
+    ]
+    _non_informative_re = re.compile(r"|".join(non_informative_words), re.IGNORECASE)
+    _punct_re = re.compile(r"[,;: _()-]+")
+    _empty_re = re.compile(r"^[ ]*$")
+    _literal_prefix_re = re.compile(r"[^.^$*+?{}\[\]\\|()]*")
+
+    def __init__(self, cache_size: int = 65536) -> None:
+        """
+        Args:
+            cache_size: Maximum number of descriptions for which the result is cached.
+        """
+        self._classify = lru_cache(maxsize=cache_size)(self._classify_description)
+
+    def is_informative(self, product: str, feat_id: Optional[str] = None) -> bool:
+        """Returns True if the product name contains informative words, False otherwise.
+
+        Args:
+            product: A product name.
+            feat_id: Feature ID to remove from the product name before classifying it (optional).
+
+        """
+        # Remove the feature ID if it's in the description
+        if feat_id is not None:
+            product = self._remove_id(product, feat_id)
+        return self._classify(product)
+
+    def _remove_id(self, product: str, feat_id: str) -> str:
+        """Returns the product name without the feature ID, used as a case insensitive regular expression.
+
+        Most IDs are unique, so compiling them is avoided when they cannot be found in the product name,
+        and plain ASCII IDs are removed with string operations instead.
+
+        """
+        if not (product.isascii() and feat_id.isascii()) or "|" in feat_id:
+            return re.sub(re.compile(feat_id, re.IGNORECASE), "", product)
+
+        lower_product = product.lower()
+        lower_id = feat_id.lower()
+        # The pattern matches any string, and an empty prefix only leads to using the regular expression
+        prefix_match = self._literal_prefix_re.match(lower_id)
+        literal_prefix = prefix_match.group() if prefix_match else ""
+        if literal_prefix != lower_id:
+            # The character before a quantifier is optional
+            if lower_id[len(literal_prefix)] in "*?{":
+                literal_prefix = literal_prefix[:-1]
+            if literal_prefix not in lower_product:
+                return product
+            return re.sub(re.compile(feat_id, re.IGNORECASE), "", product)
+        if not lower_id or lower_id not in lower_product:
+            return product
+
+        # Remove all the occurrences of the ID, like re.sub() would
+        parts = []
+        start = 0
+        position = lower_product.find(lower_id)
+        while position >= 0:
+            parts.append(product[start:position])
+            start = position + len(lower_id)
+            position = lower_product.find(lower_id, start)
+        parts.append(product[start:])
+        return "".join(parts)
+
+    def _classify_description(self, product: str) -> bool:
+        """Returns True if the product name contains informative words, False otherwise (uncached)."""
+        # Remove punctuations
+        product = re.sub(self._punct_re, " ", product)
+
+        # Then remove non informative words
+        product = re.sub(self._non_informative_re, " ", product)
+
+        # Anything (informative) left?
+        return not bool(self._empty_re.match(product))
+
+
+_DESCRIPTION_CLASSIFIER = DescriptionClassifier()
+
+
+class AnnotationStore(Mapping):
+    """Annotations of the features of one type, as a read-only mapping from feature ID to annotation.
+
+    The annotations are stored by column instead of as one dict per feature, and each annotation dict is
+    only built when it is accessed, so a large annotation takes a fraction of the memory.
+
+    """
+
+    __slots__ = ("object_type", "_rows", "_descriptions", "_synonyms", "_pseudogenes")
+
+    def __init__(self, object_type: str) -> None:
+        """
+        Args:
+            object_type: Type of the annotated features (e.g. gene, transcript, translation).
+        """
+        self.object_type = object_type
+        self._rows: Dict[str, int] = {}
+        self._descriptions: List[Optional[str]] = []
+        self._synonyms: List[Optional[str]] = []
+        self._pseudogenes = bytearray()
+
+    def __getitem__(self, feat_id: str) -> Annotation:
+        row = self._rows[feat_id]
+        annotation: Annotation = {"object_type": self.object_type, "id": feat_id}
+        description = self._descriptions[row]
+        if description is not None:
+            annotation["description"] = description
+        synonym = self._synonyms[row]
+        if synonym is not None:
+            annotation["synonyms"] = {"synonym": synonym, "default": True}
+        if self._pseudogenes[row]:
+            annotation["is_pseudogene"] = True
+        return annotation
+
+    def __contains__(self, feat_id: object) -> bool:
+        return feat_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(
+        self,
+        feat_id: str,
+        description: Optional[str] = None,
+        synonym: Optional[str] = None,
+        is_pseudogene: bool = False,
+    ) -> None:
+        """Adds the annotation of a feature.
+
+        Args:
+            feat_id: Feature ID.
+            description: Description of the feature.
+            synonym: Default synonym of the feature.
+            is_pseudogene: The feature is a pseudogene.
+
+        Raises:
+            AnnotationError: If the feature has already been added.
+        """
+        if feat_id in self._rows:
+            raise AnnotationError(f"Feature {self.object_type} ID {feat_id} already added")
+        self._rows[feat_id] = len(self._rows)
+        self._descriptions.append(description)
+        self._synonyms.append(synonym)
+        self._pseudogenes.append(is_pseudogene)
+
+    def extend(self, other: "AnnotationStore") -> None:
+        """Adds all the annotations of another store, after the current ones.
+
+        Args:
+            other: Annotations of features of the same type.
+
+        Raises:
+            AnnotationError: If a feature of `other` has already been added.
+        """
+        for feat_id, description, synonym, is_pseudogene in other.iter_rows():
+            self.add(feat_id, description, synonym, is_pseudogene)
+
+    def iter_rows(self) -> Iterator[Tuple[str, Optional[str], Optional[str], bool]]:
+        """Yields the ID, description, synonym and pseudogene flag of each feature, in the order added."""
+        for feat_id, description, synonym, is_pseudogene in zip(
+            self._rows, self._descriptions, self._synonyms, self._pseudogenes
+        ):
+            yield feat_id, description, synonym, bool(is_pseudogene)
+
+    def get_description(self, feat_id: str) -> Optional[str]:
+        """Returns the description of a feature, or None if it does not have any."""
+        return self._descriptions[self._rows[feat_id]]
+
+    def set_description(self, feat_id: str, description: Optional[str]) -> None:
+        """Sets (or removes with None) the description of a feature."""
+        self._descriptions[self._rows[feat_id]] = description
+
+    def iter_descriptions(self) -> Iterator[Tuple[str, str]]:
+        """Yields the ID and description of each feature that has a description."""
+        for feat_id, description in zip(self._rows, self._descriptions):
+            if description is not None:
+                yield feat_id, description
+
+
 class FunctionalAnnotations:
     """List of annotations extracted from a GFF3 file."""
 
@@ -59,12 +266,10 @@ class FunctionalAnnotations:
         self.annotations: List[Annotation] = []
 
         # Annotated features
-        # Under each feature, each dict's key is a feature ID
-        self.features: Dict[str, Dict[str, Annotation]] = {
-            "gene": {},
-            "transcript": {},
-            "translation": {},
-            "transposable_element": {},
+        # Under each feature, each key is a feature ID
+        self.features: Dict[str, AnnotationStore] = {
+            feat_type: AnnotationStore(feat_type)
+            for feat_type in ("gene", "transcript", "translation", "transposable_element")
         }
         # Keep parent info: key is the feature ID, value is the parent ID
         self.parents: Dict[str, Dict[str, str]] = {
@@ -72,7 +277,7 @@ class FunctionalAnnotations:
             "transcript": {},
         }
 
-    def get_features(self, feat_type: str) -> Dict[str, Annotation]:
+    def get_features(self, feat_type: str) -> AnnotationStore:
         """Get all feature annotations for the requested type."""
         try:
             return self.features[feat_type]
@@ -106,11 +311,7 @@ class FunctionalAnnotations:
             feat_type: Type of the feature to annotate.
         """
         features = self.get_features(feat_type)
-        if feature.id in features:
-            raise AnnotationError(f"Feature {feat_type} ID {feature.id} already added")
-
-        feature_object = self._generic_feature(feature, feat_type)
-        self.features[feat_type][feature.id] = feature_object
+        features.add(feature.id, *self._generic_feature(feature))
 
         if parent_id:
             if feat_type in _PARENTS:
@@ -119,43 +320,53 @@ class FunctionalAnnotations:
             else:
                 raise AnnotationError(f"No parent possible for {feat_type} {feature.id}")
 
-    def _generic_feature(self, feature: SeqFeature, feat_type: str) -> Dict[str, Any]:
-        """Create a feature object following the specifications.
+    def merge(self, other: "FunctionalAnnotations") -> None:
+        """Adds the features and parent links of another set of annotations, after the current ones.
 
         Args:
-            feature: The SeqFeature to add to the list.
-            feat_type: Feature type of the feature to store (e.g. gene, transcript, translation).
+            other: Annotations to add.
 
+        Raises:
+            AnnotationError: If a feature of `other` has already been added.
         """
+        for feat_type, other_features in other.features.items():
+            self.get_features(feat_type).extend(other_features)
+        for parent_type, other_parents in other.parents.items():
+            self.parents[parent_type].update(other_parents)
+
+    def _generic_feature(self, feature: SeqFeature) -> Tuple[Optional[str], Optional[str], bool]:
+        """Returns the description, synonym and pseudogene flag of a feature, following the specifications.
+
+        Args:
+            feature: The SeqFeature to annotate.
 
-        feature_object: Annotation = {"object_type": feat_type, "id": feature.id}
+        """
+        description = None
 
         # Description?
         if "product" in feature.qualifiers:
-            description = feature.qualifiers["product"][0]
-            if self.product_is_informative(description):
-                feature_object["description"] = description
+            product = feature.qualifiers["product"][0]
+            if self.product_is_informative(product):
+                description = product
 
-        if "Name" in feature.qualifiers and "description" not in feature_object:
-            feature_object["description"] = feature.qualifiers["Name"][0]
+        if "Name" in feature.qualifiers and description is None:
+            description = feature.qualifiers["Name"][0]
 
         # Don't keep useless description
-        if ("description" in feature_object) and not self.product_is_informative(
-            feature_object["description"], feature.id
-        ):
-            del feature_object["description"]
+        if description is not None and not self.product_is_informative(description, feature.id):
+            description = None
 
         # Synonyms?
+        synonym = None
         if "Name" in feature.qualifiers:
             feat_name = feature.qualifiers["Name"][0]
             if feat_name != feature.id:
-                feature_object["synonyms"] = {"synonym": feat_name, "default": True}
+                synonym = feat_name
 
         # is_pseudogene?
-        if feature.type.startswith("pseudogen"):
-            feature_object["is_pseudogene"] = True
+        is_pseudogene = feature.type.startswith("pseudogen")
 
-        return feature_object
+        return description, synonym, is_pseudogene
 
     def transfer_descriptions(self) -> None:
         """Transfers the feature descriptions in 2 steps:
@@ -178,15 +389,11 @@ class FunctionalAnnotations:
         parent_features = self.get_features(parent_type)
 
         # Transfer description from children to their parent
-        for child_id, child in children_features.items():
-            child_description = child.get("description")
-            if child_description is not None:
-                # Check parent
-                parent_id = self.get_parent(parent_type, child_id)
-                parent = parent_features[parent_id]
-                parent_description = parent.get("description")
-                if parent_description is None:
-                    parent["description"] = child_description
+        for child_id, child_description in children_features.iter_descriptions():
+            # Check parent
+            parent_id = self.get_parent(parent_type, child_id)
+            if parent_features.get_description(parent_id) is None:
+                parent_features.set_description(parent_id, child_description)
 
     @staticmethod
     def product_is_informative(product: str, feat_id: Optional[str] = None) -> bool:
@@ -201,54 +408,21 @@ class FunctionalAnnotations:
             feat_id: Feature ID (optional).
 
         """
-        non_informative_words = [
-            "hypothetical",
-            "putative",
-            "uncharacterized",
-            "unspecified",
-            "unknown",
-            r"(of )?unknown function",
-            "conserved",
-            "predicted",
-            "fragment",
-            "product",
-            "function",
-            "protein",
-            "gene",
-            "RNA",
-            r"variant( \d+)?",
-        ]
-        non_informative_re = re.compile(r"|".join(non_informative_words), re.IGNORECASE)
-
-        # Remove the feature ID if it's in the description
-        if feat_id is not None:
-            feat_id_re = re.compile(feat_id, re.IGNORECASE)
-            product = re.sub(feat_id_re, "", product)
-
-        # Remove punctuations
-        punct_re = re.compile(r"[,;: _()-]+")
-        product = re.sub(punct_re, " ", product)
-
-        # Then remove non informative words
-        product = re.sub(non_informative_re, " ", product)
-
-        # Anything (informative) left?
-        empty_re = re.compile(r"^[ ]*$")
-        return not bool(empty_re.match(product))
+        return _DESCRIPTION_CLASSIFIER.is_informative(product, feat_id)
 
-    def _to_list(self):
-        all_list = []
-        for feat_dict in self.features.values():
-            all_list += feat_dict.values()
-        return all_list
+    def _iter_annotations(self) -> Iterator[Annotation]:
+        """Yields the annotation of every feature, by feature type."""
+        for features in self.features.values():
+            yield from features.values()
 
     def to_json(self, out_path: PathLike) -> None:
         """Print out the current annotation list in a json file.
 
+        The annotations are written one at a time, so only one of them is built as a dict at any time.
+
         Args:
             out_path: JSON file path where to write the data.
 
         """
         self.transfer_descriptions()
-        feats_list = self._to_list()
-        print_json(Path(out_path), feats_list)
+        print_json_array(Path(out_path), self._iter_annotations())
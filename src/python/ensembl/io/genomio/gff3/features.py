@@ -0,0 +1,400 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compact representation of GFF3 features, and a parser that builds their hierarchy from GFF3 lines.
+
+The hierarchy follows the same rules as the BCBio GFF parser, so both can be used interchangeably:
+seq_regions are sorted by name, duplicated IDs of top-level features are renamed with a `_N` suffix, and
+a feature with an unknown parent is added as a top-level feature (or under an inferred parent if it has
+siblings).
+"""
+
+__all__ = [
+    "GFFFeature",
+    "GFFFeatureError",
+    "parse_gff3_attributes",
+    "get_gff3_id_and_parents",
+    "parse_gff3_features",
+    "to_seq_feature",
+    "from_seq_feature",
+]
+
+from os import PathLike
+from pathlib import Path
+from sys import intern
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote, unquote
+
+from Bio.SeqFeature import SeqFeature, SimpleLocation
+
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+
+
+class GFFFeatureError(Exception):
+    """Error when building the hierarchy of GFF3 features."""
+
+
+class GFFFeature:
+    """One feature of a GFF3 file (i.e. one line), with its sub-features.
+
+    Only the columns are stored: the attributes column is kept as it is and only parsed on demand, apart
+    from the ID and the parents.
+
+    Attributes:
+        seq_id: Name of the seq_region.
+        source: Source column, or None if not defined.
+        type: Feature type.
+        start: Start of the feature (1-based).
+        end: End of the feature (included).
+        score: Score column, or None if not defined.
+        strand: 1 or -1, or None if not defined.
+        phase: Phase column, or None if not defined.
+        attributes: Raw attributes column.
+        id: ID of the feature, or an empty string. Duplicated IDs of top-level features get a suffix, and
+            the ID of a feature that is its own parent is ignored.
+        parent_ids: IDs of the parents of the feature.
+        sub_features: Children of the feature, in the order of the file (an empty tuple if there are none).
+
+    """
+
+    __slots__ = (
+        "seq_id",
+        "source",
+        "type",
+        "start",
+        "end",
+        "score",
+        "strand",
+        "phase",
+        "attributes",
+        "id",
+        "parent_ids",
+        "sub_features",
+    )
+
+    def __init__(
+        self,
+        seq_id: str,
+        source: Optional[str],
+        feat_type: str,
+        start: int,
+        end: int,
+        *,
+        score: Optional[str] = None,
+        strand: Optional[int] = None,
+        phase: Optional[str] = None,
+        attributes: str = "",
+    ) -> None:
+        self.seq_id = seq_id
+        self.source = source
+        self.type = feat_type
+        self.start = start
+        self.end = end
+        self.score = score
+        self.strand = strand
+        self.phase = phase
+        self.attributes = attributes
+        feat_id, parent_ids = get_gff3_id_and_parents(attributes)
+        # A feature cannot be its own parent, so its ID is not used in that case
+        self.id = "" if feat_id in parent_ids else feat_id
+        self.parent_ids: Tuple[str, ...] = tuple(parent_ids)
+        # Most features do not have any children, so their list is only created for the first one
+        self.sub_features: Sequence["GFFFeature"] = ()
+
+    def add_sub_feature(self, sub_feature: "GFFFeature") -> None:
+        """Adds a child to the feature.
+
+        Args:
+            sub_feature: Child feature.
+        """
+        if isinstance(self.sub_features, list):
+            self.sub_features.append(sub_feature)
+        else:
+            self.sub_features = [sub_feature]
+
+    @classmethod
+    def from_line(cls, line: str) -> "GFFFeature":
+        """Returns the feature of a GFF3 line.
+
+        Args:
+            line: GFF3 line with 9 columns.
+
+        Raises:
+            GFFFeatureError: If the line does not have 9 columns.
+        """
+        fields = line.rstrip("\n").split("\t")
+        if len(fields) != 9:
+            raise GFFFeatureError(f"Expected 9 columns in GFF3 line: {line}")
+        seq_id, source, feat_type, start, end, score, strand, phase, attributes = fields
+        # The same few values are found in every line, so only one copy of each is kept
+        return cls(
+            intern(seq_id),
+            None if source == "." else intern(source),
+            intern(feat_type),
+            int(start),
+            int(end),
+            score=None if score == "." else intern(score),
+            strand=_STRANDS.get(strand),
+            phase=None if phase == "." else intern(phase),
+            attributes=attributes,
+        )
+
+    @property
+    def qualifiers(self) -> Dict[str, List[str]]:
+        """Attributes of the feature as lists of values, like the qualifiers of the BCBio GFF parser."""
+        qualifiers = parse_gff3_attributes(self.attributes)
+        if not self.id:
+            qualifiers.pop("ID", None)
+        if self.parent_ids:
+            qualifiers["Parent"] = list(self.parent_ids)
+        for key, value in (("source", self.source), ("score", self.score), ("phase", self.phase)):
+            if value is not None:
+                qualifiers.setdefault(key, []).append(value)
+        return qualifiers
+
+    def __repr__(self) -> str:
+        return f"GFFFeature({self.seq_id}:{self.start}-{self.end}, type={self.type}, id={self.id})"
+
+
+_STRANDS = {"+": 1, "-": -1}
+
+
+def parse_gff3_attributes(attributes: str) -> Dict[str, List[str]]:
+    """Returns the values of each attribute of a GFF3 attributes column (unquoted).
+
+    Args:
+        attributes: Ninth column of a GFF3 line.
+    """
+    parsed: Dict[str, List[str]] = {}
+    for attribute in attributes.split(";"):
+        attribute = attribute.strip()
+        if not attribute:
+            continue
+        key, _, value = attribute.partition("=")
+        parsed.setdefault(key, []).extend(unquote(val) for val in value.split(","))
+    return parsed
+
+
+def get_gff3_id_and_parents(attributes: str) -> Tuple[str, List[str]]:
+    """Returns the ID and the list of parent IDs found in the attributes column of a GFF3 line.
+
+    Args:
+        attributes: Ninth column of a GFF3 line.
+    """
+    feat_id = ""
+    parents: List[str] = []
+    for attribute in attributes.split(";"):
+        key, _, value = attribute.strip().partition("=")
+        if key == "ID":
+            feat_id = unquote(value)
+        elif key == "Parent":
+            parents = [unquote(parent) for parent in value.split(",")]
+    return feat_id, parents
+
+
+class _FeatureHierarchy:
+    """Features of a GFF3 file, before their hierarchy is built.
+
+    As in the BCBio GFF parser, the IDs are shared by all the seq_regions.
+
+    """
+
+    __slots__ = ("top_features", "roots", "features", "children")
+
+    def __init__(self) -> None:
+        # Top-level features of each seq_region: without ID first, then with an ID, and orphans last
+        self.top_features: Dict[str, Tuple[List[GFFFeature], List[GFFFeature], List[GFFFeature]]] = {}
+        self.roots: Dict[str, List[GFFFeature]] = {}
+        self.features: Dict[str, GFFFeature] = {}
+        self.children: List[GFFFeature] = []
+
+    def add(self, feature: GFFFeature) -> None:
+        """Adds a feature, as a top-level feature if it does not have any parent."""
+        if feature.seq_id not in self.top_features:
+            self.top_features[feature.seq_id] = ([], [], [])
+        no_id_roots, id_roots, _ = self.top_features[feature.seq_id]
+        if feature.parent_ids:
+            self.children.append(feature)
+            if feature.id:
+                self.features.setdefault(feature.id, feature)
+        elif feature.id:
+            id_roots.append(feature)
+            self.roots.setdefault(feature.id, []).append(feature)
+        else:
+            no_id_roots.append(feature)
+
+    def build(self) -> Dict[str, List[GFFFeature]]:
+        """Returns the top-level features of each seq_region, with their sub-features added."""
+        # Rename the duplicated top-level IDs, e.g. "gene1", "gene1_2", "gene1_3"
+        for root_id, features in self.roots.items():
+            for occurrence, feature in enumerate(features[1:], 2):
+                feature.id = f"{root_id}_{occurrence}"
+            self.features[root_id] = features[0]
+
+        # Children of each parent ID, in the order of the file
+        children: Dict[str, List[GFFFeature]] = {}
+        for child in self.children:
+            parent_ids = []
+            for parent_id in child.parent_ids:
+                parent = self._find_parent(parent_id, child)
+                if parent is not None:
+                    # Share the ID string of the parent, which may have been renamed
+                    parent_id = parent.id
+                parent_ids.append(parent_id)
+                children.setdefault(parent_id, []).append(child)
+            child.parent_ids = tuple(parent_ids)
+        self.children = []
+
+        for _, id_roots, _ in self.top_features.values():
+            for root in id_roots:
+                self._add_children(root, children)
+
+        # The remaining children have a missing parent: a single child is added as a top-level feature,
+        # otherwise a parent is inferred from its children
+        while children:
+            parent_id, missing_children = next(iter(children.items()))
+            first_child = missing_children[0]
+            orphans = self.top_features[first_child.seq_id][2]
+            if len(missing_children) == 1:
+                orphans.append(first_child)
+                del children[parent_id]
+                continue
+            strands = {child.strand for child in missing_children}
+            inferred_parent = GFFFeature(
+                first_child.seq_id,
+                None,
+                "inferred_parent",
+                min(child.start for child in missing_children),
+                max(child.end for child in missing_children),
+                strand=strands.pop() if len(strands) == 1 else None,
+                attributes=f"ID={quote(parent_id, safe=':/ ')}",
+            )
+            orphans.append(inferred_parent)
+            self._add_children(inferred_parent, children)
+
+        return {
+            seq_id: no_id_roots + id_roots + orphans
+            for seq_id, (no_id_roots, id_roots, orphans) in self.top_features.items()
+        }
+
+    def _add_children(self, parent: GFFFeature, children: Dict[str, List[GFFFeature]]) -> None:
+        """Adds the children of a feature, and recursively their own children, as its sub-features."""
+        for child in children.pop(parent.id, []):
+            self._add_children(child, children)
+            parent.add_sub_feature(child)
+
+    def _find_parent(self, parent_id: str, child: GFFFeature) -> Optional[GFFFeature]:
+        """Returns the parent with the given ID, or the first duplicate that contains the child."""
+        duplicates = self.roots.get(parent_id, [])
+        if len(duplicates) > 1:
+            for parent in duplicates:
+                if parent.start <= child.start and child.end <= parent.end:
+                    return parent
+            raise GFFFeatureError(f"No feature {parent_id} contains the location of its child {child}")
+        return self.features.get(parent_id)
+
+
+def parse_gff3_features(in_gff: Union[PathLike, Iterable[str]]) -> Iterator[Tuple[str, List[GFFFeature]]]:
+    """Yields the name and top-level features of each seq_region of a GFF3 file, sorted by name.
+
+    The whole file is loaded before the first seq_region is yielded, since the features of a seq_region
+    can be anywhere in the file. The parsing stops at the `##FASTA` directive.
+
+    Args:
+        in_gff: Path to the GFF3 file (can be compressed with gzip), or its lines.
+
+    Raises:
+        GFFFeatureError: If a line does not have 9 columns, or if a feature is not contained in any of the
+            top-level features with the ID of its parent.
+    """
+    hierarchy = _FeatureHierarchy()
+
+    def _add_lines(lines: Iterable[str]) -> None:
+        for line in lines:
+            if line.startswith("#"):
+                if line.startswith("##FASTA"):
+                    break
+                continue
+            if not line.strip():
+                continue
+            hierarchy.add(GFFFeature.from_line(line))
+
+    if isinstance(in_gff, (str, PathLike)):
+        with open_gz_file(Path(in_gff)) as in_gff_fh:
+            _add_lines(in_gff_fh)
+    else:
+        _add_lines(in_gff)
+
+    top_features = hierarchy.build()
+    del hierarchy
+    for seq_id in sorted(top_features):
+        yield seq_id, top_features.pop(seq_id)
+
+
+def to_seq_feature(feature: GFFFeature) -> SeqFeature:
+    """Returns a Biopython feature (with its sub-features) equivalent to the one of the BCBio GFF parser.
+
+    Args:
+        feature: Feature to convert.
+    """
+    seq_feature = SeqFeature(
+        SimpleLocation(feature.start - 1, feature.end, strand=feature.strand),
+        type=feature.type,
+        id=feature.id,
+        qualifiers=feature.qualifiers,
+    )
+    seq_feature.sub_features = [to_seq_feature(sub_feature) for sub_feature in feature.sub_features]
+    return seq_feature
+
+
+def from_seq_feature(seq_feature: SeqFeature, seq_id: str) -> GFFFeature:
+    """Returns the compact version of a Biopython feature (with its sub-features).
+
+    Args:
+        seq_feature: Feature to convert.
+        seq_id: Name of the seq_region of the feature.
+    """
+    qualifiers = dict(seq_feature.qualifiers)
+    source = _pop_single_value(qualifiers, "source")
+    score = _pop_single_value(qualifiers, "score")
+    phase = _pop_single_value(qualifiers, "phase")
+    attributes = ";".join(
+        f"{key}={','.join(quote(str(value), safe=':/ ') for value in values)}"
+        for key, values in qualifiers.items()
+    )
+    feature = GFFFeature(
+        seq_id,
+        source,
+        seq_feature.type,
+        int(seq_feature.location.start) + 1,
+        int(seq_feature.location.end),
+        score=score,
+        strand=seq_feature.location.strand,
+        phase=phase,
+        attributes=attributes,
+    )
+    if seq_feature.id and seq_feature.id != feature.id:
+        feature.id = seq_feature.id
+    for sub_feature in getattr(seq_feature, "sub_features", []):
+        feature.add_sub_feature(from_seq_feature(sub_feature, seq_id))
+    return feature
+
+
+def _pop_single_value(qualifiers: Dict[str, List[str]], key: str) -> Optional[str]:
+    """Removes a qualifier with a single value, and returns its value."""
+    values = qualifiers.get(key)
+    if values is None or len(values) != 1:
+        return None
+    del qualifiers[key]
+    return str(values[0])
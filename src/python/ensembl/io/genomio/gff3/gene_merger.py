@@ -22,84 +22,94 @@ import logging
 from os import PathLike
 from pathlib import Path
 import re
-from typing import List
+from typing import Iterable, Iterator, List, Optional
 
-from importlib_resources import files
-
-import ensembl.io.genomio.data.gff3
-from ensembl.io.genomio.utils.json_utils import get_json
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+from .biotypes import get_biotype_registry
 
 
 class GFFGeneMerger:
     """Specialized class to merge split genes in a GFF3 file, prior to further parsing."""
 
     def __init__(self) -> None:
-        biotypes_json = files(ensembl.io.genomio.data.gff3) / "biotypes.json"
-        self._biotypes = get_json(biotypes_json)
+        self._biotypes = get_biotype_registry()
 
     def merge(self, in_gff_path: PathLike, out_gff_path: PathLike) -> List[str]:
         """
         Merge genes in a gff that are split in multiple lines.
 
         Args:
-            in_gff_path: Input GFF3 that may have split merge.
+            in_gff_path: Input GFF3 that may have split merge (can be compressed with gzip).
             out_gff_path: Output GFF3 with those genes merged.
 
         Returns:
             List of all merged genes, each represented as a string of the GFF3 lines of all their parts.
         """
-        to_merge = []
         merged: List[str] = []
+        with open_gz_file(in_gff_path) as in_gff_fh, Path(out_gff_path).open("w") as out_gff_fh:
+            out_gff_fh.writelines(self.merge_lines(in_gff_fh, merged))
+        return merged
 
-        with Path(in_gff_path).open("r") as in_gff_fh, Path(out_gff_path).open("w") as out_gff_fh:
-            for line in in_gff_fh:
-                # Skip comments
-                if line.startswith("#"):
-                    if line.startswith("##FASTA"):
-                        logging.warning("This GFF3 file contains FASTA sequences")
-                        break
-                    out_gff_fh.write(line)
+    def merge_lines(self, lines: Iterable[str], merged: Optional[List[str]] = None) -> Iterator[str]:
+        """Yields the lines of a GFF3 file, with the genes split in multiple lines merged in one line.
+
+        The lines are filtered as they are read, so they can be fed to a parser without writing them
+        to a file first.
+
+        Args:
+            lines: Lines of a GFF3 file that may have split genes.
+            merged: List where each merged gene is added, represented as a string of the GFF3 lines of
+                all its parts.
+
+        """
+        if merged is None:
+            merged = []
+        num_merged = len(merged)
+        to_merge = []
+
+        for line in lines:
+            # Skip comments
+            if line.startswith("#"):
+                if line.startswith("##FASTA"):
+                    logging.warning("This GFF3 file contains FASTA sequences")
+                    break
+                yield line
+            else:
+                # Parse one line
+                line = line.rstrip()
+                fields = line.split("\t")
+                attr_fields = fields[8].split(";")
+                attrs = {}
+                for a in attr_fields:
+                    (key, value) = a.split("=")
+                    attrs[key] = value
+
+                # Check this is a gene to merge; cache it then
+                if fields[2] in self._biotypes.gene_types and ("part" in attrs or "is_ordered" in attrs):
+                    to_merge.append(fields)
+
+                # If not, merge previous gene if needed, and print the line
                 else:
-                    # Parse one line
-                    line = line.rstrip()
-                    fields = line.split("\t")
-                    attr_fields = fields[8].split(";")
-                    attrs = {}
-                    for a in attr_fields:
-                        (key, value) = a.split("=")
-                        attrs[key] = value
-
-                    # Check this is a gene to merge; cache it then
-                    if fields[2] in self._biotypes["gene"]["supported"] and (
-                        "part" in attrs or "is_ordered" in attrs
-                    ):
-                        to_merge.append(fields)
-
-                    # If not, merge previous gene if needed, and print the line
-                    else:
-                        if to_merge:
-                            merged_str = []
-                            for line_to_merge in to_merge:
-                                merged_str.append("\t".join(line_to_merge))
-                            merged.append("\n".join(merged_str) + "\n")
-
-                            new_line = self._merge_genes(to_merge)
-                            out_gff_fh.write(new_line)
-                            to_merge = []
-                        out_gff_fh.write(line + "\n")
-
-            # Print last merged gene if there is one
-            if to_merge:
-                merged_str = []
-                for line_to_merge in to_merge:
-                    merged_str.append("\t".join(line_to_merge))
-                merged.append("\n".join(merged_str) + "\n")
-
-                new_line = self._merge_genes(to_merge)
-                out_gff_fh.write(new_line)
-
-        logging.debug(f"Merged lines: {len(merged)}")
-        return merged
+                    if to_merge:
+                        merged_str = []
+                        for line_to_merge in to_merge:
+                            merged_str.append("\t".join(line_to_merge))
+                        merged.append("\n".join(merged_str) + "\n")
+
+                        yield self._merge_genes(to_merge)
+                        to_merge = []
+                    yield line + "\n"
+
+        # Print last merged gene if there is one
+        if to_merge:
+            merged_str = []
+            for line_to_merge in to_merge:
+                merged_str.append("\t".join(line_to_merge))
+            merged.append("\n".join(merged_str) + "\n")
+
+            yield self._merge_genes(to_merge)
+
+        logging.debug(f"Merged lines: {len(merged) - num_merged}")
 
     def _merge_genes(self, to_merge: List) -> str:
         """Returns a single gene gff3 line merged from separate parts.
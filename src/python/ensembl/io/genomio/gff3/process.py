@@ -15,16 +15,51 @@
 """Simplify and fix a GFF3 file and returns both a cleaned up GFF3 file and a functional annotation JSON file.
 """
 
+from argparse import Namespace
 import logging
 from pathlib import Path
+from typing import List, Tuple
 
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
 
 from .simplifier import GFFSimplifier
+from .streaming import GFFStreamingError, stream_simpler_gff3
 from .gene_merger import GFFGeneMerger
 
 
+def _simplify_gff3(args: Namespace, stream: bool) -> Tuple[GFFSimplifier, List[str]]:
+    """Writes the simpler version of the input GFF3 file, and returns the simplifier and merged genes.
+
+    Args:
+        args: Parsed command line arguments.
+        stream: Simplify and write one seq_region at a time instead of loading the whole GFF3 file.
+
+    Raises:
+        GFFStreamingError: If streaming, and the GFF3 file cannot be read one seq_region at a time.
+    """
+    # Merge multiline gene features while reading the GFF3 file, and load the merged lines to write a
+    # simpler version that follows our specifications as well as a functional annotation JSON file
+    merger = GFFGeneMerger()
+    merged_genes: List[str] = []
+    gff_data = GFFSimplifier(args.genome_data, args.make_missing_stable_ids)
+    with open_gz_file(args.in_gff_path) as in_gff_fh:
+        in_gff_lines = merger.merge_lines(in_gff_fh, merged_genes)
+        if stream:
+            stream_simpler_gff3(
+                gff_data,
+                in_gff_lines,
+                args.out_gff_path,
+                workers=args.workers,
+                compress_threads=args.compress_threads,
+            )
+        else:
+            gff_data.simpler_gff3(in_gff_lines)
+            gff_data.records.to_gff(args.out_gff_path, compress_threads=args.compress_threads)
+    return gff_data, merged_genes
+
+
 def main() -> None:
     """Main script entry-point."""
     parser = ArgumentParser(
@@ -33,42 +68,62 @@ def main() -> None:
             "annotation in a separate file."
         )
     )
-    parser.add_argument_src_path("--in_gff_path", required=True, help="Input GFF3 file")
+    parser.add_argument_src_path(
+        "--in_gff_path", required=True, help="Input GFF3 file (can be compressed with gzip)"
+    )
     parser.add_argument_src_path("--genome_data", required=True, help="Genome JSON file")
     parser.add_argument(
         "--make_missing_stable_ids", action="store_true", help="Generate stable IDs when missing or invalid"
     )
-    parser.add_argument_dst_path("--out_gff_path", default=Path("gene_models.gff3"), help="Output GFF3 file")
+    parser.add_argument_dst_path(
+        "--out_gff_path",
+        default=Path("gene_models.gff3"),
+        help="Output GFF3 file (compressed with gzip if it ends with '.gz')",
+    )
     parser.add_argument_dst_path(
         "--out_func_path",
         default=Path("functional_annotation.json"),
         help="Output functional annotation JSON file",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Simplify and write one seq_region at a time instead of loading the whole GFF3 file (the "
+        "seq_regions are written in the input order). Falls back to loading the whole file if the lines of "
+        "a seq_region are not contiguous, or if the file contains sequences",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to simplify the seq_regions in parallel (only with --stream)",
+    )
+    parser.add_argument(
+        "--compress_threads",
+        type=int,
+        default=1,
+        help="Number of threads used to compress the output GFF3 file (with pigz if it is installed)",
+    )
     parser.add_log_arguments(add_log_file=True)
     args = parser.parse_args()
+    if args.workers > 1 and not args.stream:
+        parser.error("--workers can only be used with --stream")
     init_logging_with_args(args)
 
-    # Merge multiline gene features in a separate file
-    logging.info("Checking for genes to merge...")
-    interim_gff_path = Path(f"{args.in_gff_path}_INTERIM_MERGE")
-    merger = GFFGeneMerger()
-    merged_genes = merger.merge(args.in_gff_path, interim_gff_path)
+    logging.info("Merge split genes, simplify and fix GFF3")
+    if args.stream:
+        try:
+            gff_data, merged_genes = _simplify_gff3(args, stream=True)
+        except GFFStreamingError as error:
+            logging.warning(f"Cannot stream the GFF3 file, loading it whole instead: {error}")
+            gff_data, merged_genes = _simplify_gff3(args, stream=False)
+    else:
+        gff_data, merged_genes = _simplify_gff3(args, stream=False)
     num_merged_genes = len(merged_genes)
-    in_gff_path = args.in_gff_path
-    # If there are split genes, decide to merge, or just die
     if num_merged_genes > 0:
         # Report the list of merged genes in case something does not look right
         logging.info(f"{num_merged_genes} genes merged")
         logging.debug("\n".join(merged_genes))
-        # Use the GFF with the merged genes for the next part
-        in_gff_path = interim_gff_path
-
-    # Load GFF3 data and write a simpler version that follows our specifications as well as a
-    # functional annotation JSON file
-    logging.info("Simplify and fix GFF3")
-    gff_data = GFFSimplifier(args.genome_data, args.make_missing_stable_ids)
-    gff_data.simpler_gff3(in_gff_path)
-    gff_data.records.to_gff(args.out_gff_path)
     gff_data.annotations.to_json(args.out_func_path)
 
 
@@ -17,40 +17,64 @@ in a separate file.
 """
 
 __all__ = [
+    "GFFInput",
     "Records",
     "GFFParserError",
     "GFFSimplifier",
 ]
 
 from collections import Counter
+from io import IOBase, TextIOBase
 import json
 import logging
 from os import PathLike
 from pathlib import Path
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Union
 
 from BCBio import GFF
 from Bio.SeqRecord import SeqRecord
 from Bio.SeqFeature import SeqFeature
-from importlib_resources import files
-
-import ensembl.io.genomio.data.gff3
-from ensembl.io.genomio.utils.json_utils import get_json
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+from .biotypes import RootType, get_biotype_registry
 from .extract_annotation import FunctionalAnnotations
+from .writer import write_gff3
+
+
+GFFInput = Union[PathLike, Iterable[str]]
 
 
 class Records(list):
     """List of GFF3 SeqRecords."""
 
-    def to_gff(self, out_gff_path: PathLike) -> None:
+    def to_gff(self, out_gff_path: PathLike, compress_threads: int = 1) -> None:
         """Print out the current list of records in a GFF3 file.
 
         Args:
-            out_gff_path: Path to GFF3 file where to write the records.
+            out_gff_path: Path to GFF3 file where to write the records (compressed if it ends with `.gz`).
+            compress_threads: Number of threads used to compress the output.
         """
-        with Path(out_gff_path).open("w") as out_gff_fh:
-            GFF.write(self, out_gff_fh)
+        write_gff3(self, out_gff_path, threads=compress_threads)
+
+
+class _LinesReader(TextIOBase):
+    """Read-only text handle over lines, that are only pulled from them when they are read.
+
+    Lets the GFF3 parser read lines as they are produced (e.g. by `GFFGeneMerger.merge_lines()`),
+    without joining them in a single string first.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        super().__init__()
+        self._lines = iter(lines)
+
+    def readable(self) -> bool:
+        return True
+
+    # Text handles return str lines, unlike the binary IOBase it also derives from
+    def readline(self, _size: int = -1, /) -> str:  # type: ignore[override]
+        """Returns the next whole line, or an empty string once all the lines have been read."""
+        return next(self._lines, "")
 
 
 class GFFParserError(Exception):
@@ -79,8 +103,7 @@ class GFFSimplifier:
     current_stable_id_number: int = 0
 
     def __init__(self, genome_path: Optional[PathLike] = None, make_missing_stable_ids: bool = False):
-        biotypes_json = files(ensembl.io.genomio.data.gff3) / "biotypes.json"
-        self._biotypes = get_json(biotypes_json)
+        self._biotypes = get_biotype_registry()
         self.records = Records()
         self.annotations = FunctionalAnnotations()
         self.genome = {}
@@ -89,29 +112,55 @@ class GFFSimplifier:
                 self.genome = json.load(genome_fh)
         self.make_missing_stable_ids: bool = make_missing_stable_ids
 
-    def simpler_gff3(self, in_gff_path: PathLike) -> None:
+    def simpler_gff3(self, in_gff: GFFInput) -> None:
         """Loads a GFF3 from INSDC and rewrites it in a simpler version, whilst also writing a
         functional annotation file.
+
+        Args:
+            in_gff: Path to the GFF3 file to simplify (can be compressed with gzip), or its lines.
         """
 
-        with Path(in_gff_path).open("r") as in_gff_fh:
-            for record in GFF.parse(in_gff_fh):
-                if record.id in self.exclude_seq_regions:
-                    logging.debug(f"Skip seq_region {record.id}")
-                    continue
+        if isinstance(in_gff, (str, PathLike)):
+            with open_gz_file(Path(in_gff)) as in_gff_fh:
+                self.simpler_gff3(in_gff_fh)
+            return
 
-                # Clean all root features and make clean record
-                clean_record = SeqRecord(record.seq, id=record.id)
-                for feature in record.features:
-                    clean_feature = self.simpler_gff3_feature(feature)
-                    if clean_feature is not None:
-                        clean_record.features.append(clean_feature)
+        gff_handle = in_gff if isinstance(in_gff, IOBase) else _LinesReader(in_gff)
+        for record in GFF.parse(gff_handle):
+            clean_record = self.simpler_gff3_record(record)
+            if clean_record is not None:
                 self.records.append(clean_record)
 
-            if self.fail_types:
-                fail_errors = "\n   ".join(self.fail_types.keys())
-                if self.skip_unrecognized:
-                    raise GFFParserError(f"Unrecognized types found:\n   {fail_errors}")
+        self.check_fail_types()
+
+    def simpler_gff3_record(self, record: SeqRecord) -> Optional[SeqRecord]:
+        """Returns a clean record with a simpler version of all the root features of a record.
+
+        If the seq_region of the record is excluded, returns None.
+
+        """
+        if record.id in self.exclude_seq_regions:
+            logging.debug(f"Skip seq_region {record.id}")
+            return None
+
+        # Clean all root features and make clean record
+        clean_record = SeqRecord(record.seq, id=record.id)
+        for feature in record.features:
+            clean_feature = self.simpler_gff3_feature(feature)
+            if clean_feature is not None:
+                clean_record.features.append(clean_feature)
+        return clean_record
+
+    def check_fail_types(self) -> None:
+        """Raises an error if there were unrecognized types.
+
+        Raises:
+            GFFParserError: If unrecognized types were found and they are not skipped.
+        """
+        if self.fail_types:
+            fail_errors = "\n   ".join(self.fail_types.keys())
+            if self.skip_unrecognized:
+                raise GFFParserError(f"Unrecognized types found:\n   {fail_errors}")
 
     def simpler_gff3_feature(self, feat: SeqFeature) -> Optional[SeqFeature]:
         """Creates a simpler version of a GFF3 feature.
@@ -120,17 +169,14 @@ class GFFSimplifier:
 
         """
 
-        ignored_gene_types = self._biotypes["gene"]["ignored"]
-        allowed_non_gene_types = self._biotypes["non_gene"]["supported"]
-        allowed_gene_types = self._biotypes["gene"]["supported"]
-        transcript_types = self._biotypes["transcript"]["supported"]
+        root_type = self._biotypes.get_root_type(feat.type)
 
         # Skip explictly ignored features
-        if feat.type in ignored_gene_types:
+        if root_type is RootType.IGNORED:
             return None
 
         # Special processing of non-gene features
-        if feat.type in allowed_non_gene_types:
+        if root_type is RootType.NON_GENE:
             if feat.type in ("mobile_genetic_element", "transposable_element"):
                 feat = self.format_mobile_element(feat)
                 return feat
@@ -143,13 +189,13 @@ class GFFSimplifier:
             gene.type = "gene"
 
         # Create actual genes from transcripts/CDS top level features
-        if gene.type in transcript_types:
+        if root_type is RootType.TRANSCRIPT:
             gene = self.transcript_gene(gene)
         elif gene.type == "CDS":
             gene = self.cds_gene(gene)
 
         # What to do with unsupported gene types
-        if gene.type not in allowed_gene_types:
+        if gene.type not in self._biotypes.gene_types:
             self.fail_types["gene=" + gene.type] = 1
             logging.debug(f"Unsupported gene type: {gene.type} (for {gene.id})")
             if self.skip_unrecognized:
@@ -336,16 +382,11 @@ class GFFSimplifier:
     def _normalize_transcripts(self, gene: SeqFeature) -> SeqFeature:
         """Returns a normalized transcript."""
 
-        allowed_transcript_types = self._biotypes["transcript"]["supported"]
-        ignored_transcript_types = self._biotypes["transcript"]["ignored"]
         skip_unrecognized = self.skip_unrecognized
 
         transcripts_to_delete = []
         for count, transcript in enumerate(gene.sub_features):
-            if (
-                transcript.type not in allowed_transcript_types
-                and transcript.type not in ignored_transcript_types
-            ):
+            if not self._biotypes.is_known_transcript_type(transcript.type):
                 self.fail_types["transcript=" + transcript.type] = 1
                 logging.warning(
                     f"Unrecognized transcript type: {transcript.type}" f" for {transcript.id} ({gene.id})"
@@ -371,7 +412,7 @@ class GFFSimplifier:
 
     def _normalize_transcript_subfeatures(self, gene: SeqFeature, transcript: SeqFeature) -> SeqFeature:
         """Returns a transcript with normalized sub-features."""
-        ignored_transcript_types = self._biotypes["transcript"]["ignored"]
+        ignored_transcript_types = self._biotypes.ignored_transcript_types
         exons_to_delete = []
         exon_number = 1
         for tcount, feat in enumerate(transcript.sub_features):
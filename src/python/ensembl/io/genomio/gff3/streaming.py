@@ -0,0 +1,211 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Simplify a GFF3 file one seq_region at a time, optionally in parallel, instead of loading it at once."""
+
+__all__ = [
+    "GFFStreamingError",
+    "iter_seq_region_lines",
+    "simpler_gff3_lines",
+    "stream_simpler_gff3",
+]
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+import copy
+from io import StringIO
+from os import PathLike
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Set, Tuple
+
+from BCBio import GFF
+from Bio.SeqRecord import SeqRecord
+
+from ensembl.io.genomio.utils.archive_utils import open_gz_file
+from .extract_annotation import FunctionalAnnotations
+from .simplifier import GFFInput, GFFParserError, GFFSimplifier, Records
+from .writer import write_gff3
+
+
+class GFFStreamingError(GFFParserError):
+    """Error when the lines of a GFF3 file cannot be read one seq_region at a time."""
+
+
+def stream_simpler_gff3(
+    simplifier: GFFSimplifier,
+    in_gff: GFFInput,
+    out_gff_path: PathLike,
+    workers: int = 1,
+    compress_threads: int = 1,
+) -> None:
+    """Loads a GFF3 from INSDC and writes a simpler version of it one seq_region at a time.
+
+    Each seq_region is parsed and written as soon as all its lines have been read, so only one
+    seq_region is kept in memory instead of the whole annotation. The functional annotation is still
+    accumulated in the `annotations` of the simplifier, and its `records` are left empty.
+
+    The lines of each seq_region must be contiguous in the input file. Unlike `simpler_gff3()`, the
+    seq_regions are written in the order of the input file instead of being sorted by name.
+
+    With more than one worker, the seq_regions are simplified in parallel (see `_parallel_clean_records()`),
+    and the output is identical to the one of a single worker.
+
+    Args:
+        simplifier: Simplifier to use, which will hold the functional annotation.
+        in_gff: Path to the GFF3 file to simplify (can be compressed with gzip), or its lines, e.g.
+            as they are filtered by `GFFGeneMerger.merge_lines()`.
+        out_gff_path: Path to the GFF3 file to write (compressed with gzip if it ends with `.gz`).
+        workers: Number of processes used to simplify the seq_regions.
+        compress_threads: Number of threads used to compress the output.
+
+    Raises:
+        GFFStreamingError: If the lines of a seq_region are not contiguous, or if the file contains
+            sequences.
+    """
+    if isinstance(in_gff, (str, PathLike)):
+        with open_gz_file(Path(in_gff)) as in_gff_fh:
+            stream_simpler_gff3(simplifier, in_gff_fh, out_gff_path, workers, compress_threads)
+        return
+
+    if workers > 1:
+        records = _parallel_clean_records(simplifier, in_gff, workers)
+    else:
+        records = _clean_records(simplifier, in_gff)
+    # The GFF3 writer consumes the records one by one, so each is written as soon as it is ready
+    write_gff3(records, out_gff_path, threads=compress_threads)
+    simplifier.check_fail_types()
+
+
+def _clean_records(simplifier: GFFSimplifier, in_gff_lines: Iterable[str]) -> Iterator[SeqRecord]:
+    """Yields the simplified record of each seq_region of a GFF3 file, parsing one seq_region at a time.
+
+    Args:
+        simplifier: Simplifier to use.
+        in_gff_lines: Lines of the GFF3 file to simplify.
+    """
+    for lines in iter_seq_region_lines(in_gff_lines):
+        for record in GFF.parse(StringIO("".join(lines))):
+            clean_record = simplifier.simpler_gff3_record(record)
+            if clean_record is not None:
+                yield clean_record
+
+
+def _parallel_clean_records(
+    simplifier: GFFSimplifier, in_gff_lines: Iterable[str], workers: int
+) -> Iterator[SeqRecord]:
+    """Yields the simplified record of each seq_region of a GFF3 file, simplified in parallel.
+
+    The seq_regions are sent to a pool of processes and their results are merged back in the order of
+    the input file, with at most two seq_regions per worker waiting to be merged at any time.
+
+    Generated stable IDs depend on how many were generated in the previous seq_regions. Each
+    seq_region is simplified assuming the ones still being processed will not generate any stable ID.
+    If that turns out to be wrong for a seq_region that does generate stable IDs, it is simplified
+    again from the right stable ID number once all the previous seq_regions have been merged.
+
+    Args:
+        simplifier: Simplifier to use, to which the functional annotation is added.
+        in_gff_lines: Lines of the GFF3 file to simplify.
+        workers: Number of processes used to simplify the seq_regions.
+
+    """
+    # Only send a copy of the simplifier without any record or annotation to each worker
+    template = copy.copy(simplifier)
+    template.records = Records()
+    template.annotations = FunctionalAnnotations()
+    template.fail_types = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: Deque[Tuple[List[str], int, Future]] = deque()
+
+        def _merge_next() -> Iterator[SeqRecord]:
+            lines, stable_id_number, future = pending.popleft()
+            records, annotations, fail_types, num_stable_ids = future.result()
+            if num_stable_ids and stable_id_number != simplifier.current_stable_id_number:
+                stable_id_number = simplifier.current_stable_id_number
+                future = executor.submit(simpler_gff3_lines, template, lines, stable_id_number)
+                records, annotations, fail_types, num_stable_ids = future.result()
+            simplifier.current_stable_id_number += num_stable_ids
+            simplifier.annotations.merge(annotations)
+            for fail_type in fail_types:
+                simplifier.fail_types[fail_type] = 1
+            yield from records
+
+        for lines in iter_seq_region_lines(in_gff_lines):
+            stable_id_number = simplifier.current_stable_id_number
+            future = executor.submit(simpler_gff3_lines, template, lines, stable_id_number)
+            pending.append((lines, stable_id_number, future))
+            if len(pending) >= 2 * workers:
+                yield from _merge_next()
+        while pending:
+            yield from _merge_next()
+
+
+def simpler_gff3_lines(
+    simplifier: GFFSimplifier, lines: List[str], stable_id_number: int = 0
+) -> Tuple[List[SeqRecord], FunctionalAnnotations, Dict[str, int], int]:
+    """Simplifies the GFF3 lines of one seq_region on their own, e.g. in a separate process.
+
+    The annotations and failed types of the simplifier are replaced by the ones of this seq_region, and
+    returned with its records.
+
+    Args:
+        simplifier: Simplifier to use.
+        lines: GFF3 lines of one seq_region.
+        stable_id_number: Number of the last stable ID generated before this seq_region.
+
+    Returns:
+        The simplified records, their functional annotation, the unsupported types found, and the
+        number of stable IDs generated.
+    """
+    simplifier.annotations = FunctionalAnnotations()
+    simplifier.fail_types = {}
+    simplifier.current_stable_id_number = stable_id_number
+    records = list(_clean_records(simplifier, lines))
+    num_stable_ids = simplifier.current_stable_id_number - stable_id_number
+    return records, simplifier.annotations, simplifier.fail_types, num_stable_ids
+
+
+def iter_seq_region_lines(in_gff_lines: Iterable[str]) -> Iterator[List[str]]:
+    """Yields the feature lines of each seq_region of a GFF3 file, one seq_region at a time.
+
+    Comments, directives and empty lines are skipped.
+
+    Args:
+        in_gff_lines: Lines of the GFF3 file to read.
+
+    Raises:
+        GFFStreamingError: If the lines of a seq_region are not contiguous, or if the file contains
+            sequences.
+    """
+    seen_seq_regions: Set[str] = set()
+    seq_region_lines: List[str] = []
+    for line in in_gff_lines:
+        if line.startswith("#"):
+            if line.startswith("##FASTA"):
+                raise GFFStreamingError("Sequences in GFF3 files cannot be parsed by seq_region")
+            continue
+        if not line.strip():
+            continue
+        seq_region = line.split("\t", 1)[0]
+        if seq_region_lines and seq_region != seq_region_lines[0].split("\t", 1)[0]:
+            yield seq_region_lines
+            seq_region_lines = []
+        if not seq_region_lines:
+            if seq_region in seen_seq_regions:
+                raise GFFStreamingError(f"The lines of seq_region {seq_region} are not contiguous")
+            seen_seq_regions.add(seq_region)
+        seq_region_lines.append(line)
+    if seq_region_lines:
+        yield seq_region_lines
@@ -0,0 +1,252 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fast GFF3 writer for Biopython records, with the same output as `BCBio.GFF.write()`."""
+
+__all__ = [
+    "GFF3Writer",
+    "write_gff3",
+]
+
+from contextlib import ExitStack
+from os import PathLike
+from pathlib import Path
+import re
+from types import TracebackType
+from typing import Any, Dict, IO, Iterable, List, Optional, Set, Type
+from urllib.parse import quote
+
+from Bio import SeqIO
+from Bio.SeqFeature import SeqFeature
+from Bio.SeqRecord import SeqRecord
+
+from ensembl.io.genomio.utils.archive_utils import open_gz_output
+
+
+_STANDARD_QUALIFIERS = ("source", "score", "phase")
+# Characters that are never quoted in the attributes values
+_UNQUOTED_RE = re.compile(r"[A-Za-z0-9_.\-~:/ ]*")
+
+
+class GFF3Writer:
+    """Writes SeqRecords and their features (with their sub_features) to a GFF3 file, one record at a time.
+
+    The output is the same as the one of `BCBio.GFF.write()`: same columns, same attributes sorted by
+    key and quoted the same way, and the same IDs generated for features with children but without ID.
+    Unlike BCBio, the qualifiers of the features are not modified.
+
+    Can be used as a context manager::
+
+        with GFF3Writer(out_path) as writer:
+            for record in records:
+                writer.write_record(record)
+
+    """
+
+    def __init__(
+        self,
+        out_path: PathLike,
+        compress: Optional[bool] = None,
+        include_fasta: bool = False,
+        compress_level: int = 6,
+        threads: int = 1,
+    ) -> None:
+        """
+        Args:
+            out_path: Path to the GFF3 file to write.
+            compress: Compress the output with gzip. By default, only if the path ends with `.gz`.
+            include_fasta: Add the sequences of the records at the end of the file, after `##FASTA`.
+            compress_level: Compression level for gzip, from 1 (fastest) to 9 (smallest).
+            threads: Number of threads used to compress the output (with `pigz` if it is installed).
+        """
+        self.out_path = Path(out_path)
+        self.include_fasta = include_fasta
+        self._fasta_records: List[SeqRecord] = []
+        self._seen_ids: Set[str] = set()
+        self._id_counter = 1
+        self._exit_stack = ExitStack()
+        self._out_fh: IO[str] = self._exit_stack.enter_context(
+            open_gz_output(self.out_path, compress=compress, threads=threads, compress_level=compress_level)
+        )
+        self._out_fh.write("##gff-version 3\n")
+
+    def __enter__(self) -> "GFF3Writer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Writes the sequences (if requested) and closes the file."""
+        if self._out_fh.closed:
+            return
+        if self._fasta_records:
+            self._out_fh.write("##FASTA\n")
+            SeqIO.write(self._fasta_records, self._out_fh, "fasta")
+            self._fasta_records = []
+        self._exit_stack.close()
+
+    def write_records(self, records: Iterable[SeqRecord]) -> None:
+        """Writes records one by one, so they can be generated while they are written.
+
+        Args:
+            records: Records to write.
+        """
+        for record in records:
+            self.write_record(record)
+
+    def write_record(self, record: SeqRecord) -> None:
+        """Writes one record: its `##sequence-region` directive, annotations and features.
+
+        Args:
+            record: Record to write.
+        """
+        lines: List[str] = []
+        seq_length = len(record.seq)
+        if seq_length > 0:
+            lines.append(f"##sequence-region {record.id} 1 {seq_length}\n")
+        annotations = self._format_attributes(record.annotations)
+        if annotations:
+            size = str(seq_length if seq_length > 1 else 1)
+            lines.append(
+                "\t".join([record.id, "annotation", "remark", "1", size, ".", ".", ".", annotations])
+            )
+            lines.append("\n")
+        for feature in record.features:
+            self._add_feature_lines(feature, str(record.id), lines)
+        self._out_fh.write("".join(lines))
+        if self.include_fasta and seq_length > 0:
+            self._fasta_records.append(record)
+
+    def _add_feature_lines(
+        self, feature: SeqFeature, rec_id: str, lines: List[str], parent_id: Optional[str] = None
+    ) -> None:
+        """Adds the GFF3 line of a feature and the ones of its sub-features to a list of lines."""
+        qualifiers = {key: _as_str_list(value) for key, value in feature.qualifiers.items()}
+        sub_features = getattr(feature, "sub_features", [])
+
+        strand = feature.location.strand
+        if strand == 1:
+            strand_str = "+"
+        elif strand == -1:
+            strand_str = "-"
+        else:
+            strand_str = "."
+
+        if "phase" in qualifiers:
+            phase = qualifiers["phase"][0]
+        elif feature.type == "CDS":
+            phase = str(int(qualifiers.get("codon_start", [1])[0]) - 1)
+        else:
+            phase = "."
+        source = qualifiers.get("source", ["feature"])[0]
+        score = qualifiers.get("score", ["."])[0]
+
+        # Remove standard fields from the attributes, and add the link to the parent
+        attributes = dict(qualifiers)
+        for std_qual in _STANDARD_QUALIFIERS:
+            if std_qual in attributes and len(attributes[std_qual]) == 1:
+                del attributes[std_qual]
+        if parent_id:
+            attributes["Parent"] = attributes.get("Parent", []) + [parent_id]
+        self._update_id(attributes, bool(sub_features))
+
+        parts = [
+            rec_id,
+            source,
+            feature.type if feature.type else "sequence_feature",
+            str(feature.location.start + 1),
+            str(feature.location.end),
+            score,
+            strand_str,
+            phase,
+            self._format_attributes(attributes),
+        ]
+        lines.append("\t".join(parts))
+        lines.append("\n")
+        for sub_feature in sub_features:
+            self._add_feature_lines(sub_feature, rec_id, lines, attributes["ID"][0])
+
+    def _update_id(self, attributes: Dict[str, List[str]], has_children: bool) -> None:
+        """Records the ID of a feature, or generates one if it has children but no ID."""
+        feat_ids = attributes.get("ID")
+        if feat_ids:
+            self._seen_ids.update(feat_ids)
+        elif has_children:
+            new_id = None
+            for id_key in ("transcript_id", "protein_id"):
+                if id_key in attributes:
+                    new_id = attributes[id_key][0]
+                    break
+            if new_id is None:
+                while True:
+                    new_id = f"biopygen{self._id_counter}"
+                    if new_id not in self._seen_ids:
+                        break
+                    self._id_counter += 1
+            self._seen_ids.add(new_id)
+            attributes["ID"] = [new_id]
+
+    @staticmethod
+    def _format_attributes(attributes: Dict[str, Any]) -> str:
+        """Returns the attributes column: keys sorted, values quoted, without empty or duplicated values."""
+        formatted = []
+        for key in sorted(attributes.keys()):
+            values = attributes[key]
+            key = key.strip()
+            if not isinstance(values, list):
+                values = [values]
+            formatted_values: List[str] = []
+            for value in values:
+                value = str(value).strip()
+                if not _UNQUOTED_RE.fullmatch(value):
+                    value = quote(value, safe=":/ ")
+                if key and value and value not in formatted_values:
+                    formatted_values.append(value)
+            formatted.append(f"{key}={','.join(formatted_values)}")
+        return ";".join(formatted)
+
+
+def _as_str_list(value: Any) -> List[str]:
+    """Returns a qualifier value as a list of strings."""
+    if isinstance(value, list) and all(isinstance(x, str) for x in value):
+        return value
+    if not isinstance(value, (list, tuple)):
+        value = [value]
+    return [str(x) for x in value]
+
+
+def write_gff3(
+    records: Iterable[SeqRecord],
+    out_path: PathLike,
+    compress: Optional[bool] = None,
+    include_fasta: bool = False,
+    threads: int = 1,
+) -> None:
+    """Writes records to a GFF3 file, one by one.
+
+    Args:
+        records: Records to write, e.g. a generator.
+        out_path: Path to the GFF3 file to write.
+        compress: Compress the output with gzip. By default, only if the path ends with `.gz`.
+        include_fasta: Add the sequences of the records at the end of the file, after `##FASTA`.
+        threads: Number of threads used to compress the output (with `pigz` if it is installed).
+    """
+    with GFF3Writer(out_path, compress=compress, include_fasta=include_fasta, threads=threads) as writer:
+        writer.write_records(records)
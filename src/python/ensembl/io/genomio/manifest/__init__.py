@@ -17,3 +17,6 @@
 from .check_integrity import *
 from .compute_stats import *
 from .generate import *
+from .integrity_cache import *
+from .integrity_gff3 import *
+from .integrity_report import *
@@ -18,19 +18,21 @@ to ensure their contents are in sync.
 
 __all__ = ["InvalidIntegrityError", "Manifest", "IntegrityTool"]
 
-import hashlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import copy
 import logging
 import json
-from math import floor
 from os import PathLike
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional
-
-from BCBio import GFF
-from Bio import SeqIO, SeqFeature
-
-from ensembl.io.genomio.utils import get_json, open_gz_file
+import time
+from typing import Any, ContextManager, Dict, Iterable, List, Optional
+
+from ensembl.io.genomio.fasta import scan_fasta
+from ensembl.io.genomio.manifest.integrity_cache import IntegrityCache
+from ensembl.io.genomio.manifest.integrity_gff3 import GFF3Lengths
+from ensembl.io.genomio.manifest.integrity_report import check_record, peak_rss, stage_stats
+from ensembl.io.genomio.utils import get_json, iter_json_array, md5sum, open_gz_file, print_json
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
@@ -46,8 +48,21 @@ class InvalidIntegrityError(Exception):
 class Manifest:
     """Representation of the manifest and its files."""
 
-    def __init__(self, manifest_path: PathLike) -> None:
+    # Manifest components whose data can be loaded, in the order they are loaded
+    components = ("gff3", "fasta_dna", "fasta_pep", "seq_region", "functional_annotation", "agp", "genome")
+
+    def __init__(self, manifest_path: PathLike, cache_dir: Optional[PathLike] = None) -> None:
+        self.md5sums: Dict[str, List[str]] = {}
         self.manifest_files = self.get_manifest(manifest_path)
+        self.cache = IntegrityCache(cache_dir) if cache_dir else None
+        self.cached_components: List[str] = []
+        self._reset_data()
+
+        self.ignore_final_stops = False
+        self.brc_mode = False
+
+    def _reset_data(self) -> None:
+        """Initialises the records of IDs and lengths loaded from the files, and their errors."""
         self.genome: Dict[str, Any] = {}
         self.seq_regions: Dict[str, Any] = {}
 
@@ -73,9 +88,7 @@ class Manifest:
         }
 
         self.errors: List[str] = []
-
-        self.ignore_final_stops = False
-        self.brc_mode = False
+        self.stages: List[Dict[str, Any]] = []
 
     def has_lengths(self, name: str) -> bool:
         """Check if a given name has lengths records.
@@ -110,10 +123,14 @@ class Manifest:
     def get_manifest(self, manifest_path: PathLike) -> Dict[str, Any]:
         """Load the content of a manifest file.
 
+        The MD5 checksum of every file listed is verified before returning, and recorded in `md5sums` for
+        each component.
+
         Returns:
             Dict: Content of the manifest file.
         """
         manifest_path = Path(manifest_path)
+        md5sums: Dict[Path, str] = {}
         with manifest_path.open("r") as manifest_fh:
             manifest = json.load(manifest_fh)
 
@@ -121,58 +138,108 @@ class Manifest:
             for name in manifest:
                 if "file" in manifest[name]:
                     file_path = manifest_path.parent / manifest[name]["file"]
-                    # check if the md5sum is correct
-                    md5sum = manifest[name]["md5sum"]
-                    self._check_md5sum(file_path, md5sum)
-
+                    md5sums[file_path] = manifest[name]["md5sum"]
+                    self.md5sums[name] = [manifest[name]["md5sum"]]
                     manifest[name] = file_path
                 else:
                     for f in manifest[name]:
                         if "file" in manifest[name][f]:
                             file_path = manifest_path.parent / manifest[name][f]["file"]
-                            # check if the md5sum is correct
-                            md5sum = manifest[name][f]["md5sum"]
-                            self._check_md5sum(file_path, md5sum)
-
+                            md5sums[file_path] = manifest[name][f]["md5sum"]
+                            self.md5sums.setdefault(name, []).append(manifest[name][f]["md5sum"])
                             manifest[name][f] = file_path
-            return manifest
 
-    def _check_md5sum(self, file_path: Path, md5sum: str) -> None:
+        # Check if the md5sums are correct
+        self._check_md5sums(md5sums)
+        return manifest
+
+    def _check_md5sums(self, md5sums: Dict[Path, str]) -> None:
+        """Verify the integrity of all the files in manifest.json at the same time.
+
+        Each file is hashed in its own thread: hashlib releases the GIL while digesting, so the
+        verification is bound by the disk bandwidth instead of running one file after another.
+
+        Args:
+            md5sums: MD5 hash expected for each file path.
+
+        Raises:
+            InvalidIntegrityError: If any of the files does not match its MD5 hash.
+        """
+        with ThreadPoolExecutor() as executor:
+            # Consume the results in the manifest order, so the same error is always raised first
+            for _ in executor.map(self._check_md5sum, md5sums.keys(), md5sums.values()):
+                pass
+
+    def _check_md5sum(self, file_path: Path, expected_md5sum: str) -> None:
         """Verify the integrity of the files in manifest.json.
 
         An MD5 hash is generated using the path provided which is then compared to the hash in manifest.json.
-        Errors are stored in ``self.errors``.
 
         Args:
             file_path: Path to a genome file.
-            md5sum: MD5 hash for the files.
-        """
+            expected_md5sum: MD5 hash for the files.
 
-        with file_path.open("rb") as f:
-            bytes_obj = f.read()
-            readable_hash = hashlib.md5(bytes_obj).hexdigest()
-            if readable_hash != md5sum:
-                raise InvalidIntegrityError(f"Invalid md5 checksum for {file_path}")
+        Raises:
+            InvalidIntegrityError: If the file does not match the MD5 hash.
+        """
+        if md5sum(file_path) != expected_md5sum:
+            raise InvalidIntegrityError(f"Invalid md5 checksum for {file_path}")
 
-    def prepare_integrity_data(self) -> None:
+    def prepare_integrity_data(self, workers: int = 1) -> None:
         """Read all the files and keep a record (IDs and their lengths)
         for each cases to be compared later.
+
+        The files are independent from each other, so they can be loaded in parallel, in which case the
+        total time is close to the time needed to load the slowest file.
+
+        If a cache folder is set, the data of each component is stored there under the checksums of its
+        files, and reused in later runs instead of reading files that have not changed.
+
+        Args:
+            workers: Maximum number of processes used to load the files (1 to load them sequentially).
+        """
+        names = [name for name in self.components if name in self.manifest_files]
+        all_data: Dict[str, Dict[str, Any]] = {}
+        for name in names:
+            cached_data = self._read_cached_component_data(name)
+            if cached_data is not None:
+                all_data[name] = cached_data
+        to_load = [name for name in names if name not in all_data]
+        if workers > 1 and len(to_load) > 1:
+            with ProcessPoolExecutor(max_workers=min(workers, len(to_load))) as executor:
+                all_data.update(zip(to_load, executor.map(self._load_component_data, to_load)))
+        else:
+            for name in to_load:
+                all_data[name] = self._load_component_data(name)
+        for name in to_load:
+            self._write_cached_component_data(name, all_data[name])
+        # Merge in the components order, so the errors are always reported identically
+        for name in names:
+            self._merge_component_data(all_data[name])
+
+    def load_component(self, name: str) -> None:
+        """Read the file(s) of one component of the manifest and record its IDs and lengths.
+
+        Args:
+            name: Manifest component name, e.g. "gff3" or "fasta_dna".
         """
-        # First, get the Data
-        if "gff3" in self.manifest_files:
+        if name == "gff3":
             logging.info("Manifest contains GFF3")
-            self.get_gff3(self.manifest_files["gff3"])
-        if "fasta_dna" in self.manifest_files:
+            with self._stage_stats("get_gff3", self.manifest_files["gff3"]):
+                self.get_gff3(self.manifest_files["gff3"])
+        elif name == "fasta_dna":
             logging.info("Manifest contains DNA fasta")
             # Verify if the length and id for the sequence is unique
-            self.lengths["dna_sequences"] = self.get_fasta_lengths(self.manifest_files["fasta_dna"])
-        if "fasta_pep" in self.manifest_files:
+            with self._stage_stats("get_fasta_lengths", self.manifest_files["fasta_dna"]):
+                self.lengths["dna_sequences"] = self.get_fasta_lengths(self.manifest_files["fasta_dna"])
+        elif name == "fasta_pep":
             logging.info("Manifest contains Peptide fasta")
             # Verify if the length and id for the sequence is unique
-            self.lengths["peptide_sequences"] = self.get_fasta_lengths(
-                self.manifest_files["fasta_pep"], ignore_final_stops=self.ignore_final_stops
-            )
-        if "seq_region" in self.manifest_files:
+            with self._stage_stats("get_fasta_lengths", self.manifest_files["fasta_pep"]):
+                self.lengths["peptide_sequences"] = self.get_fasta_lengths(
+                    self.manifest_files["fasta_pep"], ignore_final_stops=self.ignore_final_stops
+                )
+        elif name == "seq_region":
             logging.info("Manifest contains seq_region JSON")
             seq_regions = get_json(Path(self.manifest_files["seq_region"]))
             if len(seq_regions) == 0:
@@ -190,16 +257,95 @@ class Manifest:
                 self.lengths["seq_regions"] = seq_lengths
                 self.circular["seq_regions"] = seq_circular
                 self.seq_regions = seq_regions
-        if "functional_annotation" in self.manifest_files:
+        elif name == "functional_annotation":
             logging.info("Manifest contains functional annotation(s)")
-            self.get_functional_annotation(self.manifest_files["functional_annotation"])
-        if "agp" in self.manifest_files:
+            with self._stage_stats("get_functional_annotation", self.manifest_files["functional_annotation"]):
+                self.get_functional_annotation(self.manifest_files["functional_annotation"])
+        elif name == "agp":
             logging.info("Manifest contains AGP files")
-            self.lengths["agp"] = self.get_agp_seq_regions(self.manifest_files["agp"])
-        if "genome" in self.manifest_files:
+            with self._stage_stats("get_agp_seq_regions", self.manifest_files["agp"]):
+                self.lengths["agp"] = self.get_agp_seq_regions(self.manifest_files["agp"])
+        elif name == "genome":
             logging.info("Manifest contains genome JSON")
             self.lengths["genome"] = get_json(Path(self.manifest_files["genome"]))
 
+    def _stage_stats(self, stage: str, files: Any) -> ContextManager[None]:
+        """Records the statistics of a file loading stage in `stages`, with the number of IDs added to the
+        lengths by the stage as its number of records.
+
+        Args:
+            stage: Name of the stage, e.g. "get_gff3".
+            files: Path to the file loaded, or dict of paths if the stage loads several files.
+        """
+        return stage_stats(
+            self.stages, stage, files, lambda: sum(len(lengths) for lengths in self.lengths.values())
+        )
+
+    def _load_component_data(self, name: str) -> Dict[str, Any]:
+        """Returns the data recorded from one component of the manifest.
+
+        The component is loaded in a copy of this object without any data, so it can also be run in a
+        separate process.
+
+        Args:
+            name: Manifest component name.
+        """
+        component = copy.copy(self)
+        component._reset_data()  # pylint: disable=protected-access
+        component.load_component(name)
+        return {
+            "lengths": {key: lengths for key, lengths in component.lengths.items() if lengths},
+            "circular": {key: circular for key, circular in component.circular.items() if circular},
+            "seq_regions": component.seq_regions,
+            "errors": component.errors,
+            "stages": component.stages,
+        }
+
+    def _cache_options(self) -> List[Any]:
+        """Returns the values of the options that change the data loaded from the files."""
+        return [self.brc_mode, self.ignore_final_stops]
+
+    def _read_cached_component_data(self, name: str) -> Optional[Dict[str, Any]]:
+        """Returns the cached data of a component, or `None` if it has not been cached.
+
+        Args:
+            name: Manifest component name.
+        """
+        if self.cache is None or name not in self.md5sums:
+            return None
+        component_data = self.cache.read(name, self.md5sums[name], self._cache_options())
+        if component_data is None:
+            return None
+        self.cached_components.append(name)
+        component_data["stages"] = []
+        return component_data
+
+    def _write_cached_component_data(self, name: str, component_data: Dict[str, Any]) -> None:
+        """Stores the data of a component in the cache, if there is one.
+
+        Args:
+            name: Manifest component name.
+            component_data: Data returned by `_load_component_data()`.
+        """
+        if self.cache is None or name not in self.md5sums:
+            return
+        # The stages statistics are only meaningful for the run that loaded the files
+        cache_data = {key: value for key, value in component_data.items() if key != "stages"}
+        self.cache.write(name, self.md5sums[name], self._cache_options(), cache_data)
+
+    def _merge_component_data(self, component_data: Dict[str, Any]) -> None:
+        """Add the data recorded from one component of the manifest to this object.
+
+        Args:
+            component_data: Data returned by `_load_component_data()`.
+        """
+        self.lengths.update(component_data["lengths"])
+        self.circular.update(component_data["circular"])
+        if component_data["seq_regions"]:
+            self.seq_regions = component_data["seq_regions"]
+        self.errors += component_data["errors"]
+        self.stages += component_data["stages"]
+
     def get_fasta_lengths(self, fasta_path, ignore_final_stops=False):
         """Check if the fasta files have the correct ids and no stop codon.
 
@@ -210,41 +356,17 @@ class Manifest:
             Error if any empty ids, non-unique ids or stop codons are found in the fasta files.
         """
 
-        data = {}
-        non_unique = {}
-        non_unique_count = 0
-        empty_id_count = 0
-        contains_stop_codon = 0
-        rec_count = 0
-        for rec in SeqIO.parse(fasta_path, "fasta"):
-            rec_count += 1
-
-            # Flag empty ids
-            if rec.id == "":
-                empty_id_count += 1
-            else:
-                # Flag redundant ids
-                if rec.id in data:
-                    non_unique[rec.id] = 1
-                    non_unique_count += 1
-                # Store sequence id and length
-                data[rec.id] = len(rec.seq)
-                stops = rec.seq.count("*")
-                if stops > 1:
-                    contains_stop_codon += 1
-                elif stops == 1:
-                    if not rec.seq.endswith("*") or not ignore_final_stops:
-                        contains_stop_codon += 1
-
-        if empty_id_count > 0:
-            self._add_error(f"{empty_id_count} sequences with empty ids in {fasta_path}")
-        if non_unique_count > 0:
-            self._add_error(f"{non_unique_count} non unique sequence ids in {fasta_path}")
-        if contains_stop_codon > 0:
-            self._add_error(f"{contains_stop_codon} sequences with stop codons in {fasta_path}")
-        if rec_count == 0:
+        summary = scan_fasta(fasta_path, ignore_final_stops=ignore_final_stops)
+
+        if summary.num_empty_ids > 0:
+            self._add_error(f"{summary.num_empty_ids} sequences with empty ids in {fasta_path}")
+        if summary.num_duplicates > 0:
+            self._add_error(f"{summary.num_duplicates} non unique sequence ids in {fasta_path}")
+        if summary.num_with_stops > 0:
+            self._add_error(f"{summary.num_with_stops} sequences with stop codons in {fasta_path}")
+        if summary.num_records == 0:
             self._add_error(f"No sequences found in {fasta_path}")
-        return data
+        return summary.lengths
 
     def get_functional_annotation(self, json_path: Path) -> None:
         """Load the functional annotation file to retrieve the gene_id and translation id.
@@ -252,6 +374,8 @@ class Manifest:
             The functional annotation file is stored in a json format containing
             the description, id and object type (eg: "gene", "transcript", "translation").
 
+        The annotations are read one at a time, so the memory used does not depend on the file size.
+
         Args:
             json_path: Path to functional_annotation.json.
 
@@ -259,16 +383,12 @@ class Manifest:
             dict with gene and translation ids.
         """
 
-        # Load the json file
-        with open(json_path) as json_file:
-            data = json.load(json_file)
-
         # Get gene ids and translation ids
         genes = {}
         translations = {}
         transposons = {}
 
-        for item in data:
+        for item in iter_json_array(json_path):
             if item["object_type"] == "gene":
                 genes[item["id"]] = 1
             elif item["object_type"] == "translation":
@@ -284,75 +404,49 @@ class Manifest:
         self.lengths = {**self.lengths, **stats}
 
     def get_gff3(self, gff3_path: Path) -> None:
-        """A GFF parser is used to retrieve information in the GFF file such as
-           gene and CDS ids and their corresponding lengths.
+        """Retrieves the information of the GFF file needed for the integrity checks, i.e. the lengths of
+        the seq_regions, genes, translations and transposable elements.
+
+        The lengths are read in a single pass over the GFF3 lines (see `GFF3Lengths`), with the same
+        hierarchy as the BCBio GFF parser, but without building the features.
 
         Args:
             gff3_path: Path to gff3 file.
         """
-
-        seqs: Lengths = {}
-        genes: Lengths = {}
-        peps: Lengths = {}
-        all_peps: Lengths = {}
-        tes: Lengths = {}
-
+        gff3_lengths = GFF3Lengths(brc_mode=self.brc_mode)
         with open_gz_file(gff3_path) as gff3_handle:
-            gff = GFF.parse(gff3_handle)
-            for seq in gff:
-                seqs[seq.id] = len(seq.seq)
-
-                for feat in seq.features:
-                    feat_length = abs(feat.location.end - feat.location.start)
-                    # Store gene id and length
-                    if feat.type in ["gene", "ncRNA_gene", "pseudogene"]:
-                        self._retrieve_gff_gene_lengths(feat, genes, peps, all_peps)
-                    if feat.type == "transposable_element":
-                        tes[feat.id] = feat_length
+            gff3_lengths.add_lines(gff3_handle)
+            # The lines are read up to the `##FASTA` directive, if there is one
+            fasta_lengths = self._get_gff3_fasta_lengths(gff3_handle)
+        lengths = gff3_lengths.get_lengths()
+        seqs = {**lengths["seq_regions"], **fasta_lengths}
 
         stats: Dict[str, Lengths] = {
-            "gff3_seq_regions": seqs,
-            "gff3_genes": genes,
-            "gff3_translations": peps,
-            "gff3_all_translations": all_peps,
-            "gff3_transposable_elements": tes,
+            "gff3_seq_regions": {seq_id: seqs[seq_id] for seq_id in sorted(seqs)},
+            "gff3_genes": lengths["genes"],
+            "gff3_translations": lengths["translations"],
+            "gff3_all_translations": lengths["all_translations"],
+            "gff3_transposable_elements": lengths["transposable_elements"],
         }
         self.lengths = {**self.lengths, **stats}
 
-    def _retrieve_gff_gene_lengths(
-        self, feat: SeqFeature, genes: Lengths, peps: Lengths, all_peps: Lengths
-    ) -> None:
-        """Record genes and peptides lengths from a feature.
+    @staticmethod
+    def _get_gff3_fasta_lengths(gff3_handle: Iterable[str]) -> Lengths:
+        """Returns the length of the sequences of the FASTA section at the end of a GFF3 file.
 
         Args:
-            feat : Gene feature to check.
-            genes: Record of genes lengths to update.
-            peps: Record of peptides lengths to update.
-            all_peps: Record of all peptides lengths to update (include pseudogenes).
-
+            gff3_handle: GFF3 file lines, from the line right after the `##FASTA` directive.
         """
-        gene_id = feat.id
-        if not self.brc_mode:
-            gene_id = gene_id.replace("gene:", "")
-        genes[gene_id] = abs(feat.location.end - feat.location.start)
-        # Get CDS id and length
-        for feat2 in feat.sub_features:
-            if feat2.type in ("mRNA", "pseudogenic_transcript"):
-                length = {}
-                for feat3 in feat2.sub_features:
-                    if feat3.type == "CDS":
-                        pep_id = feat3.id
-                        if not self.brc_mode:
-                            pep_id = pep_id.replace("CDS:", "")
-                        if pep_id not in length:
-                            length[pep_id] = 0
-                        length[pep_id] += abs(feat3.location.end - feat3.location.start)
-                for pep_id, pep_length in length.items():
-                    # Store length for translations, add pseudo translations separately
-                    pep_length = floor(pep_length / 3) - 1
-                    if feat.type != "pseudogene":
-                        peps[pep_id] = pep_length
-                    all_peps[pep_id] = pep_length
+        lengths: Lengths = {}
+        seq_id = None
+        for line in gff3_handle:
+            if line.startswith(">"):
+                title = line[1:].rstrip()
+                seq_id = title.split(None, 1)[0] if title else ""
+                lengths[seq_id] = 0
+            elif seq_id is not None:
+                lengths[seq_id] += len(line.rstrip().replace(" ", "").replace("\r", ""))
+        return lengths
 
     def get_agp_seq_regions(self, agp_dict):
         """AGP files describe the assembly of larger sequence objects using smaller objects.
@@ -400,18 +494,30 @@ class Manifest:
 class IntegrityTool:
     """Check the integrity of sequence and annotation files in the genome"""
 
-    def __init__(self, manifest_file: Path, brc_mode: bool = False, ignore_final_stops: bool = False) -> None:
-        self.manifest = Manifest(manifest_file)
+    def __init__(
+        self,
+        manifest_file: Path,
+        brc_mode: bool = False,
+        ignore_final_stops: bool = False,
+        *,
+        workers: int = 1,
+        cache_dir: Optional[Path] = None,
+        report_file: Optional[Path] = None,
+    ) -> None:
+        self.manifest_file = manifest_file
+        self.manifest = Manifest(manifest_file, cache_dir)
         self.brc_mode = False
         self.set_brc_mode(brc_mode)
         self.ignore_final_stops = False
         self.set_ignore_final_stops(ignore_final_stops)
+        self.workers = workers
+        self.report_file = report_file
         self.errors: List[str] = []
+        self.checks: List[Dict[str, Any]] = []
 
     def add_errors(self, *args: str) -> None:
         """Store the given errors in the list."""
-        for error in args:
-            self.errors += error
+        self.errors.extend(args)
 
     def check_integrity(self):
         """Load files listed in the manifest.json and check the integrity.
@@ -422,8 +528,9 @@ class IntegrityTool:
         """
 
         # Load the manifest integrity counts
+        start_time = time.perf_counter()
         manifest = self.manifest
-        manifest.prepare_integrity_data()
+        manifest.prepare_integrity_data(workers=self.workers)
 
         genome = manifest.genome
         seq_regions = manifest.seq_regions
@@ -505,10 +612,33 @@ class IntegrityTool:
         if agp_seqr and seq_lengths:
             self.check_seq_region_lengths(seq_lengths, agp_seqr, "seq_regions json vs agps")
 
+        if self.report_file:
+            self.write_report(self.report_file, time.perf_counter() - start_time)
+
         if manifest.errors:
             errors_str = "\n".join(manifest.errors)
             raise InvalidIntegrityError(f"Integrity test failed:\n{errors_str}")
 
+    def write_report(self, report_file: Path, wall_time: Optional[float] = None) -> None:
+        """Writes a JSON report of the checks run and of the files loading stages.
+
+        Args:
+            report_file: Path to the JSON file to create.
+            wall_time: Total time taken by the integrity check, in seconds.
+        """
+        report = {
+            "manifest_file": str(self.manifest_file),
+            "brc_mode": self.brc_mode,
+            "ignore_final_stops": self.ignore_final_stops,
+            "errors": self.manifest.errors + [error for check in self.checks for error in check["errors"]],
+            "checks": self.checks,
+            "stages": self.manifest.stages,
+            "cached_components": self.manifest.cached_components,
+            "wall_time": wall_time,
+            "peak_rss_kb": peak_rss(),
+        }
+        print_json(report_file, report)
+
     def set_brc_mode(self, brc_mode: bool) -> None:
         """Set brc mode for this tool and the manifest."""
         self.brc_mode = brc_mode
@@ -526,8 +656,11 @@ class IntegrityTool:
                 genome_ass = genome["assembly"]
                 if "accession" in genome_ass:
                     genome_acc = genome_ass["accession"]
+                    errors = []
                     if not re.match(r"GC[AF]_\d{9}(\.\d+)?", genome_acc):
-                        self.add_errors(f"Genome assembly accession is wrong: '{genome_acc}'")
+                        errors.append(f"Genome assembly accession is wrong: '{genome_acc}'")
+                        self.add_errors(*errors)
+                    self.checks.append(check_record("Genome assembly accession", "genome", {}, {}, errors))
 
     def check_ids(self, list1, list2, name) -> bool:
         """Compare the ids in list1 and list2.
@@ -545,13 +678,16 @@ class IntegrityTool:
         only2 = []
         common = []
 
+        # Use hashed lookups so the comparison is linear in the number of ids
+        ids2 = set(list2)
         for item_id in list1:
-            if item_id in list2:
+            if item_id in ids2:
                 common.append(item_id)
             else:
                 only1.append(item_id)
+        common_ids = set(common)
         for item_id in list2:
-            if item_id not in common:
+            if item_id not in common_ids:
                 only2.append(item_id)
 
         errors = []
@@ -565,6 +701,15 @@ class IntegrityTool:
             logging.debug(f"{len(only1)} only in second list in {name}")
 
         self.add_errors(*errors)
+        self.checks.append(
+            check_record(
+                name,
+                "ids",
+                {"common": len(common), "only_first": len(only1), "only_second": len(only2)},
+                {"only_first": only1, "only_second": only2},
+                errors,
+            )
+        )
 
         return len(errors) > 0
 
@@ -602,12 +747,12 @@ class IntegrityTool:
             errors.append(f"{name}: {len(list2_1)} from the second list only (i.e. {list2_1[0]})")
 
         common_len = 0
+        diff_len_list: List[str] = []
+        diff_len_special_list: List[str] = []
         if allowed_len_diff is None:
             common_len = len(set1 & set2)
         else:
             # check for the sequence length difference
-            diff_len_list = []
-            diff_len_special_list = []
             for e in set1 & set2:
                 dl12 = list1[e] - list2[e]
                 if abs(dl12) <= allowed_len_diff:
@@ -636,6 +781,26 @@ class IntegrityTool:
         if common_len > 0:
             logging.warning(f"{common_len} common elements between lists for {name}")
 
+        self.checks.append(
+            check_record(
+                name,
+                "lengths",
+                {
+                    "common": common_len,
+                    "only_first": len(list1_2),
+                    "only_second": len(list2_1),
+                    "length_diff": len(diff_len_list),
+                    "length_diff_one": len(diff_len_special_list),
+                },
+                {
+                    "only_first": list1_2,
+                    "only_second": list2_1,
+                    "length_diff": diff_len_list,
+                    "length_diff_one": diff_len_special_list,
+                },
+                errors,
+            )
+        )
         return errors
 
     def check_seq_region_lengths(
@@ -670,18 +835,25 @@ class IntegrityTool:
         only_seqr = comp["only_seqr"]
         only_feat = comp["only_feat"]
 
+        errors = []
         if common:
             logging.info(f"{len(common)} common elements in {name}")
         if diff_circular:
             example = diff_circular[0]
             logging.info(f"{len(diff_circular)} differences for circular elements in {name} (e.g. {example})")
         if diff:
-            self.add_errors(f"{len(diff)} common elements with higher length in {name} (e.g. {diff[0]})")
+            errors.append(f"{len(diff)} common elements with higher length in {name} (e.g. {diff[0]})")
         if only_seqr:
             # Not an error!
             logging.info(f"{len(only_seqr)} only in seq_region list in {name} (first: {only_seqr[0]})")
         if only_feat:
-            self.add_errors(f"{len(only_feat)} only in second list in {name} (first: {only_feat[0]})")
+            errors.append(f"{len(only_feat)} only in second list in {name} (first: {only_feat[0]})")
+        self.add_errors(*errors)
+        self.checks.append(
+            check_record(
+                name, "seq_regions", {key: len(values) for key, values in comp.items()}, comp, errors
+            )
+        )
 
     def _compare_seqs(
         self, seqrs: Dict[str, Any], feats: Dict[str, Any], circular: Optional[Dict[str, Any]] = None
@@ -723,12 +895,10 @@ class IntegrityTool:
             else:
                 comp["only_seqr"].append(seq_id)
 
+        # Use hashed lookups so the comparison is linear in the number of sequences
+        common = set(comp["common"])
         for seq_id in feats:
-            if (
-                seq_id not in comp["common"]
-                and seq_id not in comp["diff"]
-                and seq_id not in comp["diff_circular"]
-            ):
+            if seq_id not in common:
                 comp["only_feat"].append(seq_id)
 
         return comp
@@ -744,11 +914,27 @@ def main() -> None:
     parser.add_argument(
         "--ignore_final_stops", action="store_true", help="Ignore final stop when calculating peptide length"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Number of processes to load the manifest files in parallel"
+    )
+    parser.add_argument_dst_path(
+        "--cache_dir", help="Folder to cache the data loaded from each file, reused if the file is unchanged"
+    )
+    parser.add_argument_dst_path(
+        "--report_file", help="JSON file to write the results of the checks and the loading times to"
+    )
     parser.add_log_arguments(add_log_file=True)
     args = parser.parse_args()
     init_logging_with_args(args)
 
-    inspector = IntegrityTool(args.manifest_file, args.brc_mode, args.ignore_final_stops)
+    inspector = IntegrityTool(
+        args.manifest_file,
+        args.brc_mode,
+        args.ignore_final_stops,
+        workers=args.workers,
+        cache_dir=args.cache_dir,
+        report_file=args.report_file,
+    )
     inspector.check_integrity()
 
 
@@ -15,32 +15,109 @@
 """Compute stats from the current genome files associated with the manifest."""
 
 import json
+from functools import partial
 from os import PathLike
 from pathlib import Path
 from shutil import which
 from statistics import mean
-import subprocess
 from typing import Dict, List, Optional, Set, Union
 
-from BCBio import GFF
-
-from ensembl.io.genomio.utils import open_gz_file
+from ensembl.io.genomio.assembly.datasets import DEFAULT_CACHE_TTL_DAYS, DatasetsSummaries
+from ensembl.io.genomio.gff3.features import parse_gff3_features
+from ensembl.io.genomio.utils import iter_json_array
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
 
+class FeatureIdTable:
+    """Table of unique feature ids, shared by several counters so each id is only stored once.
+
+    Every new id gets the next index, so the counters can record their ids as bits in a bitset.
+    """
+
+    def __init__(self) -> None:
+        self._indices: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def get_index(self, feature_id: str) -> int:
+        """Returns the index of a feature id, adding it to the table if it is new.
+
+        Args:
+            feature_id: Feature id.
+        """
+        index = self._indices.get(feature_id)
+        if index is None:
+            index = len(self._indices)
+            self._indices[feature_id] = index
+        return index
+
+    def get_ids(self, indices: Set[int]) -> Set[str]:
+        """Returns the feature ids with the given indices.
+
+        Args:
+            indices: Indices of the feature ids in the table.
+        """
+        return {feature_id for feature_id, index in self._indices.items() if index in indices}
+
+
 class BiotypeCounter:
-    """A counter for a given biotype, given a list of features."""
+    """A counter for a given biotype, given a list of features.
 
-    def __init__(self, count: int = 0, ids: Optional[Set[str]] = None, example: Optional[str] = None) -> None:
+    The ids are stored in a table (that can be shared between counters) and the counter only keeps one bit
+    per id of that table, so its memory does not depend on the number of times each id is added.
+    """
+
+    def __init__(
+        self,
+        count: int = 0,
+        ids: Optional[Set[str]] = None,
+        example: Optional[str] = None,
+        id_table: Optional[FeatureIdTable] = None,
+    ) -> None:
         self.count: int = count
-        if ids is None:
-            ids = set()
-        self.ids: Set[str] = ids
+        if id_table is None:
+            id_table = FeatureIdTable()
+        self._id_table = id_table
+        self._id_bits = bytearray()
+        self._unique_count = 0
+        if ids is not None:
+            for feature_id in ids:
+                self._add_unique_id(feature_id)
         if example is None:
             example = ""
         self.example: str = example
 
+    @property
+    def ids(self) -> Set[str]:
+        """Set of feature ids added to the counter so far."""
+        indices = {
+            byte_index * 8 + bit
+            for byte_index, byte in enumerate(self._id_bits)
+            if byte
+            for bit in range(8)
+            if byte & (1 << bit)
+        }
+        return self._id_table.get_ids(indices)
+
+    def _add_unique_id(self, feature_id: str) -> None:
+        """Records a feature id in the bitset, if not already there.
+
+        Args:
+            feature_id: Feature id to record.
+        """
+        byte_index, bit = divmod(self._id_table.get_index(feature_id), 8)
+        if byte_index >= len(self._id_bits):
+            # Grow to the whole table size to avoid resizing for each new id
+            self._id_bits.extend(
+                bytes(max(byte_index + 1, len(self._id_table) // 8 + 1) - len(self._id_bits))
+            )
+        mask = 1 << bit
+        if not self._id_bits[byte_index] & mask:
+            self._id_bits[byte_index] |= mask
+            self._unique_count += 1
+
     def add_id(self, feature_id: str) -> None:
         """Add a feature to the counter.
 
@@ -48,7 +125,7 @@ class BiotypeCounter:
             feature_id (str): Feature id to add.
         """
         self.count += 1
-        self.ids.add(feature_id)
+        self._add_unique_id(feature_id)
 
     def unique_count(self) -> int:
         """Total number feature ids added to the counter so far.
@@ -56,7 +133,7 @@ class BiotypeCounter:
         Returns:
             int: number of features in the counter.
         """
-        return len(self.ids)
+        return self._unique_count
 
 
 class StatsError(Exception):
@@ -66,7 +143,14 @@ class StatsError(Exception):
 class manifest_stats:
     """Representation of the statistics of the set of files listed in the manifest file provided."""
 
-    def __init__(self, manifest_dir: str, accession: Optional[str], datasets_bin: Optional[str]):
+    def __init__(
+        self,
+        manifest_dir: str,
+        accession: Optional[str],
+        datasets_bin: Optional[str],
+        datasets_cache_dir: Optional[PathLike] = None,
+        datasets_cache_ttl: float = DEFAULT_CACHE_TTL_DAYS,
+    ):
         self.manifest = f"{manifest_dir}/manifest.json"
         self.accession: Optional[str] = accession
         self.errors: List[str] = []
@@ -74,6 +158,7 @@ class manifest_stats:
         if datasets_bin is None:
             datasets_bin = "datasets"
         self.datasets_bin = datasets_bin
+        self.datasets_summaries = DatasetsSummaries(datasets_bin, datasets_cache_dir, datasets_cache_ttl)
         self.manifest_parent = manifest_dir
         self.check_ncbi = False
 
@@ -141,15 +226,12 @@ class manifest_stats:
         Returns:
             List[str]: Stats from the seq_regions.
         """
-        with seq_region_path.open("r") as json_file:
-            seq_regions = json.load(json_file)
-
         # Get basic data
         coord_systems: Dict[str, List[int]] = {}
         circular = 0
         locations = []
         codon_tables = []
-        for seqr in seq_regions:
+        for seqr in iter_json_array(seq_region_path):
             # Get readable seq_region name:
             # either use a Genbank synonym, or just the provided seq_region name
             genbank = "synonyms" in seqr and [x for x in seqr["synonyms"] if x["source"] == "GenBank"]
@@ -267,45 +349,45 @@ class manifest_stats:
         """
 
         biotypes: Dict[str, BiotypeCounter] = {}
-
-        with open_gz_file(gff3_path) as gff3_handle:
-            for rec in GFF.parse(gff3_handle):
-                for feat1 in rec.features:
-                    # Check if the gene contains proteins (CDSs),
-                    # and keep a count of all hierarchies (e.g. gene-mRNA-CDS)
-                    is_protein = False
-                    for feat2 in feat1.sub_features:
-                        if feat2.type == "mRNA":
-                            types2 = {f.type for f in feat2.sub_features}
-                            if "CDS" in types2:
-                                is_protein = True
-                        manifest_stats.increment_biotype(biotypes, feat2.id, f"{feat1.type}-{feat2.type}")
-                        for feat3 in feat2.sub_features:
-                            if feat3.type == "exon":
-                                continue
-                            manifest_stats.increment_biotype(
-                                biotypes, feat3.id, f"{feat1.type}-{feat2.type}-{feat3.type}"
-                            )
-
-                    # Main categories counts
-                    if feat1.type == "pseudogene":
-                        manifest_stats.increment_biotype(biotypes, feat1.id, "pseudogene")
-                    elif is_protein:
-                        manifest_stats.increment_biotype(biotypes, feat1.id, f"PROT_{feat1.type}")
+        # All the counters share the same ids table, so each id is stored only once
+        id_table = FeatureIdTable()
+        increment = partial(manifest_stats.increment_biotype, id_table=id_table)
+
+        for _, features in parse_gff3_features(gff3_path):
+            for feat1 in features:
+                # Check if the gene contains proteins (CDSs),
+                # and keep a count of all hierarchies (e.g. gene-mRNA-CDS)
+                is_protein = False
+                for feat2 in feat1.sub_features:
+                    if feat2.type == "mRNA":
+                        types2 = {f.type for f in feat2.sub_features}
+                        if "CDS" in types2:
+                            is_protein = True
+                    increment(biotypes, feat2.id, f"{feat1.type}-{feat2.type}")
+                    for feat3 in feat2.sub_features:
+                        if feat3.type == "exon":
+                            continue
+                        increment(biotypes, feat3.id, f"{feat1.type}-{feat2.type}-{feat3.type}")
+
+                # Main categories counts
+                if feat1.type == "pseudogene":
+                    increment(biotypes, feat1.id, "pseudogene")
+                elif is_protein:
+                    increment(biotypes, feat1.id, f"PROT_{feat1.type}")
+                else:
+                    # Special case, undefined gene-transcript
+                    if (
+                        feat1.type == "gene"
+                        and feat1.sub_features
+                        and feat1.sub_features[0].type == "transcript"
+                    ):
+                        increment(biotypes, feat1.id, "OTHER")
                     else:
-                        # Special case, undefined gene-transcript
-                        if (
-                            feat1.type == "gene"
-                            and feat1.sub_features
-                            and feat1.sub_features[0].type == "transcript"
-                        ):
-                            manifest_stats.increment_biotype(biotypes, feat1.id, "OTHER")
-                        else:
-                            manifest_stats.increment_biotype(biotypes, feat1.id, f"NONPROT_{feat1.type}")
-
-                    # Total
-                    if feat1.type in ("gene", "pseudogene"):
-                        manifest_stats.increment_biotype(biotypes, feat1.id, "ALL_GENES")
+                        increment(biotypes, feat1.id, f"NONPROT_{feat1.type}")
+
+                # Total
+                if feat1.type in ("gene", "pseudogene"):
+                    increment(biotypes, feat1.id, "ALL_GENES")
         return biotypes
 
     def biotypes_stats(self, biotypes: Dict[str, BiotypeCounter]) -> List[str]:
@@ -339,14 +421,12 @@ class manifest_stats:
 
         accession: str = self.accession
 
-        datasets_bin = self.datasets_bin
-        if not which(datasets_bin):
+        # A cached summary can be used even if the datasets tool is not available
+        if not self.datasets_summaries.is_cached(accession) and not which(self.datasets_bin):
             return stats
 
         # Get the dataset summary from NCBI
-        command = [datasets_bin, "summary", "genome", "accession", accession]
-        result_out = subprocess.run(command, stdout=subprocess.PIPE, check=True)
-        result = json.loads(result_out.stdout)
+        result = self.datasets_summaries.get_summary(accession)
 
         # Get stats
         if "reports" in result:
@@ -388,16 +468,22 @@ class manifest_stats:
         return stats
 
     @staticmethod
-    def increment_biotype(biotypes: Dict[str, BiotypeCounter], feature_id: str, feature_biotype: str) -> None:
+    def increment_biotype(
+        biotypes: Dict[str, BiotypeCounter],
+        feature_id: str,
+        feature_biotype: str,
+        id_table: Optional[FeatureIdTable] = None,
+    ) -> None:
         """Add the feature to their respective biotype counter.
 
         Args:
             biotypes (Dict[str, BiotypeCounter]): All current biotypes, with their counter.
             feature_id (str): Feature id to be counted.
             feature_biotype (str): The biotype of the feature.
+            id_table (FeatureIdTable): Table of ids shared by the new counters.
         """
         if feature_biotype not in biotypes:
-            biotypes[feature_biotype] = BiotypeCounter(example=feature_id)
+            biotypes[feature_biotype] = BiotypeCounter(example=feature_id, id_table=id_table)
         biotypes[feature_biotype].add_id(feature_id)
 
 
@@ -411,12 +497,27 @@ def main() -> None:
     )
     parser.add_argument("--accession", help="Sequence accession ID to compare stats with NCBI")
     parser.add_argument("--datasets_bin", help="Datasets bin status")
+    parser.add_argument_dst_path(
+        "--datasets_cache_dir", help="Folder to cache the NCBI datasets summaries, by accession"
+    )
+    parser.add_argument(
+        "--datasets_cache_ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL_DAYS,
+        help="Number of days a cached NCBI datasets summary is used before fetching it again",
+    )
     parser.add_argument_dst_path("--stats_file", help="Output file with the stats")
     parser.add_log_arguments()
     args = parser.parse_args()
     init_logging_with_args(args)
 
-    mstats = manifest_stats(args.manifest_dir, args.accession, args.datasets_bin)
+    mstats = manifest_stats(
+        args.manifest_dir,
+        args.accession,
+        args.datasets_bin,
+        args.datasets_cache_dir,
+        args.datasets_cache_ttl,
+    )
     if args.accession is not None:
         mstats.check_ncbi = True
     stats_file = args.stats_file if args.stats_file is not None else args.manifest_dir / "stats.txt"
@@ -16,7 +16,6 @@
 
 __all__ = ["ManifestMaker"]
 
-import hashlib
 import logging
 import json
 from pathlib import Path
@@ -24,6 +23,8 @@ from pathlib import Path
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
+from ensembl.io.genomio.utils import md5sum
+
 
 class ManifestMaker:
     """Given a directory with genomic files, create a manifest json file for them."""
@@ -75,7 +76,7 @@ class ManifestMaker:
             for name, standard_name in self.names.items():
                 if subfile.stem.endswith(name):
                     used_file = True
-                    md5 = self._get_md5sum(subfile)
+                    md5 = md5sum(subfile)
                     file_obj = {"file": subfile.name, "md5sum": md5}
                     if standard_name in manifest_files:
                         if isinstance(manifest_files[standard_name], list):
@@ -93,12 +94,6 @@ class ManifestMaker:
 
         return manifest_files
 
-    @staticmethod
-    def _get_md5sum(file_path: Path) -> str:
-        with file_path.open("rb") as f:
-            data_bytes = f.read()
-            return hashlib.md5(data_bytes).hexdigest()
-
 
 def main() -> None:
     """Main entrypoint."""
@@ -0,0 +1,95 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Local cache of the data loaded from each manifest component by the integrity checks."""
+
+__all__ = ["CACHE_VERSION", "IntegrityCache"]
+
+import hashlib
+import json
+import logging
+import os
+from os import PathLike
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+# Version of the cached component data format, to update whenever the recorded data changes
+CACHE_VERSION = 1
+
+
+class IntegrityCache:
+    """Data loaded from each manifest component, cached on disk under the checksums of its files.
+
+    The file name of the cached data is derived from the checksums of the component files and from the
+    options that change the data loaded, so any change in either of them leads to a different cache file.
+
+    Attributes:
+        cache_dir: Folder where the data is cached.
+
+    """
+
+    def __init__(self, cache_dir: PathLike) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def get_cache_path(self, name: str, md5sums: List[str], options: List[Any]) -> Path:
+        """Returns the path to the cached data of a component.
+
+        Args:
+            name: Manifest component name.
+            md5sums: Checksums of the component files.
+            options: Values of the options that change the data loaded (must be JSON serializable).
+        """
+        key = [CACHE_VERSION, name, md5sums, *options]
+        key_hash = hashlib.md5(json.dumps(key).encode()).hexdigest()
+        return self.cache_dir / f"{name}_{key_hash}.json"
+
+    def read(self, name: str, md5sums: List[str], options: List[Any]) -> Optional[Dict[str, Any]]:
+        """Returns the cached data of a component, or `None` if it has not been cached.
+
+        Args:
+            name: Manifest component name.
+            md5sums: Checksums of the component files.
+            options: Values of the options that change the data loaded.
+        """
+        cache_path = self.get_cache_path(name, md5sums, options)
+        if not cache_path.is_file():
+            return None
+        try:
+            with cache_path.open("r") as cache_fh:
+                component_data = json.load(cache_fh)
+        except (OSError, ValueError):
+            logging.warning(f"Ignoring unreadable cache file {cache_path}")
+            return None
+        logging.info(f"Using cached data for {name} from {cache_path}")
+        return component_data
+
+    def write(
+        self, name: str, md5sums: List[str], options: List[Any], component_data: Dict[str, Any]
+    ) -> None:
+        """Stores the data of a component in the cache.
+
+        Args:
+            name: Manifest component name.
+            md5sums: Checksums of the component files.
+            options: Values of the options that change the data loaded.
+            component_data: Data to cache (must be JSON serializable).
+        """
+        cache_path = self.get_cache_path(name, md5sums, options)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partial cache file
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        with tmp_path.open("w") as cache_fh:
+            json.dump(component_data, cache_fh)
+        tmp_path.replace(cache_path)
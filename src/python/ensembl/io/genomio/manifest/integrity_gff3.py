@@ -0,0 +1,205 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lengths of the GFF3 features compared by the integrity checks, read without building the features."""
+
+__all__ = ["GFF3Lengths"]
+
+from math import floor
+from typing import Dict, Iterable, List, Set, Tuple
+
+from ensembl.io.genomio.gff3.features import GFFFeatureError, get_gff3_id_and_parents
+
+
+Lengths = Dict[str, int]
+
+# Top-level feature types whose lengths are compared
+_GENE_TYPES = ("gene", "ncRNA_gene", "pseudogene")
+_TE_TYPE = "transposable_element"
+# Children of the genes whose CDSs are translated
+_TRANSCRIPT_TYPES = ("mRNA", "pseudogenic_transcript")
+
+# Location of a top-level feature: seq_region, type, start and end
+_RootSpan = Tuple[str, str, int, int]
+# Transcript: parent IDs, start and end
+_Transcript = Tuple[Tuple[str, ...], int, int]
+# Child feature with a parent not seen yet: seq_region, type, ID, start, end and parent IDs
+_PendingChild = Tuple[str, str, str, int, int, Tuple[str, ...]]
+
+
+class GFF3Lengths:
+    """Lengths of the seq_regions, genes, translations and transposable elements of a GFF3 file.
+
+    The lines are read in a single pass that only keeps what the lengths need: the location of the
+    top-level features, the IDs of the other features, the parents of the transcripts, and the CDS
+    lengths of each transcript. The lengths are the same as those of the features built by the BCBio
+    GFF parser, e.g. duplicated top-level IDs get a suffix (`gene1_2`), and a feature with a missing
+    parent is a top-level feature if it is the only child of that parent.
+
+    Attributes:
+        brc_mode: Keep the `gene:` and `CDS:` prefixes of the gene and translation IDs.
+
+    """
+
+    def __init__(self, brc_mode: bool = False) -> None:
+        self.brc_mode = brc_mode
+        self._seq_ends: Lengths = {}
+        self._genes: Lengths = {}
+        self._tes: Lengths = {}
+        self._roots: Dict[str, List[_RootSpan]] = {}
+        self._child_ids: Set[str] = set()
+        self._transcripts: Dict[str, _Transcript] = {}
+        self._cds_lengths: Dict[str, Lengths] = {}
+        self._pending: List[_PendingChild] = []
+
+    def add_lines(self, lines: Iterable[str]) -> None:
+        """Reads the features of GFF3 lines, up to the `##FASTA` directive if there is one.
+
+        Args:
+            lines: GFF3 lines.
+
+        Raises:
+            GFFFeatureError: If a line does not have 9 columns.
+        """
+        for line in lines:
+            if line.startswith("#"):
+                if line.startswith("##FASTA"):
+                    break
+                continue
+            if not line.strip():
+                continue
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) != 9:
+                raise GFFFeatureError(f"Expected 9 columns in GFF3 line: {line}")
+            self._add_feature(fields)
+
+    def _add_feature(self, fields: List[str]) -> None:
+        """Records what the lengths need from the 9 columns of a feature."""
+        seq_id, _, feat_type, start_field, end_field, _, _, _, attributes = fields
+        start = int(start_field)
+        end = int(end_field)
+        feat_id, parent_list = get_gff3_id_and_parents(attributes)
+        parent_ids = tuple(parent_list)
+        # A feature cannot be its own parent, so its ID is not used in that case
+        if feat_id in parent_ids:
+            feat_id = ""
+        if not parent_ids:
+            self._seq_ends[seq_id] = max(end, self._seq_ends.get(seq_id, end))
+            if feat_id:
+                self._roots.setdefault(feat_id, []).append((seq_id, feat_type, start, end))
+            else:
+                self._add_top_level(feat_type, feat_id, start, end)
+            return
+
+        if feat_type == "CDS":
+            pep_id = feat_id if self.brc_mode else feat_id.replace("CDS:", "")
+            for parent_id in parent_ids:
+                transcript_cds = self._cds_lengths.setdefault(parent_id, {})
+                transcript_cds[pep_id] = transcript_cds.get(pep_id, 0) + end - start + 1
+        if feat_id and feat_id not in self._child_ids:
+            # Only the first child with a given ID can be the parent of other features
+            self._child_ids.add(feat_id)
+            if feat_type in _TRANSCRIPT_TYPES:
+                self._transcripts[feat_id] = (parent_ids, start, end)
+        if not all(parent_id in self._roots or parent_id in self._child_ids for parent_id in parent_ids):
+            # The parents are usually before their children, so only a few children are kept
+            self._pending.append((seq_id, feat_type, feat_id, start, end, parent_ids))
+
+    def _add_top_level(self, feat_type: str, feat_id: str, start: int, end: int) -> None:
+        """Records the length of a top-level gene or transposable element."""
+        if feat_type in _GENE_TYPES:
+            gene_id = feat_id if self.brc_mode else feat_id.replace("gene:", "")
+            self._genes[gene_id] = end - start + 1
+        elif feat_type == _TE_TYPE:
+            self._tes[feat_id] = end - start + 1
+
+    def get_lengths(self) -> Dict[str, Lengths]:
+        """Returns the lengths of the "seq_regions" (sorted by name), "genes", "translations",
+        "all_translations" (including those of pseudogenes) and "transposable_elements".
+
+        Raises:
+            GFFFeatureError: If a transcript is not contained in any of the top-level features with the ID
+                of its parent.
+        """
+        for root_id, spans in self._roots.items():
+            for occurrence, (_, feat_type, start, end) in enumerate(spans, 1):
+                self._add_top_level(feat_type, _root_id(root_id, occurrence), start, end)
+        self._add_orphans()
+
+        peps: Lengths = {}
+        all_peps: Lengths = {}
+        for transcript_id, (parent_ids, start, end) in self._transcripts.items():
+            # A top-level feature with the same ID would get the CDSs instead of this transcript
+            if transcript_id in self._roots:
+                continue
+            cds_lengths = self._cds_lengths.get(transcript_id, {})
+            for parent_id in parent_ids:
+                parent_spans = self._roots.get(parent_id)
+                if not parent_spans:
+                    continue
+                gene_type = parent_spans[self._find_root(parent_id, parent_spans, start, end)][1]
+                if gene_type not in _GENE_TYPES:
+                    continue
+                for pep_id, cds_length in cds_lengths.items():
+                    # Store length for translations, add pseudo translations separately
+                    pep_length = floor(cds_length / 3) - 1
+                    if gene_type != "pseudogene":
+                        peps[pep_id] = pep_length
+                    all_peps[pep_id] = pep_length
+
+        return {
+            "seq_regions": {seq_id: self._seq_ends[seq_id] for seq_id in sorted(self._seq_ends)},
+            "genes": self._genes,
+            "translations": peps,
+            "all_translations": all_peps,
+            "transposable_elements": self._tes,
+        }
+
+    def _add_orphans(self) -> None:
+        """Adds the top-level features made from the children with a missing parent.
+
+        The only child of a missing parent becomes a top-level feature. Otherwise, the children are put
+        under a parent inferred from their locations, on the seq_region of the first child.
+        """
+        orphans: Dict[str, List[_PendingChild]] = {}
+        for child in self._pending:
+            for parent_id in child[5]:
+                if parent_id not in self._roots and parent_id not in self._child_ids:
+                    orphans.setdefault(parent_id, []).append(child)
+        self._pending = []
+        for children in orphans.values():
+            seq_id = children[0][0]
+            end = max(child[4] for child in children)
+            self._seq_ends[seq_id] = max(end, self._seq_ends.get(seq_id, end))
+            if len(children) == 1:
+                _, feat_type, feat_id, start, end, _ = children[0]
+                self._add_top_level(feat_type, feat_id, start, end)
+
+    @staticmethod
+    def _find_root(root_id: str, spans: List[_RootSpan], start: int, end: int) -> int:
+        """Returns the index of the top-level feature with the given ID that is the parent of a child.
+
+        If the ID is duplicated, the parent is the first feature that contains the child.
+        """
+        if len(spans) == 1:
+            return 0
+        for index, (_, _, root_start, root_end) in enumerate(spans):
+            if root_start <= start and end <= root_end:
+                return index
+        raise GFFFeatureError(f"No feature {root_id} contains the location of its child at {start}-{end}")
+
+
+def _root_id(root_id: str, occurrence: int) -> str:
+    """Returns the ID of a top-level feature, with a suffix if it is not the first one with that ID."""
+    return root_id if occurrence == 1 else f"{root_id}_{occurrence}"
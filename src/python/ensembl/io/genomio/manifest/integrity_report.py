@@ -0,0 +1,89 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Records of the integrity checks results and of the file loading stages, for the JSON report."""
+
+__all__ = ["REPORT_EXAMPLES", "check_record", "peak_rss", "stage_stats"]
+
+from contextlib import contextmanager
+import resource
+import time
+from typing import Any, Callable, Dict, Generator, List
+
+
+# Maximum number of examples of each kind of difference recorded for each check in the report
+REPORT_EXAMPLES = 5
+
+
+@contextmanager
+def stage_stats(
+    stages: List[Dict[str, Any]], stage: str, files: Any, count_records: Callable[[], int]
+) -> Generator[None, None, None]:
+    """Records the wall time and speed of a file loading stage.
+
+    Args:
+        stages: List of stages statistics to add the stage to.
+        stage: Name of the stage, e.g. "get_gff3".
+        files: Path to the file loaded, or dict of paths if the stage loads several files.
+        count_records: Function that returns the number of records loaded so far.
+    """
+    if isinstance(files, dict):
+        files = list(files.values())
+    num_records = count_records()
+    start_time = time.perf_counter()
+    yield
+    wall_time = time.perf_counter() - start_time
+    records = count_records() - num_records
+    stages.append(
+        {
+            "stage": stage,
+            "file": [str(path) for path in files] if isinstance(files, list) else str(files),
+            "wall_time": wall_time,
+            "records": records,
+            "records_per_second": records / wall_time if wall_time > 0 else None,
+        }
+    )
+
+
+def check_record(
+    name: str, check_type: str, counts: Dict[str, int], examples: Dict[str, List[str]], errors: List[str]
+) -> Dict[str, Any]:
+    """Returns the record of the result of one check, with the first examples of each kind of difference.
+
+    Args:
+        name: Name of the check.
+        check_type: Type of comparison, e.g. "ids" or "lengths".
+        counts: Number of elements found for each kind of comparison result.
+        examples: Elements found for each kind of comparison result.
+        errors: Error messages produced by the check.
+    """
+    return {
+        "name": name,
+        "type": check_type,
+        "counts": counts,
+        "examples": {key: values[:REPORT_EXAMPLES] for key, values in examples.items() if values},
+        "errors": errors,
+    }
+
+
+def peak_rss() -> Dict[str, int]:
+    """Returns the maximum resident set size reached by this process, and by any of its worker processes.
+
+    The sizes are the peaks over the whole life of the processes (not of a single stage), as reported by
+    the system (in kilobytes on Linux). The worker processes are only accounted for once they have ended.
+    """
+    return {
+        "process": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "workers": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    }
@@ -30,6 +30,7 @@ __all__ = [
     "get_gbff_seq_regions",
     "get_genbank_id",
     "get_organelle",
+    "get_organelle_location",
     "get_report_regions",
     "make_seq_region",
     "merge_seq_regions",
@@ -37,18 +38,19 @@ __all__ = [
     "report_to_csv",
 ]
 
-import csv
 import logging
 from os import PathLike
 from pathlib import Path
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+import warnings
 
-from Bio import SeqIO
 from Bio.SeqRecord import SeqRecord
-import requests
 
-from ensembl.io.genomio.utils import get_json, open_gz_file, print_json
+from ensembl.io.genomio.assembly.report import AssemblyReport
+from ensembl.io.genomio.genbank.index import get_codon_table, get_genbank_id, load_gbff_index
+from ensembl.io.genomio.genbank.scan import GBFFRecord
+from ensembl.io.genomio.utils import get_http_client, get_json, print_json
 from ensembl.utils.argparse import ArgumentParser
 from ensembl.utils.logging import init_logging_with_args
 
@@ -153,7 +155,8 @@ def add_insdc_seq_region_name(
 def add_mitochondrial_codon_table(seq_regions: List[SeqRegion], taxon_id: int) -> None:
     """Adds the mitochondrial codon table to each sequence region (when missing) based on the taxon ID.
 
-    If no mitochondrial genetic code can be found for the given taxon ID nothing will be changed.
+    If no mitochondrial genetic code can be found for the given taxon ID nothing will be changed. The
+    taxonomy is fetched with the shared HTTP client, so it can be served from its cache.
 
     Args:
         seq_regions: Sequence regions.
@@ -161,8 +164,7 @@ def add_mitochondrial_codon_table(seq_regions: List[SeqRegion], taxon_id: int) -
 
     """
     url = f"https://www.ebi.ac.uk/ena/data/taxonomy/v1/taxon/tax-id/{str(taxon_id)}"
-    response = requests.get(url, headers={"Content-Type": "application/json"}, timeout=60)
-    decoded = response.json()
+    decoded = get_http_client().get_json(url, headers={"Content-Type": "application/json"})
     if "mitochondrialGeneticCode" not in decoded:
         logging.warning("No mitochondria genetic code found for taxon {taxon_id}")
     else:
@@ -216,101 +218,76 @@ def get_gbff_seq_regions(gbff_path: PathLike) -> SeqRegionDict:
     """Returns the sequence regions found in the GBFF file (if any).
 
     Args:
-        gbff_path: Path to GBFF file.
+        gbff_path: Path to GBFF file, or to its index created with `genbank_index`.
 
     Returns:
         A dict of SeqRegions, with their name as the key.
 
     """
     seq_regions = {}
-    with open_gz_file(gbff_path) as gbff_file:
-        for record in SeqIO.parse(gbff_file, "genbank"):
-            seqr: SeqRegion = {"length": len(record.seq)}
-            # Is the seq_region circular?
-            annotations = record.annotations
-            if ("topology" in annotations) and (annotations["topology"] == "circular"):
-                seqr["circular"] = True
-            # Is there a genetic code defined?
-            codon_table = get_codon_table(record)
-            if codon_table is not None:
-                seqr["codon_table"] = codon_table
-            # Is it an organelle?
-            location = get_organelle(record)
-            if location is not None:
-                seqr["location"] = location
-            # Is there a comment stating the Genbank record this is based on?
-            genbank_id = get_genbank_id(record)
-            if genbank_id is not None:
-                seqr["synonyms"] = [{"source": "INSDC", "name": genbank_id}]
-            # Store the seq_region
-            seq_regions[record.id] = seqr
+    for record in load_gbff_index(gbff_path):
+        seqr: SeqRegion = {"length": record["length"]}
+        # Is the seq_region circular?
+        if record.get("circular"):
+            seqr["circular"] = True
+        # Is there a genetic code defined?
+        if "codon_table" in record:
+            seqr["codon_table"] = record["codon_table"]
+        # Is it an organelle?
+        location = get_organelle_location(record.get("organelle", ""))
+        if location is not None:
+            seqr["location"] = location
+        # Is there a comment stating the Genbank record this is based on?
+        if "genbank_id" in record:
+            seqr["synonyms"] = [{"source": "INSDC", "name": record["genbank_id"]}]
+        # Store the seq_region
+        seq_regions[record["id"]] = seqr
     return seq_regions
 
 
-def get_genbank_id(record: SeqRecord) -> Optional[str]:
-    """Returns the GenBank accession from a given sequence record (if present).
-
-    Only useful for RefSeq sequence records, where the GenBank accession is stored in a comment.
-
-    Args:
-        record: Sequence record.
-
-    """
-    genbank_id = None
-    if "comment" in record.annotations:
-        comment = record.annotations["comment"]
-        comment = re.sub(r"[ \n\r]+", " ", comment)
-        match = re.search(r"The reference sequence was derived from ([^\.]+)\.", comment)
-        if match:
-            genbank_id = match.group(1)
-    return genbank_id
-
-
-def get_codon_table(record: SeqRecord) -> Optional[int]:
-    """Returns the codon table number from a given a GenBank sequence record (if present).
+def get_organelle(
+    record: Union[SeqRecord, GBFFRecord], molecule_location: Optional[Dict] = None
+) -> Optional[str]:
+    """Returns the organelle location from the given GenBank record (if present).
 
     Args:
         record: GenBank sequence record.
+        molecule_location: Map of sequence type to SO location.
+
+    Raises:
+        KeyError: If the location is not part of the controlled vocabulary.
 
     """
-    table_number = None
     for feat in record.features:
-        if "transl_table" in feat.qualifiers:
-            table_number = int(feat.qualifiers["transl_table"][0])
-            break
-    return table_number
+        if "organelle" in feat.qualifiers:
+            return get_organelle_location(str(feat.qualifiers["organelle"][0]), molecule_location)
+    return None
 
 
-def get_organelle(record: SeqRecord, molecule_location: Optional[Dict] = None) -> Optional[str]:
-    """Returns the organelle location from the given GenBank record (if present).
+def get_organelle_location(organelle: str, molecule_location: Optional[Dict] = None) -> Optional[str]:
+    """Returns the location of an organelle, from the value of an `organelle` qualifier.
 
     Args:
-        record: GenBank sequence record.
+        organelle: Value of the `organelle` qualifier of a GenBank feature.
         molecule_location: Map of sequence type to SO location.
 
     Raises:
-        KeyError: If the location is not part of the controlled vocabulary.
+        UnknownMetadata: If the location is not part of the controlled vocabulary.
 
     """
     if molecule_location is None:
         molecule_location = MOLECULE_LOCATION
-    location = None
-    for feat in record.features:
-        if "organelle" in feat.qualifiers:
-            organelle = str(feat.qualifiers["organelle"][0])
-            if not organelle:
-                break
-            # Remove plastid prefix
-            with_prefix = re.match(r"^(plastid|mitochondrion):(.+)$", organelle)
-            if with_prefix:
-                organelle = with_prefix[2]
-            # Get controlled name
-            try:
-                location = molecule_location[organelle]
-            except KeyError as exc:
-                raise UnknownMetadata(f"Unrecognized sequence location: {organelle}") from exc
-            break
-    return location
+    if not organelle:
+        return None
+    # Remove plastid prefix
+    with_prefix = re.match(r"^(plastid|mitochondrion):(.+)$", organelle)
+    if with_prefix:
+        organelle = with_prefix[2]
+    # Get controlled name
+    try:
+        return molecule_location[organelle]
+    except KeyError as exc:
+        raise UnknownMetadata(f"Unrecognized sequence location: {organelle}") from exc
 
 
 def get_report_regions(report_path: PathLike, is_refseq: bool) -> SeqRegionDict:
@@ -324,13 +301,8 @@ def get_report_regions(report_path: PathLike, is_refseq: bool) -> SeqRegionDict:
         A dict of SeqRegions, with their name as the key.
 
     """
-    # Get the report in a CSV format
-    report_csv = report_to_csv(report_path)[0]
-    # Feed the csv string to the CSV reader
-    reader = csv.DictReader(report_csv.splitlines(), delimiter="\t", quoting=csv.QUOTE_NONE)
-    # Create the seq_regions
     seq_regions = {}
-    for row in reader:
+    for row in AssemblyReport(report_path):
         seq_region = make_seq_region(row, is_refseq)
         if seq_region:
             name = seq_region["name"]
@@ -407,6 +379,8 @@ def make_seq_region(
 def report_to_csv(report_path: PathLike) -> Tuple[str, Dict]:
     """Returns an assembly report as a CSV string.
 
+    Deprecated: use `ensembl.io.genomio.assembly.AssemblyReport` to read the rows one at a time instead.
+
     Args:
         report_path: path to a seq_region file from INSDC/RefSeq
 
@@ -414,24 +388,16 @@ def report_to_csv(report_path: PathLike) -> Tuple[str, Dict]:
         The data as a string in CSV format, and the head metadata as a dictionary.
 
     """
-    with open_gz_file(report_path) as report:
-        data = ""
-        metadata = {}
-        last_head = ""
-        for line in report:
-            # Ignore header
-            if line.startswith("#"):
-                # Get metadata values if possible
-                match = re.search("# (.+?): (.+?)$", line)
-                if match:
-                    metadata[match.group(1)] = match.group(2)
-                last_head = line
-            else:
-                if last_head:
-                    data += last_head[2:].strip() + "\n"
-                    last_head = ""
-                data += line
-        return data, metadata
+    warnings.warn(
+        "report_to_csv() is deprecated, use AssemblyReport instead", DeprecationWarning, stacklevel=2
+    )
+    report = AssemblyReport(report_path)
+    lines: List[str] = []
+    for row in report:
+        if not lines:
+            lines.append("\t".join(report.columns) + "\n")
+        lines.append("\t".join(row.values()) + "\n")
+    return "".join(lines), report.metadata
 
 
 def prepare_seq_region_metadata(
@@ -451,7 +417,7 @@ def prepare_seq_region_metadata(
     Args:
         genome_file: Genome metadata JSON file path.
         report_file: INSDC/RefSeq sequences report file path to parse.
-        gbff_file: INSDC/RefSeq GBFF file path to parse.
+        gbff_file: INSDC/RefSeq GBFF file path to parse, or its index created with `genbank_index`.
         dst_file: JSON file output for the processed sequence regions JSON.
         brc_mode: Include INSDC sequence region names.
         to_exclude: Sequence region names to exclude.
@@ -492,7 +458,9 @@ def main() -> None:
     parser.add_argument_src_path(
         "--report_file", required=True, help="INSDC/RefSeq sequences report file to parse"
     )
-    parser.add_argument_src_path("--gbff_file", help="INSDC/RefSeq GBFF file to parse")
+    parser.add_argument_src_path(
+        "--gbff_file", help="INSDC/RefSeq GBFF file to parse, or its index created with genbank_index"
+    )
     parser.add_argument_dst_path(
         "--dst_file", default="seq_region.json", help="Output JSON file for the processed sequence regions"
     )
@@ -15,4 +15,6 @@
 """Utils module."""
 
 from .archive_utils import *
+from .checksum_utils import *
+from .http_utils import *
 from .json_utils import *
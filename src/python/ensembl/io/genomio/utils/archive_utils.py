@@ -14,39 +14,104 @@
 # limitations under the License.
 """Utils to deal with archive files."""
 
-__all__ = ["SUPPORTED_ARCHIVE_FORMATS", "open_gz_file", "extract_file"]
+__all__ = ["SUPPORTED_ARCHIVE_FORMATS", "open_gz_file", "open_gz_output", "extract_file"]
 
 from contextlib import contextmanager
 import gzip
+import io
+import logging
 from os import PathLike
 from pathlib import Path
 import shutil
-from typing import Generator, TextIO
+import subprocess
+from typing import IO, Iterator, Optional, cast
 
 from ensembl.utils.argparse import ArgumentParser
 
 
 # Each registered format is a tuple, `(name, extensions, description)`
 SUPPORTED_ARCHIVE_FORMATS = [ext for elem in shutil.get_unpack_formats() for ext in elem[1]]
+_PIPE_BUFFER_SIZE = 1024 * 1024
 
 
 @contextmanager
-def open_gz_file(file_path: PathLike) -> Generator[TextIO, None, None]:
+def open_gz_file(file_path: PathLike, mode: str = "rt") -> Iterator[IO]:
     """Yields an open file object, even if the file is compressed with gzip.
 
-    The file is expected to contain a text, and this can be used with the usual "with".
+    The file is expected to contain a text by default, and this can be used with the usual "with".
 
     Args:
         file_path: A file path to open.
+        mode: Reading mode, i.e. "rt" for text or "rb" for binary.
 
     """
     this_file = Path(file_path)
     if this_file.suffix == ".gz":
-        with gzip.open(this_file, "rt") as fh:
-            yield fh
+        # A GzipFile has the same interface as the other binary file objects, but does not inherit from IO
+        fh = cast(IO, gzip.open(this_file, mode))
     else:
-        with this_file.open("rt") as fh:
+        fh = this_file.open(mode)
+    # Yield from a single "with" so the file is closed when a generator using it is closed early
+    with fh:
+        yield fh
+
+
+@contextmanager
+def open_gz_output(
+    file_path: PathLike,
+    mode: str = "wt",
+    compress: Optional[bool] = None,
+    threads: int = 1,
+    compress_level: int = 6,
+) -> Iterator[IO]:
+    """Yields a file object to write to, compressed with gzip if the file name ends with `.gz`.
+
+    With more than one thread, the compression is done by `pigz` in a separate process if it is
+    installed, which is much faster for large files. Otherwise, the `gzip` module is used.
+
+    Args:
+        file_path: A file path to write to.
+        mode: Writing mode, i.e. "wt" for text or "wb" for binary.
+        compress: Compress the output with gzip. By default, only if the file name ends with `.gz`.
+        threads: Number of threads used to compress the output.
+        compress_level: Compression level, from 1 (fastest) to 9 (smallest).
+
+    Raises:
+        subprocess.CalledProcessError: If `pigz` fails.
+
+    """
+    this_file = Path(file_path)
+    if compress is None:
+        compress = this_file.suffix == ".gz"
+    if not compress:
+        with this_file.open(mode) as fh:
+            yield fh
+        return
+
+    pigz = shutil.which("pigz") if threads > 1 else None
+    if pigz is None:
+        if threads > 1:
+            logging.warning(f"pigz not found, compressing {this_file} with a single thread")
+        with cast(IO, gzip.open(this_file, mode, compresslevel=compress_level)) as fh:
             yield fh
+        return
+
+    command = [pigz, "-c", f"-{compress_level}", "-p", str(threads)]
+    with this_file.open("wb") as out_fh:
+        with subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=out_fh, bufsize=_PIPE_BUFFER_SIZE
+        ) as pigz_process:
+            pigz_stdin = pigz_process.stdin
+            if pigz_stdin is None:
+                raise RuntimeError(f"Cannot write to the standard input of {pigz}")
+            if "b" in mode:
+                with pigz_stdin as fh:
+                    yield fh
+            else:
+                with io.TextIOWrapper(pigz_stdin, encoding="utf-8") as fh:
+                    yield fh
+    if pigz_process.returncode != 0:
+        raise subprocess.CalledProcessError(pigz_process.returncode, command)
 
 
 def extract_file(src_file: PathLike, dst_dir: PathLike) -> None:
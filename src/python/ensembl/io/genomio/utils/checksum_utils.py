@@ -0,0 +1,39 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Utils to compute file checksums."""
+
+__all__ = ["MD5_CHUNK_SIZE", "md5sum"]
+
+import hashlib
+from os import PathLike
+from pathlib import Path
+
+
+# Size of the blocks read from disk when computing a file checksum
+MD5_CHUNK_SIZE = 1024 * 1024
+
+
+def md5sum(file_path: PathLike, chunk_size: int = MD5_CHUNK_SIZE) -> str:
+    """Returns the MD5 checksum of a file, read in chunks so the memory used does not depend on its size.
+
+    Args:
+        file_path: Path to the file.
+        chunk_size: Number of bytes read at once.
+    """
+    file_hash = hashlib.md5()
+    with Path(file_path).open("rb") as file_fh:
+        for chunk in iter(lambda: file_fh.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
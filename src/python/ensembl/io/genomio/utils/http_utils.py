@@ -0,0 +1,212 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared HTTP client with connection reuse and an on-disk cache of the responses.
+
+The web services queried for every genome (e.g. the ENA taxonomy) are called through one shared client, so
+the connections are reused, and the responses can be cached on disk and served without any network access.
+
+The shared client returned by `get_http_client()` is configured with the environment variables:
+ * `GENOMIO_HTTP_CACHE_DIR`: Folder where the responses are cached (no cache if not set).
+ * `GENOMIO_HTTP_CACHE_TTL_DAYS`: Number of days a cached response is used before fetching it again.
+ * `GENOMIO_HTTP_OFFLINE`: If set to "1", "true" or "yes", only serve the responses from the cache.
+
+"""
+
+__all__ = [
+    "DEFAULT_CACHE_TTL_DAYS",
+    "DEFAULT_TIMEOUT",
+    "CachedHTTPClient",
+    "HTTPCacheMissError",
+    "get_http_client",
+    "set_http_client",
+]
+
+import hashlib
+import json
+import logging
+import os
+from os import PathLike
+from pathlib import Path
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+# Number of days a cached response is used before fetching it again
+DEFAULT_CACHE_TTL_DAYS = 30.0
+# Number of seconds to wait for the server before giving up
+DEFAULT_TIMEOUT = 60
+# Retries of the requests that fail on a connection error or a transient server error
+_RETRY = Retry(total=3, backoff_factor=1, status_forcelist=(429, 500, 502, 503, 504))
+_TRUE_VALUES = ("1", "true", "yes")
+
+_shared_client: Optional["CachedHTTPClient"] = None
+
+
+class HTTPCacheMissError(Exception):
+    """When a response is requested in offline mode, but it is not in the cache."""
+
+
+class CachedHTTPClient:
+    """HTTP client that reuses its connections, and caches the successful responses on disk by URL.
+
+    Each response body is stored in a file named after the SHA-256 digest of its URL. Only the responses
+    with a 2xx status code are cached, so failed requests are tried again the next time.
+
+    Attributes:
+        cache_dir: Folder where the responses are cached (no cache if `None`).
+        ttl_days: Number of days a cached response is used before fetching it again.
+        offline: Only serve the responses from the cache, whatever their age, without any network access.
+        timeout: Number of seconds to wait for the server before giving up.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[PathLike] = None,
+        ttl_days: float = DEFAULT_CACHE_TTL_DAYS,
+        offline: bool = False,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.ttl_days = ttl_days
+        self.offline = offline
+        self.timeout = timeout
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def session(self) -> requests.Session:
+        """Session shared by all the requests, created on first use."""
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(max_retries=_RETRY)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+
+    def close(self) -> None:
+        """Closes the connections of the session."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def get_cache_path(self, url: str) -> Optional[Path]:
+        """Returns the path to the cached response of a URL, or `None` if there is no cache.
+
+        Args:
+            url: Requested URL.
+
+        """
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / hashlib.sha256(url.encode()).hexdigest()
+
+    def is_cached(self, url: str) -> bool:
+        """Returns True if the response of a URL is cached and has not expired (in offline mode, if cached).
+
+        Args:
+            url: Requested URL.
+
+        """
+        cache_path = self.get_cache_path(url)
+        if cache_path is None or not cache_path.is_file():
+            return False
+        if self.offline:
+            return True
+        age_days = (time.time() - cache_path.stat().st_mtime) / (24 * 3600)
+        return age_days < self.ttl_days
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> bytes:
+        """Returns the body of the response to a GET request, from the cache if possible.
+
+        Args:
+            url: URL to request.
+            headers: Headers of the request (not part of the cache key).
+
+        Raises:
+            HTTPCacheMissError: If the client is offline, and the response is not cached.
+            requests.RequestException: If the request failed.
+
+        """
+        cache_path = self.get_cache_path(url)
+        if self.is_cached(url):
+            logging.debug(f"Using the cached response of {url}")
+            return cache_path.read_bytes()  # type: ignore[union-attr]
+        if self.offline:
+            raise HTTPCacheMissError(f"No cached response for {url} in offline mode")
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        if response.ok:
+            self._write_cache(cache_path, response.content)
+        return response.content
+
+    def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Returns the body of the response to a GET request as text, from the cache if possible.
+
+        Args:
+            url: URL to request.
+            headers: Headers of the request (not part of the cache key).
+
+        """
+        return self.get(url, headers).decode()
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+        """Returns the parsed JSON response to a GET request, from the cache if possible.
+
+        Args:
+            url: URL to request.
+            headers: Headers of the request (not part of the cache key).
+
+        """
+        return json.loads(self.get(url, headers))
+
+    @staticmethod
+    def _write_cache(cache_path: Optional[Path], content: bytes) -> None:
+        """Stores a response body in the cache, if there is one."""
+        if cache_path is None:
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent jobs never read a partial response
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(cache_path)
+
+
+def get_http_client() -> CachedHTTPClient:
+    """Returns the shared HTTP client, created from the environment variables on first use."""
+    global _shared_client  # pylint: disable=global-statement
+    if _shared_client is None:
+        cache_dir = os.environ.get("GENOMIO_HTTP_CACHE_DIR")
+        _shared_client = CachedHTTPClient(
+            cache_dir=Path(cache_dir) if cache_dir else None,
+            ttl_days=float(os.environ.get("GENOMIO_HTTP_CACHE_TTL_DAYS", DEFAULT_CACHE_TTL_DAYS)),
+            offline=os.environ.get("GENOMIO_HTTP_OFFLINE", "").lower() in _TRUE_VALUES,
+        )
+    return _shared_client
+
+
+def set_http_client(client: Optional[CachedHTTPClient]) -> None:
+    """Replaces the shared HTTP client (e.g. to change its cache), or resets it if `None`.
+
+    Args:
+        client: New shared HTTP client.
+
+    """
+    global _shared_client  # pylint: disable=global-statement
+    if _shared_client is not None and _shared_client is not client:
+        _shared_client.close()
+    _shared_client = client
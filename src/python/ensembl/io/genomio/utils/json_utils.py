@@ -14,12 +14,21 @@
 # limitations under the License.
 """Utils to deal with JSON files."""
 
-__all__ = ["get_json", "print_json"]
+__all__ = ["get_json", "iter_json_array", "print_json", "print_json_array"]
 
 import json
+from itertools import islice
 from os import PathLike
 from pathlib import Path
-from typing import Any
+import re
+from typing import Any, Iterable, Iterator
+
+
+# Number of characters read at once when streaming a JSON file
+JSON_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset([",", "]", " ", "\t", "\n", "\r"])
 
 
 def get_json(src_path: PathLike, **kwargs) -> Any:
@@ -33,6 +42,75 @@ def get_json(src_path: PathLike, **kwargs) -> Any:
         return json.load(json_file, **kwargs)
 
 
+def iter_json_array(src_path: PathLike, chunk_size: int = JSON_CHUNK_SIZE) -> Iterator[Any]:
+    """Yields the elements of a JSON file containing an array, one at a time.
+
+    The file is read in chunks and each element is decoded as soon as it is complete, so only one element
+    is kept in memory at any time, instead of the whole array as `get_json()` does.
+
+    Args:
+        src_path: Path to the JSON file to load.
+        chunk_size: Number of characters to read at once.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a valid JSON array.
+
+    """
+    decoder = json.JSONDecoder()
+    with Path(src_path).open("r") as json_file:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def _read_more() -> None:
+            """Drops the decoded part of the buffer and appends the next chunk of the file."""
+            nonlocal buffer, pos, eof
+            # Read at least as much as is already buffered, so large elements are not decoded too often
+            chunk = json_file.read(max(chunk_size, len(buffer) - pos))
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            eof = not chunk
+
+        def _next_char() -> str:
+            """Returns the next non-whitespace character without consuming it (empty at the end of file)."""
+            nonlocal pos
+            while True:
+                pos = _WHITESPACE.match(buffer, pos).end()  # type: ignore[union-attr]
+                if pos < len(buffer) or eof:
+                    return buffer[pos : pos + 1]
+                _read_more()
+
+        if _next_char() != "[":
+            raise json.JSONDecodeError("Expecting '['", buffer, pos)
+        pos += 1
+        if _next_char() == "]":
+            pos += 1
+        else:
+            while True:
+                _next_char()
+                try:
+                    element, end = decoder.raw_decode(buffer, pos)
+                    # A number cut by the end of the buffer would still be decoded, so make sure the
+                    # element is followed by a delimiter before accepting it
+                    if not eof and buffer[end : end + 1] not in _DELIMITERS:
+                        raise json.JSONDecodeError("Incomplete element", buffer, end)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    _read_more()
+                    continue
+                pos = end
+                yield element
+                separator = _next_char()
+                pos += 1
+                if separator == "]":
+                    break
+                if separator != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos - 1)
+        if _next_char() != "":
+            raise json.JSONDecodeError("Extra data", buffer, pos)
+
+
 def print_json(dst_path: PathLike, data: Any, **kwargs) -> None:
     """Generic data JSON dumper to a file, with keys sorted and pretty-printed with indent 4 by default.
 
@@ -45,3 +123,43 @@ def print_json(dst_path: PathLike, data: Any, **kwargs) -> None:
     kwargs.setdefault("indent", 4)
     with Path(dst_path).open("w") as json_file:
         json_file.write(json.dumps(data, **kwargs))
+
+
+def print_json_array(dst_path: PathLike, elements: Iterable[Any], chunk_size: int = 1000, **kwargs) -> None:
+    """Writes an array to a JSON file a few elements at a time, with the same output as `print_json()`.
+
+    Only `chunk_size` elements are serialised at any time, instead of the whole array, so the elements
+    can be generated while they are written.
+
+    Args:
+        dst_path: Path to the JSON file to create.
+        elements: Elements of the array, e.g. a generator.
+        chunk_size: Number of elements serialised at once.
+
+    """
+    kwargs.setdefault("sort_keys", True)
+    kwargs.setdefault("indent", 4)
+    indented = kwargs["indent"] is not None
+    item_separator = "," if indented else ", "
+    if kwargs.get("separators"):
+        item_separator = kwargs["separators"][0]
+    # Create the encoder only once, instead of once per chunk with json.dumps()
+    encoder = kwargs.pop("cls", json.JSONEncoder)(**kwargs)
+
+    elements_iter = iter(elements)
+    with Path(dst_path).open("w") as json_file:
+        json_file.write("[")
+        empty = True
+        while True:
+            chunk = list(islice(elements_iter, chunk_size))
+            if not chunk:
+                break
+            # Each chunk is encoded as an array, with the elements already indented, without its brackets
+            json_chunk = encoder.encode(chunk)[1:-1]
+            if indented:
+                json_chunk = json_chunk[:-1]
+            if not empty:
+                json_file.write(item_separator)
+            json_file.write(json_chunk)
+            empty = False
+        json_file.write("\n]" if indented and not empty else "]")
@@ -0,0 +1,100 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.assembly.datasets` module.
+
+The `datasets` executable is replaced by an offline stand-in script found in the test data folder.
+
+Typical usage example::
+    $ pytest test_datasets.py
+
+"""
+
+import os
+from pathlib import Path
+import time
+from typing import List
+
+import pytest
+from pytest import MonkeyPatch
+
+from ensembl.io.genomio.assembly.datasets import DatasetsError, DatasetsSummaries
+
+
+@pytest.fixture(name="calls_file")
+def fixture_calls_file(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    """Returns the file where the stand-in `datasets` records its calls."""
+    calls_file = tmp_path / "calls.txt"
+    monkeypatch.setenv("DATASETS_CALLS", str(calls_file))
+    return calls_file
+
+
+def _get_calls(calls_file: Path) -> List[str]:
+    """Returns the accessions requested in each call of the stand-in `datasets`."""
+    if not calls_file.exists():
+        return []
+    return calls_file.read_text().splitlines()
+
+
+def test_get_summaries(data_dir: Path, tmp_path: Path, calls_file: Path) -> None:
+    """Tests that `DatasetsSummaries.get_summaries()` fetches the missing summaries in one call.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        calls_file: File where the stand-in `datasets` records its calls.
+
+    """
+    cache_dir = tmp_path / "cache"
+    summaries = DatasetsSummaries(str(data_dir / "datasets"), cache_dir)
+    result = summaries.get_summaries(["GCA_000000001.1", "GCA_000000002", "GCF_000000003.1"])
+    assert result["GCA_000000001.1"]["reports"][0]["accession"] == "GCA_000000001.1"
+    assert result["GCA_000000002"]["reports"][0]["accession"] == "GCA_000000002.1"
+    assert result["GCF_000000003.1"] == {"reports": [], "total_count": 0}
+    assert _get_calls(calls_file) == ["GCA_000000001.1 GCA_000000002 GCF_000000003.1"]
+    # Only the new accession is fetched, the others come from the cache
+    summaries.get_summaries(["GCA_000000001.1", "GCA_000000004.2", "GCF_000000003.1"])
+    assert _get_calls(calls_file)[1:] == ["GCA_000000004.2"]
+    assert (cache_dir / "GCA_000000004.2.json").is_file()
+
+
+def test_cache_ttl(data_dir: Path, tmp_path: Path, calls_file: Path) -> None:
+    """Tests that expired summaries are fetched again.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        calls_file: File where the stand-in `datasets` records its calls.
+
+    """
+    summaries = DatasetsSummaries(str(data_dir / "datasets"), tmp_path, ttl_days=1)
+    summaries.get_summary("GCA_000000001.1")
+    assert summaries.is_cached("GCA_000000001.1")
+    two_days_ago = time.time() - 2 * 24 * 3600
+    os.utime(tmp_path / "GCA_000000001.1.json", (two_days_ago, two_days_ago))
+    assert not summaries.is_cached("GCA_000000001.1")
+    summaries.get_summary("GCA_000000001.1")
+    assert len(_get_calls(calls_file)) == 2
+
+
+def test_datasets_error(tmp_path: Path) -> None:
+    """Tests that a missing `datasets` executable raises a `DatasetsError`.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    summaries = DatasetsSummaries(str(tmp_path / "no_datasets"), tmp_path)
+    with pytest.raises(DatasetsError):
+        summaries.get_summary("GCA_000000001.1")
@@ -0,0 +1,73 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.assembly.report` module."""
+
+import gzip
+from pathlib import Path
+import shutil
+
+import pytest
+
+from ensembl.io.genomio.assembly.report import REST_KEY, AssemblyReport
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_assembly_report(data_dir: Path, tmp_path: Path, compressed: bool) -> None:
+    """Tests the rows and metadata read from an assembly report."""
+    report_path = data_dir / "assembly_report.txt"
+    if compressed:
+        gz_path = tmp_path / "assembly_report.txt.gz"
+        with report_path.open("rb") as report_fh, gzip.open(gz_path, "wb") as gz_fh:
+            shutil.copyfileobj(report_fh, gz_fh)
+        report_path = gz_path
+
+    report = AssemblyReport(report_path)
+    rows = list(report)
+    assert len(rows) == 2
+    assert report.columns[0] == "Sequence-Name"
+    assert rows[1]["Sequence-Name"] == "HcG217B07"
+    assert rows[1]["Assigned-Molecule-Location/Type"] == "Mitochondrion"
+    assert rows[1]["Sequence-Length"] == "41220"
+    assert report.metadata["Assembly level"] == "Contig"
+    assert report.metadata["GenBank assembly accession"] == "GCA_000000000.1"
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        pytest.param(
+            "chr1\tassembled-molecule\t1", {"A": "chr1", "B": "assembled-molecule", "C": "1"}, id="Full"
+        ),
+        pytest.param(
+            "chr1\tassembled-molecule", {"A": "chr1", "B": "assembled-molecule", "C": None}, id="Short"
+        ),
+        pytest.param(
+            "chr1\tassembled-molecule\t1\tna\tx",
+            {"A": "chr1", "B": "assembled-molecule", "C": "1", REST_KEY: ["na", "x"]},
+            id="Long",
+        ),
+    ],
+)
+def test_assembly_report_row_length(tmp_path: Path, line: str, expected: dict) -> None:
+    """Tests that the rows with missing or extra fields are read like `csv.DictReader` does."""
+    report_path = tmp_path / "assembly_report.txt"
+    report_path.write_text(f"# Assembly level: Contig\n# A\tB\tC\n{line}\n")
+    assert list(AssemblyReport(report_path)) == [expected]
+
+
+def test_read_metadata(data_dir: Path) -> None:
+    """Tests that the metadata can be read without iterating over the rows."""
+    report = AssemblyReport(data_dir / "assembly_report.txt")
+    assert report.read_metadata()["Genome representation"] == "full"
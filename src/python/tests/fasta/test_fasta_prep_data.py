@@ -21,6 +21,8 @@ Typical usage example::
 
 from contextlib import nullcontext as does_not_raise
 import filecmp
+import gzip
+import io
 from pathlib import Path
 from typing import ContextManager, Set
 
@@ -91,6 +93,53 @@ def test_fasta_prep(
     assert filecmp.cmp(fasta_output_path, expected_path)
 
 
+def test_fasta_prep_gzip(tmp_path: Path, data_dir: Path) -> None:
+    """Tests that `process.prep_fasta_data()` compresses the output file if its name ends with `.gz`.
+
+    Args:
+        tmp_path: Where temporary files will be created.
+        data_dir: Module's test data directory fixture.
+
+    """
+    fasta_output_path = tmp_path / "output.protein.fa.gz"
+    FastaProcessing.prep_fasta_data(
+        fasta_infile=data_dir / "input.protein.fa.gz",
+        genbank_infile=None,
+        fasta_outfile=fasta_output_path,
+        peptide_mode=True,
+    )
+    with gzip.open(fasta_output_path, "rb") as output_fh:
+        assert output_fh.read() == (data_dir / "output.protein.fa").read_bytes()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 1024])
+@pytest.mark.parametrize(
+    "content, to_exclude, expected",
+    [
+        pytest.param(b"", set(), b"", id="Empty file"),
+        pytest.param(b">a x\nAC\nGT\n>b\nTT\n", {"b"}, b">a x\nAC\nGT\n", id="Exclude last"),
+        pytest.param(b">a x\nAC\nGT\n>b\nTT\n", {"a"}, b">b\nTT\n", id="Exclude first"),
+        pytest.param(b"junk\n>a\nAC\n", set(), b">a\nAC\n", id="Lines before the first header"),
+        pytest.param(b">a\nAC>GT\n>b\n\nTT", {"c"}, b">a\nAC>GT\n>b\n\nTT", id="Lines unchanged"),
+        pytest.param(b">a\r\nAC\r\n>b\r\nTT\r\n", {"b"}, b">a\r\nAC\r\n", id="Windows line ends"),
+        pytest.param(b">a\nAC\n>\nGT\n>b", {"b"}, b">a\nAC\n>\nGT\n", id="Empty ID, last header"),
+    ],
+)
+def test_filter_fasta(content: bytes, to_exclude: Set[str], expected: bytes, chunk_size: int) -> None:
+    """Tests that `process.filter_fasta()` copies the lines of the records kept, whatever the chunk size.
+
+    Args:
+        content: Content of the input FASTA file.
+        to_exclude: IDs of the records to skip.
+        expected: Expected content of the output FASTA file.
+        chunk_size: Number of bytes to read at once.
+
+    """
+    out_fasta = io.BytesIO()
+    FastaProcessing.filter_fasta(io.BytesIO(content), out_fasta, to_exclude, chunk_size=chunk_size)
+    assert out_fasta.getvalue() == expected
+
+
 @pytest.mark.parametrize(
     "input_gbff, excluded_seq_regions, output, expectation",
     [
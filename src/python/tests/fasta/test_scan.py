@@ -0,0 +1,79 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.fasta.scan` module.
+
+Typical usage example::
+    $ pytest test_scan.py
+
+"""
+
+from pathlib import Path
+
+from Bio import SeqIO
+import pytest
+
+from ensembl.io.genomio.fasta import scan_fasta
+from ensembl.io.genomio.utils import open_gz_file
+
+
+@pytest.mark.parametrize(
+    "input_fasta",
+    [
+        ("input.fa"),
+        pytest.param("../test_fasta_prep_data/input.fna.gz", id="Gzipped DNA"),
+        pytest.param("../test_fasta_prep_data/input.protein.fa.gz", id="Gzipped peptides"),
+    ],
+)
+def test_scan_fasta_lengths(data_dir: Path, input_fasta: str) -> None:
+    """Tests that `scan_fasta()` finds the same IDs and lengths as Biopython.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        input_fasta: Name of the FASTA file with example input, in the test folder.
+
+    """
+    fasta_path = data_dir / input_fasta
+    with open_gz_file(fasta_path) as fasta_fh:
+        expected = {rec.id: len(rec.seq) for rec in SeqIO.parse(fasta_fh, "fasta") if rec.id}
+    assert scan_fasta(fasta_path).lengths == expected
+
+
+@pytest.mark.parametrize(
+    "ignore_final_stops, expected_stops, expected_with_stops",
+    [
+        (False, {"seq1": 2, "seq2": 1}, 2),
+        (True, {"seq1": 1}, 1),
+    ],
+)
+def test_scan_fasta_summary(
+    data_dir: Path, ignore_final_stops: bool, expected_stops: dict, expected_with_stops: int
+) -> None:
+    """Tests the duplicated/empty IDs and stop codons counts of `scan_fasta()`.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        ignore_final_stops: Do not count the stop codons at the end of a sequence.
+        expected_stops: Expected number of stop codons per sequence ID.
+        expected_with_stops: Expected number of sequences with stop codons.
+
+    """
+    summary = scan_fasta(data_dir / "input.fa", ignore_final_stops=ignore_final_stops)
+    assert summary.num_records == 5
+    assert summary.num_empty_ids == 1
+    assert summary.num_duplicates == 1
+    assert summary.duplicate_ids == {"seq1"}
+    assert summary.lengths == {"seq1": 5, "seq2": 4, "seq3": 0}
+    assert summary.stop_codons == expected_stops
+    assert summary.num_with_stops == expected_with_stops
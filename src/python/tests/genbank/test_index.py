@@ -0,0 +1,83 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.genbank.index` module.
+
+Typical usage example::
+    $ pytest test_index.py
+
+"""
+
+from pathlib import Path
+
+from Bio import SeqIO
+import pytest
+
+from ensembl.io.genomio.genbank.index import (
+    index_gbff,
+    index_gbff_record,
+    is_gbff_index,
+    load_gbff_index,
+    write_gbff_index,
+)
+
+
+_EXPECTED_INDEX = [
+    {
+        "circular": True,
+        "codon_table": 4,
+        "genbank_id": "CP000001",
+        "id": "NC_000001.2",
+        "length": 120,
+        "organelle": "mitochondrion",
+        "protein_ids": ["WP_000001.1"],
+    },
+    {"id": "NC_000002.1", "length": 60},
+]
+
+
+@pytest.fixture(name="gbff_path")
+def fixture_gbff_path(shared_data_dir: Path) -> Path:
+    """Returns the GBFF test file shared with the scan tests.
+
+    Args:
+        shared_data_dir: Folder with test files shared between test modules.
+
+    """
+    return shared_data_dir / "genbank" / "input.gbff"
+
+
+def test_index_gbff(gbff_path: Path) -> None:
+    """Tests the index entries of a GBFF file, and that they are the same from Biopython records."""
+    assert list(index_gbff(gbff_path)) == _EXPECTED_INDEX
+    assert [index_gbff_record(record) for record in SeqIO.parse(gbff_path, "genbank")] == _EXPECTED_INDEX
+
+
+@pytest.mark.parametrize("from_index", [False, True])
+def test_load_gbff_index(gbff_path: Path, tmp_path: Path, from_index: bool) -> None:
+    """Tests that `load_gbff_index()` gives the same entries from a GBFF file or its index."""
+    index_path = tmp_path / "gbff_index.json"
+    write_gbff_index(gbff_path, index_path)
+    assert is_gbff_index(index_path)
+    assert not is_gbff_index(gbff_path)
+    assert list(load_gbff_index(index_path if from_index else gbff_path)) == _EXPECTED_INDEX
+
+
+def test_load_gbff_index_without_features(gbff_path: Path) -> None:
+    """Tests that only the header data is indexed when the features are not requested."""
+    entries = list(load_gbff_index(gbff_path, with_features=False))
+    assert entries == [
+        {"circular": True, "genbank_id": "CP000001", "id": "NC_000001.2", "length": 120},
+        {"id": "NC_000002.1", "length": 60},
+    ]
@@ -0,0 +1,99 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.genbank.scan` module.
+
+Typical usage example::
+    $ pytest test_scan.py
+
+"""
+
+from contextlib import nullcontext as does_not_raise
+import io
+from pathlib import Path
+from typing import ContextManager
+
+from Bio import SeqIO
+import pytest
+
+from ensembl.io.genomio.genbank.scan import GBFFScanError, _skip_to_record_end, scan_gbff
+from ensembl.io.genomio.utils import open_gz_file
+
+
+@pytest.mark.parametrize(
+    "input_gbff",
+    [
+        pytest.param("data/genbank/input.gbff", id="Circular RefSeq record with a comment"),
+        pytest.param("fasta/test_fasta_prep_data/input.gbff.gz", id="Gzipped GBFF"),
+    ],
+)
+def test_scan_gbff(shared_data_dir: Path, input_gbff: str) -> None:
+    """Tests that `scan_gbff()` finds the same headers and features as Biopython.
+
+    Args:
+        shared_data_dir: Folder with test files shared between test modules.
+        input_gbff: Path to the GBFF file with example input, relative to the tests folder.
+
+    """
+    gbff_path = shared_data_dir.parent / input_gbff
+    with open_gz_file(gbff_path) as gbff_fh:
+        expected = list(SeqIO.parse(gbff_fh, "genbank"))
+    records = list(scan_gbff(gbff_path))
+    assert [(rec.id, rec.name, rec.length) for rec in records] == [
+        (rec.id, rec.name, len(rec.seq)) for rec in expected
+    ]
+    for record, exp_record in zip(records, expected):
+        for key in ("topology", "molecule_type", "accessions", "comment"):
+            assert record.annotations.get(key) == exp_record.annotations.get(key)
+        assert [(feat.type, feat.qualifiers) for feat in record.features] == [
+            (feat.type, dict(feat.qualifiers)) for feat in exp_record.features
+        ]
+
+
+def test_scan_gbff_without_features(shared_data_dir: Path) -> None:
+    """Tests `scan_gbff()` when the features are not requested."""
+    records = list(scan_gbff(shared_data_dir / "genbank" / "input.gbff", with_features=False))
+    assert [(rec.id, rec.length, rec.features) for rec in records] == [
+        ("NC_000001.2", 120, []),
+        ("NC_000002.1", 60, []),
+    ]
+    assert records[0].annotations["comment"].endswith("derived from CP000001.1.")
+
+
+@pytest.mark.parametrize(
+    "content, expectation",
+    [
+        pytest.param("LOCUS       A  10 bp  DNA\n//\n", does_not_raise(), id="Minimal record"),
+        pytest.param(
+            "LOCUS       A  10 bp  DNA\nORIGIN\n  1 acgt\n", pytest.raises(GBFFScanError), id="No //"
+        ),
+        pytest.param("DEFINITION  a record.\n//\n", pytest.raises(GBFFScanError), id="No LOCUS"),
+    ],
+)
+def test_scan_gbff_errors(tmp_path: Path, content: str, expectation: ContextManager) -> None:
+    """Tests the errors raised by `scan_gbff()` for malformed files."""
+    gbff_path = tmp_path / "test.gbff"
+    gbff_path.write_text(content)
+    with expectation:
+        list(scan_gbff(gbff_path))
+
+
+@pytest.mark.parametrize("buffer_size", [1, 2, 3, 5, 8, 13, 64])
+def test_skip_to_record_end(buffer_size: int) -> None:
+    """Tests that `_skip_to_record_end()` stops at the `//` line, whatever the size of the buffer."""
+    data = b"ORIGIN\n        1 acgtacgtac gtacgt\n       17 acgt\n//\nLOCUS       B\n"
+    gbff_fh = io.BufferedReader(io.BytesIO(data), buffer_size=buffer_size)  # type: ignore[arg-type]
+    gbff_fh.readline()
+    assert _skip_to_record_end(gbff_fh) == b"//\n"
+    assert gbff_fh.read() == b"LOCUS       B\n"
@@ -0,0 +1,77 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.gff3.biotypes` module."""
+
+import pytest
+
+from ensembl.io.genomio.gff3 import BiotypeRegistry, RootType, get_biotype_registry
+
+
+@pytest.mark.parametrize(
+    "feat_type, expected",
+    [
+        ("gene", RootType.GENE),
+        ("pseudogene", RootType.GENE),
+        ("mRNA", RootType.TRANSCRIPT),
+        ("transposable_element", RootType.NON_GENE),
+        ("region", RootType.IGNORED),
+        pytest.param("intron", RootType.IGNORED, id="Also an ignored transcript type"),
+        ("CDS", RootType.OTHER),
+        ("protein_coding_gene", RootType.OTHER),
+    ],
+)
+def test_get_root_type(feat_type: str, expected: RootType) -> None:
+    """Tests the `BiotypeRegistry.get_root_type()` method.
+
+    Args:
+        feat_type: Type of the root feature.
+        expected: Expected root type.
+
+    """
+    assert get_biotype_registry().get_root_type(feat_type) is expected
+
+
+@pytest.mark.parametrize(
+    "feat_type, expected",
+    [
+        ("mRNA", True),
+        ("five_prime_UTR", True),
+        ("exon", False),
+    ],
+)
+def test_is_known_transcript_type(feat_type: str, expected: bool) -> None:
+    """Tests the `BiotypeRegistry.is_known_transcript_type()` method.
+
+    Args:
+        feat_type: Type of the transcript.
+        expected: Expected result.
+
+    """
+    assert get_biotype_registry().is_known_transcript_type(feat_type) == expected
+
+
+def test_precedence() -> None:
+    """Tests that ignored types take precedence over the other types of root features."""
+    registry = BiotypeRegistry(
+        {
+            "gene": {"supported": ["gene", "tRNA"], "ignored": ["region"]},
+            "non_gene": {"supported": ["region", "tRNA"]},
+            "transcript": {"supported": ["tRNA"]},
+        }
+    )
+    assert registry.get_root_type("region") is RootType.IGNORED
+    assert registry.get_root_type("tRNA") is RootType.NON_GENE
+    assert registry.ignored_transcript_types == frozenset()
+    assert get_biotype_registry() is get_biotype_registry()
@@ -23,6 +23,7 @@ Typical usage example::
 """
 
 from contextlib import nullcontext as does_not_raise
+from pathlib import Path
 from typing import ContextManager, Optional
 
 from Bio.SeqFeature import SeqFeature
@@ -30,10 +31,12 @@ import pytest
 from pytest import raises
 
 from ensembl.io.genomio.gff3.extract_annotation import (
+    DescriptionClassifier,
     FunctionalAnnotations,
     MissingParentError,
     AnnotationError,
 )
+from ensembl.io.genomio.utils import print_json
 
 
 @pytest.mark.parametrize(
@@ -75,6 +78,24 @@ def test_product_is_informative(description: str, feature_id: Optional[str], out
     assert FunctionalAnnotations.product_is_informative(description, feature_id) == output
 
 
+@pytest.mark.parametrize(
+    "description, feature_id, output",
+    [
+        ("hypothetical protein PRO00004.1", "PRO00004.1", False),
+        pytest.param("hypothetical protein PRO0000401", "PRO00004.1", False, id="ID used as a regex"),
+        ("hypothetical protein PRO00004.1", "PRO00005.1", True),
+        ("Kinase PRO00004", "PRO00004", True),
+        ("protéine hypothétique PROTID", "protid", True),
+    ],
+)
+def test_description_classifier(description: str, feature_id: Optional[str], output: bool) -> None:
+    """Tests the `DescriptionClassifier.is_informative()` method, with and without cached results."""
+    for cache_size in (0, 2):
+        classifier = DescriptionClassifier(cache_size=cache_size)
+        assert classifier.is_informative(description, feature_id) == output
+        assert classifier.is_informative(description, feature_id) == output
+
+
 @pytest.mark.parametrize(
     "seq_feat_type, feat_type, expected",
     [
@@ -288,3 +309,32 @@ def test_transfer_descriptions(
     transcs = annot.get_features("transcript")
     assert genes[gene_name].get("description") == out_gene_desc
     assert transcs[transcript_name].get("description") == out_transc_desc
+
+
+def test_to_json(tmp_path: Path) -> None:
+    """Tests the `FunctionaAnnotation.to_json()` method, which writes the annotations one at a time.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    annot = FunctionalAnnotations()
+    gene = SeqFeature(type="pseudogene", id="gene_A", qualifiers={"Name": ["Kinase A"]})
+    transcript = SeqFeature(type="mRNA", id="tran_A", qualifiers={"product": ["hypothetical protein"]})
+    annot.add_feature(gene, "gene")
+    annot.add_feature(transcript, "transcript", parent_id=gene.id)
+    annot.add_feature(SeqFeature(type="transposable_element", id="te_A"), "transposable_element")
+    expected = [
+        {
+            "object_type": "gene",
+            "id": "gene_A",
+            "description": "Kinase A",
+            "synonyms": {"synonym": "Kinase A", "default": True},
+            "is_pseudogene": True,
+        },
+        {"object_type": "transcript", "id": "tran_A"},
+        {"object_type": "transposable_element", "id": "te_A"},
+    ]
+    annot.to_json(tmp_path / "out.json")
+    print_json(tmp_path / "expected.json", expected)
+    assert (tmp_path / "out.json").read_text() == (tmp_path / "expected.json").read_text()
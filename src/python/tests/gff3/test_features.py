@@ -0,0 +1,161 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.gff3.features` module."""
+
+from contextlib import nullcontext as does_not_raise
+import gzip
+from io import StringIO
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Tuple
+
+from BCBio import GFF
+from Bio.SeqFeature import SeqFeature
+import pytest
+
+from ensembl.io.genomio.gff3 import (
+    GFFFeature,
+    GFFFeatureError,
+    from_seq_feature,
+    get_gff3_id_and_parents,
+    parse_gff3_attributes,
+    parse_gff3_features,
+    to_seq_feature,
+)
+
+
+_GFF3_LINES = [
+    "##gff-version 3",
+    "chr2\ttest\tgene\t1\t500\t.\t+\t.\tID=gene3;Name=my%3Bgene",
+    "chr2\ttest\tmRNA\t1\t500\t.\t+\t.\tID=tr3;Parent=gene3",
+    "chr2\ttest\texon\t1\t100\t.\t+\t.\tParent=tr3",
+    "chr2\ttest\tCDS\t1\t100\t.\t+\t0\tID=cds3;Parent=tr3",
+    "chr1\ttest\tgene\t1\t1000\t.\t+\t.\tID=gene1",
+    "chr1\t.\tregion\t1\t5000\t1.5\t.\t.\tName=no_id",
+    "chr1\ttest\tmRNA\t1\t1000\t.\t+\t.\tID=tr1;Parent=gene1",
+    "chr1\ttest\texon\t1\t500\t.\t+\t.\tID=exon1;Parent=tr1,exon1",
+    "chr1\ttest\tgene\t2000\t3000\t.\t-\t.\tID=gene1",
+    "chr1\ttest\tmRNA\t2000\t3000\t.\t-\t.\tID=tr2;Parent=gene1",
+    "chr1\ttest\texon\t2000\t2500\t.\t-\t.\tParent=missing1",
+    "chr1\ttest\texon\t2600\t3000\t.\t-\t.\tParent=missing1",
+    "chr1\ttest\texon\t4000\t4100\t.\t+\t.\tParent=missing2",
+    "##FASTA",
+    ">chr1",
+    "ACGT",
+]
+
+
+def _dump(feature: SeqFeature) -> List[Tuple[Any, ...]]:
+    """Returns the location, type, ID and qualifiers of a feature and all its sub-features."""
+    dump = [
+        (
+            int(feature.location.start),
+            int(feature.location.end),
+            feature.location.strand,
+            feature.type,
+            feature.id,
+            feature.qualifiers,
+        )
+    ]
+    for sub_feature in feature.sub_features:
+        dump += _dump(sub_feature)
+    return dump
+
+
+@pytest.mark.parametrize(
+    "attributes, expected",
+    [
+        pytest.param("", {}, id="Empty"),
+        pytest.param("ID=a;Parent=b,c", {"ID": ["a"], "Parent": ["b", "c"]}, id="Multiple values"),
+        pytest.param("Name=a%3Bb; Note=x=y;", {"Name": ["a;b"], "Note": ["x=y"]}, id="Quoted"),
+    ],
+)
+def test_parse_gff3_attributes(attributes: str, expected: Dict[str, List[str]]) -> None:
+    """Tests the `parse_gff3_attributes()` function."""
+    assert parse_gff3_attributes(attributes) == expected
+
+
+@pytest.mark.parametrize(
+    "attributes, expected",
+    [
+        pytest.param("Name=a", ("", []), id="No ID"),
+        pytest.param("ID=a%2C1;Parent=b,c", ("a,1", ["b", "c"]), id="ID and parents"),
+    ],
+)
+def test_get_gff3_id_and_parents(attributes: str, expected: Tuple[str, List[str]]) -> None:
+    """Tests the `get_gff3_id_and_parents()` function."""
+    assert get_gff3_id_and_parents(attributes) == expected
+
+
+@pytest.mark.parametrize("compressed", [False, True])
+def test_parse_gff3_features(tmp_path: Path, compressed: bool) -> None:
+    """Tests that `parse_gff3_features()` builds the same hierarchy as the BCBio GFF parser."""
+    content = "\n".join(_GFF3_LINES) + "\n"
+    gff3_path = tmp_path / "test.gff3.gz" if compressed else tmp_path / "test.gff3"
+    with gzip.open(gff3_path, "wt") if compressed else gff3_path.open("w") as gff3_fh:
+        gff3_fh.write(content)
+
+    expected = [
+        (record.id, [_dump(feat) for feat in record.features]) for record in GFF.parse(StringIO(content))
+    ]
+    result = [
+        (seq_id, [_dump(to_seq_feature(feat)) for feat in features])
+        for seq_id, features in parse_gff3_features(gff3_path)
+    ]
+    assert result == expected
+
+
+def test_parse_gff3_features_ids() -> None:
+    """Tests the IDs of duplicated, self-referencing and inferred features."""
+    top_features = dict(parse_gff3_features(_GFF3_LINES))
+    assert [feat.id for feat in top_features["chr1"]] == ["", "gene1", "gene1_2", "", "missing1", ""]
+    gene1, gene1_2 = top_features["chr1"][1:3]
+    # The exon is its own parent, so it loses its ID and is also added as a top-level feature
+    assert gene1.sub_features[0].sub_features[0].id == ""
+    assert top_features["chr1"][3] is gene1.sub_features[0].sub_features[0]
+    assert gene1_2.sub_features[0].parent_ids == ("gene1_2",)
+    assert top_features["chr1"][4].type == "inferred_parent"
+    assert [feat.start for feat in top_features["chr1"][4].sub_features] == [2000, 2600]
+
+
+@pytest.mark.parametrize(
+    "lines, expectation",
+    [
+        pytest.param(["chr1\ttest\tgene\t1\t10\t.\t+\t.\tID=a"], does_not_raise(), id="Valid line"),
+        pytest.param(["chr1\ttest\tgene\t1\t10"], pytest.raises(GFFFeatureError), id="Missing columns"),
+        pytest.param(
+            [
+                "chr1\ttest\tgene\t1\t10\t.\t+\t.\tID=a",
+                "chr1\ttest\tgene\t20\t30\t.\t+\t.\tID=a",
+                "chr1\ttest\tmRNA\t5\t25\t.\t+\t.\tParent=a",
+            ],
+            pytest.raises(GFFFeatureError),
+            id="Child outside of duplicated parents",
+        ),
+    ],
+)
+def test_parse_gff3_features_errors(lines: List[str], expectation: ContextManager) -> None:
+    """Tests the errors raised by `parse_gff3_features()`."""
+    with expectation:
+        list(parse_gff3_features(lines))
+
+
+def test_from_seq_feature() -> None:
+    """Tests that `from_seq_feature()` is the reverse of `to_seq_feature()`."""
+    feature = GFFFeature.from_line("chr1\ttest\tgene\t11\t100\t.\t-\t.\tID=gene1;Name=a%3Bb")
+    feature.add_sub_feature(GFFFeature.from_line("chr1\ttest\tmRNA\t11\t100\t3\t-\t.\tID=tr1;Parent=gene1"))
+    seq_feature = to_seq_feature(feature)
+    compact_feature = from_seq_feature(seq_feature, "chr1")
+    assert compact_feature.qualifiers == feature.qualifiers
+    assert _dump(to_seq_feature(compact_feature)) == _dump(seq_feature)
@@ -15,7 +15,9 @@
 """Unit testing of `ensembl.io.genomio.gff3.gene_merger` module."""
 
 import filecmp
+import gzip
 from pathlib import Path
+from typing import List
 
 import pytest
 
@@ -44,3 +46,34 @@ def test_merge(data_dir: Path, tmp_path: Path, input_file: str, expected_file: s
     expected_path = data_dir / expected_file
     merger.merge(gff_input_path, test_output_path)
     assert filecmp.cmp(test_output_path, expected_path)
+
+
+def test_merge_lines(data_dir: Path) -> None:
+    """Tests that `GFFGeneMerger.merge_lines()` yields the same lines as the file written by `merge()`.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+
+    """
+    merger = GFFGeneMerger()
+    merged: List[str] = []
+    with (data_dir / "input1.gff3").open("r") as in_gff_fh:
+        lines = list(merger.merge_lines(in_gff_fh, merged))
+    assert "".join(lines) == (data_dir / "output1.gff3").read_text()
+    assert len(merged) == 1
+
+
+def test_merge_gzip(data_dir: Path, tmp_path: Path) -> None:
+    """Tests the `GFFGeneMerger.merge()` method with a GFF3 file compressed with gzip.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    gff_gz_path = tmp_path / "input1.gff3.gz"
+    with gzip.open(gff_gz_path, "wt") as gff_gz_fh:
+        gff_gz_fh.write((data_dir / "input1.gff3").read_text())
+    merged = GFFGeneMerger().merge(gff_gz_path, tmp_path / "output.gff3")
+    assert filecmp.cmp(tmp_path / "output.gff3", data_dir / "output1.gff3")
+    assert len(merged) == 1
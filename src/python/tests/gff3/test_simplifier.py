@@ -0,0 +1,92 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.gff3.simplifier` module.
+
+Typical usage example::
+    $ pytest test_simplifier.py
+
+"""
+
+import filecmp
+from io import TextIOBase
+from pathlib import Path
+from typing import Iterator
+
+from BCBio import GFF
+import pytest
+
+from ensembl.io.genomio.gff3.gene_merger import GFFGeneMerger
+from ensembl.io.genomio.gff3.simplifier import GFFSimplifier
+
+
+@pytest.mark.parametrize(
+    "in_gff, expected_gff, expected_json",
+    [
+        pytest.param("split.gff3", "split_output.gff3", "split_output.json", id="Non-contiguous seq_region"),
+        pytest.param(
+            "unsorted.gff3", "unsorted_output.gff3", "unsorted_output.json", id="Unsorted seq_regions"
+        ),
+    ],
+)
+def test_simpler_gff3(
+    data_dir: Path, shared_data_dir: Path, tmp_path: Path, in_gff: str, expected_gff: str, expected_json: str
+) -> None:
+    """Tests the files written by default by `gff3_process`, with `GFFSimplifier.simpler_gff3()`.
+
+    The expected files were written by `gff3_process` before the GFF3 lines could be streamed.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        shared_data_dir: Folder with test files shared between test modules.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        in_gff: Name of the GFF3 file with example input, in the shared GFF3 test folder.
+        expected_gff: Name of the expected output GFF3 file, in the test folder.
+        expected_json: Name of the expected output functional annotation file, in the test folder.
+
+    """
+    gff3_dir = shared_data_dir / "gff3"
+    simplifier = GFFSimplifier(gff3_dir / "genome.json", make_missing_stable_ids=True)
+    simplifier.fail_types = {}
+    with (gff3_dir / in_gff).open("r") as in_gff_fh:
+        simplifier.simpler_gff3(GFFGeneMerger().merge_lines(in_gff_fh))
+    simplifier.records.to_gff(tmp_path / "out.gff3")
+    simplifier.annotations.to_json(tmp_path / "out.json")
+    assert filecmp.cmp(tmp_path / "out.gff3", data_dir / expected_gff)
+    assert filecmp.cmp(tmp_path / "out.json", data_dir / expected_json)
+
+
+def test_simpler_gff3_lines_not_joined(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that `simpler_gff3()` only pulls the input lines when the GFF3 parser reads them.
+
+    Args:
+        monkeypatch: Fixture to replace the GFF3 parser by one that only reads the first line.
+
+    """
+    first_line = "##gff-version 3\n"
+
+    def _lines() -> Iterator[str]:
+        yield first_line
+        raise AssertionError("Line pulled before the GFF3 parser read it")
+
+    def _parse(gff_fh: TextIOBase) -> Iterator:
+        assert isinstance(gff_fh, TextIOBase)
+        assert gff_fh.readline() == first_line
+        return iter([])
+
+    monkeypatch.setattr(GFF, "parse", _parse)
+    simplifier = GFFSimplifier()
+    simplifier.fail_types = {}
+    simplifier.simpler_gff3(_lines())
+    assert not simplifier.records
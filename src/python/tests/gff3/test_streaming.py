@@ -0,0 +1,168 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.gff3.streaming` module.
+
+Typical usage example::
+    $ pytest test_streaming.py
+
+"""
+
+from contextlib import nullcontext as does_not_raise
+import gzip
+from pathlib import Path
+from typing import ContextManager, List
+
+import pytest
+
+from ensembl.io.genomio.gff3.gene_merger import GFFGeneMerger
+from ensembl.io.genomio.gff3.simplifier import GFFSimplifier
+from ensembl.io.genomio.gff3.streaming import GFFStreamingError, stream_simpler_gff3
+
+
+@pytest.fixture(name="gff3_dir")
+def fixture_gff3_dir(shared_data_dir: Path) -> Path:
+    """Returns the folder with the GFF3 test files shared with the simplifier tests.
+
+    Args:
+        shared_data_dir: Folder with test files shared between test modules.
+
+    """
+    return shared_data_dir / "gff3"
+
+
+def _get_simplifier(gff3_dir: Path) -> GFFSimplifier:
+    """Returns a simplifier that generates missing stable ids, without any unrecognized type recorded."""
+    simplifier = GFFSimplifier(gff3_dir / "genome.json", make_missing_stable_ids=True)
+    simplifier.fail_types = {}
+    return simplifier
+
+
+def _get_seq_regions(gff_path: Path) -> List[str]:
+    """Returns the seq_regions of a GFF3 file, in the order they first appear."""
+    with gff_path.open("r") as gff_fh:
+        seq_regions = [line.split("\t")[0] for line in gff_fh if not line.startswith("#")]
+    return list(dict.fromkeys(seq_regions))
+
+
+def test_stream_simpler_gff3(gff3_dir: Path, tmp_path: Path) -> None:
+    """Tests that `stream_simpler_gff3()` writes the same files as `simpler_gff3()`.
+
+    Args:
+        gff3_dir: Folder with the shared GFF3 test files.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    expected = _get_simplifier(gff3_dir)
+    expected.simpler_gff3(gff3_dir / "sorted.gff3")
+    expected.records.to_gff(tmp_path / "expected.gff3")
+    expected.annotations.to_json(tmp_path / "expected.json")
+    simplifier = _get_simplifier(gff3_dir)
+    stream_simpler_gff3(simplifier, gff3_dir / "sorted.gff3", tmp_path / "out.gff3")
+    simplifier.annotations.to_json(tmp_path / "out.json")
+    assert not simplifier.records
+    assert (tmp_path / "out.gff3").read_text() == (tmp_path / "expected.gff3").read_text()
+    assert (tmp_path / "out.json").read_text() == (tmp_path / "expected.json").read_text()
+
+
+@pytest.mark.parametrize(
+    "in_gff, expected_seq_regions, expected",
+    [
+        ("sorted.gff3", ["region_A", "region_B", "region_C"], does_not_raise()),
+        pytest.param(
+            "unsorted.gff3", ["region_C", "region_A", "region_B"], does_not_raise(), id="Input order kept"
+        ),
+        pytest.param("split.gff3", [], pytest.raises(GFFStreamingError), id="Non-contiguous seq_region"),
+    ],
+)
+def test_stream_simpler_gff3_order(
+    gff3_dir: Path, tmp_path: Path, in_gff: str, expected_seq_regions: List[str], expected: ContextManager
+) -> None:
+    """Tests the order of the seq_regions written by `stream_simpler_gff3()`.
+
+    Args:
+        gff3_dir: Folder with the shared GFF3 test files.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        in_gff: Name of the GFF3 file with example input, in the test folder.
+        expected_seq_regions: Expected seq_regions of the output, in order.
+        expected: Context manager for the expected exception, i.e. the test will only pass if that
+            exception is raised. Use `contextlib.nullcontext` if no exception is expected.
+
+    """
+    with expected:
+        simplifier = _get_simplifier(gff3_dir)
+        stream_simpler_gff3(simplifier, gff3_dir / in_gff, tmp_path / "out.gff3")
+        assert _get_seq_regions(tmp_path / "out.gff3") == expected_seq_regions
+
+
+@pytest.mark.parametrize("in_gff", ["sorted.gff3", "unsorted.gff3"])
+def test_stream_simpler_gff3_workers(gff3_dir: Path, tmp_path: Path, in_gff: str) -> None:
+    """Tests that `stream_simpler_gff3()` writes the same files with several workers.
+
+    Args:
+        gff3_dir: Folder with the shared GFF3 test files.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        in_gff: Name of the GFF3 file with example input, in the test folder.
+
+    """
+    expected = _get_simplifier(gff3_dir)
+    stream_simpler_gff3(expected, gff3_dir / in_gff, tmp_path / "expected.gff3")
+    expected.annotations.to_json(tmp_path / "expected.json")
+    simplifier = _get_simplifier(gff3_dir)
+    stream_simpler_gff3(simplifier, gff3_dir / in_gff, tmp_path / "out.gff3", workers=2)
+    simplifier.annotations.to_json(tmp_path / "out.json")
+    assert simplifier.current_stable_id_number == expected.current_stable_id_number
+    assert (tmp_path / "out.gff3").read_text() == (tmp_path / "expected.gff3").read_text()
+    assert (tmp_path / "out.json").read_text() == (tmp_path / "expected.json").read_text()
+
+
+def test_stream_simpler_gff3_lines(gff3_dir: Path, tmp_path: Path) -> None:
+    """Tests that `stream_simpler_gff3()` accepts the lines of a gzipped GFF3 file.
+
+    Args:
+        gff3_dir: Folder with the shared GFF3 test files.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    expected = _get_simplifier(gff3_dir)
+    stream_simpler_gff3(expected, gff3_dir / "sorted.gff3", tmp_path / "expected.gff3")
+    gff_gz_path = tmp_path / "sorted.gff3.gz"
+    with gzip.open(gff_gz_path, "wt") as gff_gz_fh:
+        gff_gz_fh.write((gff3_dir / "sorted.gff3").read_text())
+    simplifier = _get_simplifier(gff3_dir)
+    stream_simpler_gff3(simplifier, gff_gz_path, tmp_path / "out_gz.gff3")
+    assert (tmp_path / "out_gz.gff3").read_text() == (tmp_path / "expected.gff3").read_text()
+    simplifier = _get_simplifier(gff3_dir)
+    with (gff3_dir / "sorted.gff3").open("r") as in_gff_fh:
+        stream_simpler_gff3(simplifier, GFFGeneMerger().merge_lines(in_gff_fh), tmp_path / "out_lines.gff3")
+    assert (tmp_path / "out_lines.gff3").read_text() == (tmp_path / "expected.gff3").read_text()
+
+
+@pytest.mark.parametrize("compress_threads", [1, 2])
+def test_stream_simpler_gff3_gzip_output(gff3_dir: Path, tmp_path: Path, compress_threads: int) -> None:
+    """Tests that `stream_simpler_gff3()` compresses its output if it ends with `.gz`.
+
+    Args:
+        gff3_dir: Folder with the shared GFF3 test files.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        compress_threads: Number of threads used to compress the output.
+
+    """
+    expected = _get_simplifier(gff3_dir)
+    stream_simpler_gff3(expected, gff3_dir / "sorted.gff3", tmp_path / "expected.gff3")
+    simplifier = _get_simplifier(gff3_dir)
+    out_gz_path = tmp_path / "out.gff3.gz"
+    stream_simpler_gff3(simplifier, gff3_dir / "sorted.gff3", out_gz_path, compress_threads=compress_threads)
+    with gzip.open(out_gz_path, "rt") as out_gz_fh:
+        assert out_gz_fh.read() == (tmp_path / "expected.gff3").read_text()
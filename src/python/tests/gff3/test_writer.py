@@ -0,0 +1,92 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.gff3.writer` module."""
+
+import copy
+import gzip
+from io import StringIO
+from pathlib import Path
+from typing import List
+
+from BCBio import GFF
+from Bio.Seq import Seq
+from Bio.SeqFeature import SeqFeature, SimpleLocation
+from Bio.SeqRecord import SeqRecord
+import pytest
+
+from ensembl.io.genomio.gff3 import GFF3Writer, write_gff3
+
+
+def _get_records() -> List[SeqRecord]:
+    """Returns records with genes, with and without IDs, qualifiers to quote and record annotations."""
+    gene = SeqFeature(
+        SimpleLocation(0, 900, strand=1),
+        type="gene",
+        qualifiers={"ID": ["gene1"], "source": ["test"], "Name": ["a b;c=d é"]},
+    )
+    transcript = SeqFeature(SimpleLocation(0, 900, strand=-1), type="mRNA", qualifiers={"source": "test"})
+    transcript.sub_features = [
+        SeqFeature(SimpleLocation(0, 300, strand=-1), type="exon", qualifiers={"Parent": ["other"]}),
+        SeqFeature(SimpleLocation(0, 300, strand=-1), type="CDS", qualifiers={"codon_start": 2}),
+        SeqFeature(SimpleLocation(600, 900), type="CDS", qualifiers={"phase": [0], "score": ["1.0"]}),
+    ]
+    gene.sub_features = [transcript]
+    te = SeqFeature(SimpleLocation(1000, 1200), type="", qualifiers={"ID": "biopygen1"})
+    record1 = SeqRecord(Seq("ACGT" * 500), id="chr1", features=[gene, te])
+    record1.annotations = {"note": ["first record"]}
+    transcript2 = SeqFeature(SimpleLocation(10, 50), type="mRNA", qualifiers={"transcript_id": ["T2"]})
+    transcript2.sub_features = [SeqFeature(SimpleLocation(10, 50), type="exon")]
+    gene2 = SeqFeature(SimpleLocation(10, 50), type="gene")
+    gene2.sub_features = [transcript2]
+    record2 = SeqRecord(Seq(None, length=100), id="chr2", features=[gene2])
+    return [record1, record2]
+
+
+@pytest.mark.parametrize("include_fasta", [False, True])
+def test_write_gff3(tmp_path: Path, include_fasta: bool) -> None:
+    """Tests that `write_gff3()` writes the same file as `BCBio.GFF.write()`.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        include_fasta: Add the sequences after the features.
+
+    """
+    records = _get_records()
+    if include_fasta:
+        records = records[:1]
+    expected = StringIO()
+    # BCBio modifies the qualifiers of the features it writes
+    GFF.write(copy.deepcopy(records), expected, include_fasta=include_fasta)
+    write_gff3(records, tmp_path / "out.gff3", include_fasta=include_fasta)
+    assert (tmp_path / "out.gff3").read_text() == expected.getvalue()
+    # The records are left unchanged
+    write_gff3(records, tmp_path / "out2.gff3", include_fasta=include_fasta)
+    assert (tmp_path / "out2.gff3").read_text() == expected.getvalue()
+
+
+def test_gff3_writer_gzip(tmp_path: Path) -> None:
+    """Tests that `GFF3Writer` compresses its output when the path ends with `.gz`.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    records = _get_records()
+    write_gff3(records, tmp_path / "out.gff3")
+    with GFF3Writer(tmp_path / "out.gff3.gz") as writer:
+        for record in records:
+            writer.write_record(record)
+    with gzip.open(tmp_path / "out.gff3.gz", "rt") as gff_fh:
+        assert gff_fh.read() == (tmp_path / "out.gff3").read_text()
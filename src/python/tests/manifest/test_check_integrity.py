@@ -24,11 +24,13 @@ Typical usage example::
 
 from contextlib import nullcontext as does_not_raise
 from pathlib import Path
-from typing import ContextManager
+from typing import ContextManager, Dict
 
 import pytest
+from pytest_mock import MockerFixture
 
-from ensembl.io.genomio.manifest.check_integrity import IntegrityTool, Manifest
+from ensembl.io.genomio.manifest.check_integrity import IntegrityTool, InvalidIntegrityError, Manifest
+from ensembl.io.genomio.utils import get_json
 
 
 @pytest.mark.parametrize(
@@ -61,6 +63,7 @@ def test_check_integrity(
     "manifest_file, expected",
     [
         ("manifest.json", does_not_raise()),
+        pytest.param("manifest_bad_md5.json", pytest.raises(InvalidIntegrityError), id="Wrong md5sum"),
     ],
 )
 def test_manifest(data_dir: Path, manifest_file: str, expected: ContextManager) -> None:
@@ -76,3 +79,201 @@ def test_manifest(data_dir: Path, manifest_file: str, expected: ContextManager)
     with expected:
         integrity = IntegrityTool(data_dir / manifest_file)
         assert isinstance(integrity.manifest, Manifest)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_prepare_integrity_data(data_dir: Path, workers: int) -> None:
+    """Tests that `Manifest.prepare_integrity_data()` loads the same data sequentially and in parallel.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        workers: Number of processes to load the manifest files.
+
+    """
+    expected = Manifest(data_dir / "manifest.json")
+    expected.prepare_integrity_data()
+    manifest = Manifest(data_dir / "manifest.json")
+    manifest.prepare_integrity_data(workers=workers)
+    assert manifest.has_lengths("seq_regions")
+    assert manifest.has_lengths("ann_genes")
+    assert manifest.lengths == expected.lengths
+    assert manifest.circular == expected.circular
+    assert manifest.seq_regions == expected.seq_regions
+    assert manifest.errors == expected.errors
+
+
+@pytest.mark.parametrize(
+    "brc_mode, genes, translations, all_translations",
+    [
+        pytest.param(
+            False,
+            {"pseudoA": 300, "ncC": 2201, "geneD": 300, "geneB": 801},
+            {"pepD1": 99, "pepD2": 66, "pepB1": 199},
+            {"pseudoA_p1": 99, "pepD1": 99, "pepD2": 66, "pepB1": 199},
+            id="Default mode",
+        ),
+        pytest.param(
+            True,
+            {"pseudoA": 300, "gene:ncC": 2201, "geneD": 300, "gene:geneB": 801},
+            {"pepD1": 99, "pepD2": 66, "CDS:pepB1": 199},
+            {"pseudoA_p1": 99, "pepD1": 99, "pepD2": 66, "CDS:pepB1": 199},
+            id="BRC mode",
+        ),
+    ],
+)
+def test_get_gff3(
+    data_dir: Path,
+    brc_mode: bool,
+    genes: Dict[str, int],
+    translations: Dict[str, int],
+    all_translations: Dict[str, int],
+) -> None:
+    """Tests the `Manifest.get_gff3()` method.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        brc_mode: BRC specific mode.
+        genes: Expected gene lengths.
+        translations: Expected translation lengths.
+        all_translations: Expected translation lengths, including those of pseudogenes.
+
+    """
+    manifest = Manifest(data_dir / "manifest.json")
+    manifest.brc_mode = brc_mode
+    manifest.get_gff3(data_dir / "genes.gff3")
+    assert manifest.lengths["gff3_seq_regions"] == {"chr1": 3299, "chr2": 1499}
+    assert manifest.lengths["gff3_genes"] == genes
+    assert manifest.lengths["gff3_translations"] == translations
+    assert manifest.lengths["gff3_all_translations"] == all_translations
+    assert manifest.lengths["gff3_transposable_elements"] == {"te1": 500}
+
+
+def test_get_gff3_orphans(data_dir: Path) -> None:
+    """Tests that `Manifest.get_gff3()` counts the seq_regions that only have features with a missing parent.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+
+    """
+    manifest = Manifest(data_dir / "manifest.json")
+    manifest.get_gff3(data_dir / "orphans.gff3")
+    assert manifest.lengths["gff3_seq_regions"] == {"chr1": 100, "chr2": 300, "chr3": 90, "chr4": 510}
+    assert manifest.lengths["gff3_genes"] == {"geneA": 100}
+    assert manifest.lengths["gff3_transposable_elements"] == {"te1": 500}
+
+
+def test_get_gff3_hierarchy(data_dir: Path) -> None:
+    """Tests `Manifest.get_gff3()` with duplicated IDs, children before their parents, and sequences.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+
+    """
+    manifest = Manifest(data_dir / "manifest.json")
+    manifest.get_gff3(data_dir / "hierarchy.gff3")
+    assert manifest.lengths["gff3_seq_regions"] == {
+        "chr1": 500,
+        "chr2": 400,
+        "chr3": 700,
+        "chr4": 60,
+        "chr9": 6,
+    }
+    assert manifest.lengths["gff3_genes"] == {
+        "": 11,
+        "g0": 100,
+        "g0_2": 100,
+        "ps1": 201,
+        "nc1": 201,
+        "og": 601,
+    }
+    assert manifest.lengths["gff3_translations"] == {"p0": 14, "": 4, "p1": 19, "mp": 9}
+    assert manifest.lengths["gff3_all_translations"] == {"p0": 14, "": 4, "p1": 19, "pp1": 32, "mp": 9}
+    assert manifest.lengths["gff3_transposable_elements"] == {"te": 10, "te_2": 26}
+
+
+def test_prepare_integrity_data_cache(data_dir: Path, tmp_path: Path, mocker: MockerFixture) -> None:
+    """Tests that `Manifest.prepare_integrity_data()` reuses the data cached for unchanged files.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        mocker: Fixture to check that the files are not loaded again.
+
+    """
+    expected = Manifest(data_dir / "manifest.json", cache_dir=tmp_path)
+    expected.prepare_integrity_data()
+    assert len(list(tmp_path.glob("*.json"))) == len(expected.manifest_files)
+    manifest = Manifest(data_dir / "manifest.json", cache_dir=tmp_path)
+    load_component = mocker.patch.object(Manifest, "load_component")
+    manifest.prepare_integrity_data()
+    load_component.assert_not_called()
+    assert manifest.lengths == expected.lengths
+    assert manifest.circular == expected.circular
+    assert manifest.seq_regions == expected.seq_regions
+    # A different mode does not use the same cached data
+    manifest = Manifest(data_dir / "manifest.json", cache_dir=tmp_path)
+    manifest.brc_mode = True
+    manifest.prepare_integrity_data()
+    assert load_component.call_count == len(manifest.manifest_files)
+
+
+def test_check_ids_large(data_dir: Path) -> None:
+    """Tests that `IntegrityTool.check_ids()` compares 10^5 ids in linear time, keeping the first examples.
+
+    The scaling up to 10^6 ids is measured by `benchmarks.manifest.bench_integrity_checks`.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+
+    """
+    integrity = IntegrityTool(data_dir / "manifest.json")
+    ids1 = {f"id{i}": i for i in range(100_000)}
+    ids2 = {f"id{i}": i for i in range(50_000, 150_000)}
+    assert integrity.check_ids(ids1, ids2, "large")
+    assert integrity.errors == [
+        "50000 only in first list in large (first: id0)",
+        "50000 only in second list in large (first: id100000)",
+    ]
+
+
+def test_compare_seqs_large(data_dir: Path) -> None:
+    """Tests that `IntegrityTool._compare_seqs()` compares 10^5 sequences in linear time.
+
+    The scaling up to 10^6 sequences is measured by `benchmarks.manifest.bench_integrity_checks`.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+
+    """
+    integrity = IntegrityTool(data_dir / "manifest.json")
+    seqrs = {f"seq{i}": 100 for i in range(100_000)}
+    feats = {f"seq{i}": 100 if i % 2 else 200 for i in range(50_000, 150_000)}
+    comp = integrity._compare_seqs(seqrs, feats)  # pylint: disable=protected-access
+    assert len(comp["common"]) == 25_000
+    assert len(comp["only_seqr"]) == 50_000
+    assert comp["only_seqr"][0] == "seq0"
+    assert comp["diff"][0] == "seq50000: 100 vs 200"
+    # Sequences with a length difference are also reported as only in the features
+    assert len(comp["only_feat"]) == 75_000
+    assert comp["only_feat"][0] == "seq50000"
+
+
+def test_write_report(data_dir: Path, tmp_path: Path) -> None:
+    """Tests the JSON report written by `IntegrityTool.check_integrity()`.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    report_file = tmp_path / "report.json"
+    integrity = IntegrityTool(data_dir / "manifest_gff3.json", report_file=report_file)
+    integrity.check_integrity()
+    report = get_json(report_file)
+    assert [stage["stage"] for stage in report["stages"]] == ["get_gff3"]
+    assert report["stages"][0]["records"] == 14
+    assert report["peak_rss_kb"]["process"] > 0
+    assert [check["name"] for check in report["checks"]] == ["Seq_regions metadata vs gff"]
+    assert report["checks"][0]["counts"]["only_feat"] == 2
+    assert report["checks"][0]["examples"]["only_feat"] == ["chr1", "chr2"]
+    assert report["errors"] == ["2 only in second list in Seq_regions metadata vs gff (first: chr1)"]
@@ -0,0 +1,96 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.manifest.compute_stats` module.
+
+Typical usage example::
+    $ pytest test_compute_stats.py
+
+"""
+
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+from ensembl.io.genomio.manifest.compute_stats import BiotypeCounter, FeatureIdTable, manifest_stats
+
+
+def test_biotype_counter() -> None:
+    """Tests that `BiotypeCounter` counts every id added but stores each one once."""
+    id_table = FeatureIdTable()
+    counter1 = BiotypeCounter(example="id1", id_table=id_table)
+    counter2 = BiotypeCounter(ids={"id3"}, id_table=id_table)
+    for feature_id in ["id1", "id2", "id1", "id1"]:
+        counter1.add_id(feature_id)
+    counter2.add_id("id2")
+    assert counter1.count == 4
+    assert counter1.unique_count() == 2
+    assert counter1.ids == {"id1", "id2"}
+    assert counter2.count == 1
+    assert counter2.unique_count() == 2
+    assert counter2.ids == {"id2", "id3"}
+    assert len(id_table) == 3
+
+
+@pytest.mark.parametrize(
+    "biotype, expected",
+    [
+        ("ALL_GENES", (3, 3)),
+        ("PROT_gene", (2, 2)),
+        ("NONPROT_ncRNA_gene", (1, 1)),
+        ("pseudogene", (1, 1)),
+        ("gene-mRNA", (3, 3)),
+        pytest.param("gene-mRNA-CDS", (4, 3), id="CDS segments counted once"),
+    ],
+)
+def test_count_biotypes(data_dir: Path, biotype: str, expected: Tuple[int, int]) -> None:
+    """Tests the `manifest_stats.count_biotypes()` method.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        biotype: Biotype to check.
+        expected: Expected total and unique counts of the biotype.
+
+    """
+    stats = manifest_stats(str(data_dir), None, None)
+    biotypes = stats.count_biotypes(data_dir / "genes.gff3")
+    assert (biotypes[biotype].count, biotypes[biotype].unique_count()) == expected
+
+
+def test_check_ncbi_stats(data_dir: Path, tmp_path: Path) -> None:
+    """Tests the `manifest_stats.check_ncbi_stats()` method with a cached datasets summary.
+
+    Args:
+        data_dir: Module's test data directory fixture.
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+
+    """
+    datasets_bin = str(data_dir.parent.parent / "assembly" / "test_datasets" / "datasets")
+    stats = manifest_stats(str(data_dir), "GCA_000000001.1", datasets_bin, datasets_cache_dir=tmp_path)
+    stats.check_ncbi = True
+    biotypes = stats.count_biotypes(data_dir / "genes.gff3")
+    assert stats.check_ncbi_stats(biotypes) == [
+        "Same count for ['total', 'ALL_GENES']: 3",
+        "Same count for ['protein_coding', 'PROT_gene']: 2",
+        "Same count for ['non_coding', 'NONPROT_gene']: 0",
+        "Same count for ['other', 'OTHER']: 0",
+    ]
+    assert stats.errors == ["DIFF gene count for ['pseudogene', 'pseudogene']: 1 - 0 = 1"]
+    # The cached summary is used even without the datasets executable
+    stats = manifest_stats(
+        str(data_dir), "GCA_000000001.1", str(tmp_path / "none"), datasets_cache_dir=tmp_path
+    )
+    stats.check_ncbi = True
+    assert len(stats.check_ncbi_stats(biotypes)) == 4
@@ -0,0 +1,71 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.utils.archive_utils` module.
+
+Typical usage example::
+    $ pytest test_archive_utils.py
+
+"""
+
+from pathlib import Path
+import shutil
+from typing import Optional
+
+import pytest
+
+from ensembl.io.genomio.utils import open_gz_file, open_gz_output
+
+
+@pytest.mark.parametrize(
+    "file_name, compress, threads, expected_gzip",
+    [
+        pytest.param("out.txt", None, 1, False, id="Plain text"),
+        pytest.param("out.txt.gz", None, 1, True, id="Gzip from the file name"),
+        pytest.param("out.txt", True, 1, True, id="Forced gzip"),
+        pytest.param("out.txt.gz", False, 1, False, id="Forced plain text"),
+        pytest.param("out.txt.gz", None, 2, True, id="Gzip with several threads"),
+        pytest.param(
+            "out_pigz.txt.gz",
+            None,
+            4,
+            True,
+            id="Gzip with pigz",
+            marks=pytest.mark.skipif(shutil.which("pigz") is None, reason="pigz is not installed"),
+        ),
+    ],
+)
+def test_open_gz_output(
+    tmp_path: Path, file_name: str, compress: Optional[bool], threads: int, expected_gzip: bool
+) -> None:
+    """Tests the `open_gz_output()` method.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        file_name: Name of the file to write.
+        compress: Compress the output with gzip, or rely on the file name if None.
+        threads: Number of threads used to compress the output.
+        expected_gzip: The file is expected to be compressed with gzip.
+
+    """
+    out_path = tmp_path / file_name
+    content = "line 1\nline 2 é\n" * 1000
+    with open_gz_output(out_path, compress=compress, threads=threads) as out_fh:
+        out_fh.write(content)
+    assert (out_path.read_bytes()[:2] == b"\x1f\x8b") == expected_gzip
+    if expected_gzip:
+        with open_gz_file(out_path.rename(tmp_path / "read.gz")) as in_fh:
+            assert in_fh.read() == content
+    else:
+        assert out_path.read_text() == content
@@ -0,0 +1,49 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.utils.checksum_utils` module.
+
+Typical usage example::
+    $ pytest test_checksum_utils.py
+
+"""
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from ensembl.io.genomio.utils import md5sum
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param(b"", id="Empty file"),
+        pytest.param(b">seq1\nACGTACGTAC\nGT\n", id="Several chunks"),
+    ],
+)
+def test_md5sum(tmp_path: Path, content: bytes, chunk_size: int) -> None:
+    """Tests that `md5sum()` gives the checksum of the whole file, whatever the chunk size.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        content: Content of the file.
+        chunk_size: Number of bytes read at once.
+
+    """
+    file_path = tmp_path / "file.txt"
+    file_path.write_bytes(content)
+    assert md5sum(file_path, chunk_size=chunk_size) == hashlib.md5(content).hexdigest()
@@ -0,0 +1,141 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.utils.http_utils` module.
+
+The requests are sent to a local HTTP server that stands in for the web services.
+
+Typical usage example::
+    $ pytest test_http_utils.py
+
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import os
+from pathlib import Path
+from threading import Thread
+from typing import Dict, Iterator, List
+
+import pytest
+
+from ensembl.io.genomio.utils import CachedHTTPClient, HTTPCacheMissError
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Returns a JSON body with the requested path, or a 404 error for paths under `/missing`."""
+
+    requested: List[str] = []
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """Answers a GET request, and records its path."""
+        self.requested.append(self.path)
+        status = 404 if self.path.startswith("/missing") else 200
+        body = f'{{"path": "{self.path}"}}'.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:  # pylint: disable=redefined-builtin
+        """Does not log the requests."""
+
+
+@pytest.fixture(name="server_url")
+def fixture_server_url() -> Iterator[str]:
+    """Yields the base URL of a local HTTP server, running in a thread for the duration of the test."""
+    _StandInHandler.requested = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "path, use_cache, expected_requests",
+    [
+        pytest.param("/taxon/1", True, 1, id="Cached"),
+        pytest.param("/taxon/1", False, 2, id="No cache"),
+        pytest.param("/missing/1", True, 2, id="Errors not cached"),
+    ],
+)
+def test_get(tmp_path: Path, server_url: str, path: str, use_cache: bool, expected_requests: int) -> None:
+    """Tests that `CachedHTTPClient.get()` only requests the server when the response is not cached.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        server_url: Base URL of the local HTTP server.
+        path: Path of the requested URL.
+        use_cache: Give the client a cache folder.
+        expected_requests: Number of requests expected to reach the server after two identical calls.
+
+    """
+    client = CachedHTTPClient(cache_dir=tmp_path if use_cache else None)
+    for _ in range(2):
+        assert client.get_json(f"{server_url}{path}") == {"path": path}
+    client.close()
+    assert len(_StandInHandler.requested) == expected_requests
+
+
+def test_get_expired(tmp_path: Path, server_url: str) -> None:
+    """Tests that a cached response older than the TTL is fetched again, and its cache renewed.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        server_url: Base URL of the local HTTP server.
+
+    """
+    url = f"{server_url}/taxon/2"
+    client = CachedHTTPClient(cache_dir=tmp_path, ttl_days=1)
+    client.get(url)
+    cache_path = client.get_cache_path(url)
+    assert cache_path is not None
+    two_days_ago = cache_path.stat().st_mtime - 2 * 24 * 3600
+    os.utime(cache_path, (two_days_ago, two_days_ago))
+    assert not client.is_cached(url)
+    client.get(url)
+    assert client.is_cached(url)
+    assert len(_StandInHandler.requested) == 2
+
+
+@pytest.mark.parametrize(
+    "cached, expected",
+    [
+        pytest.param({"/taxon/3": b'{"cached": true}'}, {"cached": True}, id="Cached"),
+        pytest.param({}, None, id="Not cached"),
+    ],
+)
+def test_get_offline(tmp_path: Path, server_url: str, cached: Dict[str, bytes], expected: Dict) -> None:
+    """Tests that an offline client only serves the cached responses, even expired, and never the server.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        server_url: Base URL of the local HTTP server.
+        cached: Cached response body of each path.
+        expected: Expected parsed response, or `None` if a `HTTPCacheMissError` is expected.
+
+    """
+    client = CachedHTTPClient(cache_dir=tmp_path, ttl_days=0, offline=True)
+    for path, content in cached.items():
+        cache_path = client.get_cache_path(f"{server_url}{path}")
+        assert cache_path is not None
+        cache_path.write_bytes(content)
+    if expected is None:
+        with pytest.raises(HTTPCacheMissError):
+            client.get_json(f"{server_url}/taxon/3")
+    else:
+        assert client.get_json(f"{server_url}/taxon/3") == expected
+    assert not _StandInHandler.requested
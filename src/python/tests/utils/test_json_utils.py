@@ -0,0 +1,95 @@
+# See the NOTICE file distributed with this work for additional information
+# regarding copyright ownership.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit testing of `ensembl.io.genomio.utils.json_utils` module.
+
+Typical usage example::
+    $ pytest test_json_utils.py
+
+"""
+
+from contextlib import nullcontext as does_not_raise
+import json
+from pathlib import Path
+from typing import Any, ContextManager
+
+import pytest
+
+from ensembl.io.genomio.utils import iter_json_array, print_json, print_json_array
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        pytest.param("[]", does_not_raise(), id="Empty array"),
+        pytest.param(" \n[ \n] \n", does_not_raise(), id="Empty array with whitespace"),
+        pytest.param("[12345, -1.5e3, true, null]", does_not_raise(), id="Scalars"),
+        pytest.param(
+            '[{"id": "gene1", "object_type": "gene", "synonyms": ["a", "b"]},\n'
+            ' {"id": "tr1", "object_type": "translation", "description": "x, \\"y\\" [z]"}]\n',
+            does_not_raise(),
+            id="Objects",
+        ),
+        pytest.param("[[1, [2]], [], {}]", does_not_raise(), id="Nested arrays"),
+        pytest.param('{"id": 1}', pytest.raises(json.JSONDecodeError), id="Not an array"),
+        pytest.param("", pytest.raises(json.JSONDecodeError), id="Empty file"),
+        pytest.param("[1, 2", pytest.raises(json.JSONDecodeError), id="Truncated array"),
+        pytest.param('[1 "a"]', pytest.raises(json.JSONDecodeError), id="Missing delimiter"),
+        pytest.param("[1] 2", pytest.raises(json.JSONDecodeError), id="Extra data"),
+    ],
+)
+def test_iter_json_array(tmp_path: Path, content: str, expected: ContextManager, chunk_size: int) -> None:
+    """Tests that `iter_json_array()` yields the same elements as `json.loads()`, whatever the chunk size.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        content: Content of the JSON file to read.
+        expected: Context manager for the expected exception, i.e. the test will only pass if that
+            exception is raised. Use `contextlib.nullcontext` if no exception is expected.
+        chunk_size: Number of characters to read at once.
+
+    """
+    json_path = tmp_path / "input.json"
+    json_path.write_text(content)
+    with expected:
+        assert list(iter_json_array(json_path, chunk_size=chunk_size)) == json.loads(content)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1000])
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param([], id="Empty array"),
+        pytest.param([1, "two", None], id="Scalars"),
+        pytest.param(
+            [{"id": "gene1", "synonyms": {"synonym": "a", "default": True}}, {"id": "gene2"}, []],
+            id="Nested objects",
+        ),
+    ],
+)
+@pytest.mark.parametrize("indent", [4, None, "\t"])
+def test_print_json_array(tmp_path: Path, chunk_size: int, data: list, indent: Any) -> None:
+    """Tests that `print_json_array()` writes the same file as `print_json()`.
+
+    Args:
+        tmp_path: Fixture which will provide a temporary directory unique to the test invocation.
+        chunk_size: Number of elements serialised at once.
+        data: Array to write.
+        indent: JSON indentation.
+
+    """
+    print_json(tmp_path / "expected.json", data, indent=indent)
+    print_json_array(tmp_path / "out.json", iter(data), chunk_size=chunk_size, indent=indent)
+    assert (tmp_path / "out.json").read_text() == (tmp_path / "expected.json").read_text()